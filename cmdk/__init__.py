@@ -1,25 +1,61 @@
-from .core import (
-    createDagNode, 
-    createDepNode, 
-    add, 
-    getCache, 
-    clearCache, 
-    removeFromCache, 
-    vector, 
-    matrix,
-    delete,
-    ls
-)
-
-__all__ = [
-    'createDagNode', 
-    'createDepNode', 
-    'add', 
-    'getCache', 
-    'clearCache', 
-    'removeFromCache', 
-    'vector', 
-    'matrix',
-    'delete',
-    'ls'
-]
+import importlib
+
+'''
+The public API is loaded on first access, import cmdk itself touches neither Maya nor the scene
+cmdk.vector and cmdk.matrix only load the math types, cmdk.vector and the arrays work outside Maya
+'''
+_LAZY = {
+    'createDagNode'     : 'cmdk.core', 
+    'createDepNode'     : 'cmdk.core', 
+    'add'               : 'cmdk.core', 
+    'getCache'          : 'cmdk.core', 
+    'clearCache'        : 'cmdk.core', 
+    'removeFromCache'   : 'cmdk.core', 
+    'enableCacheEvents' : 'cmdk.core',
+    'disableCacheEvents': 'cmdk.core',
+    'vector'            : 'cmdk.kMath', 
+    'matrix'            : 'cmdk.kMath',
+    'vectorArray'       : 'cmdk.kMath',
+    'matrixArray'       : 'cmdk.kMath',
+    'delete'            : 'cmdk.core',
+    'ls'                : 'cmdk.core',
+    'iterNodes'         : 'cmdk.core',
+    'getAttrs'          : 'cmdk.core',
+    'batch'             : 'cmdk.core',
+    'setAttrs'          : 'cmdk.core',
+    'connectAttrs'      : 'cmdk.core',
+    'disconnectAttrs'   : 'cmdk.core'
+}
+
+__all__ = [
+    'createDagNode', 
+    'createDepNode', 
+    'add', 
+    'getCache', 
+    'clearCache', 
+    'removeFromCache', 
+    'enableCacheEvents',
+    'disableCacheEvents',
+    'vector', 
+    'matrix',
+    'vectorArray',
+    'matrixArray',
+    'delete',
+    'ls',
+    'iterNodes',
+    'getAttrs',
+    'batch',
+    'setAttrs',
+    'connectAttrs',
+    'disconnectAttrs'
+]
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError("module 'cmdk' has no attribute '{}'".format(name))
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,74 @@
+from functools import lru_cache
+import maya.api.OpenMaya as om2
+
+
+@lru_cache(maxsize=4096)
+def compilePath(attrPath: str) -> tuple:
+    '''
+    Parse an attribute path once into (name, index) steps
+    'input3D[0].input3Dx' -> (('input3D', 0), ('input3Dx', None))
+    Logical indices are integers from 0, anything else in brackets is an AttributeError
+    '''
+    steps = []
+    for part in attrPath.split('.'):
+        name, bracket, rest = part.partition('[')
+        index = None
+        if bracket:
+            index = rest.split(']')[0]
+            if not index.isdigit():
+                raise AttributeError('Invalid index [{}] in {}, logical indices are integers from 0'.format(index, attrPath))
+            index = int(index)
+        steps.append((name, index))
+    return tuple(steps)
+
+def leafName(attrPath: str) -> str:
+    '''
+    Attribute name of the last step without its index, what attributeQuery expects
+    '''
+    return compilePath(attrPath)[-1][0]
+
+def isSimple(attrPath: str) -> bool:
+    steps = compilePath(attrPath)
+    return len(steps) == 1 and steps[0][1] is None
+
+def childPlug(plug: om2.MPlug, name: str) -> om2.MPlug | None:
+    '''
+    Child of a compound plug by long or short name
+    '''
+    if not plug.isCompound:
+        return None
+    for index in range(plug.numChildren()):
+        child = plug.child(index)
+        attr  = om2.MFnAttribute(child.attribute())
+        if name in (attr.name, attr.shortName):
+            return child
+    return None
+
+def walkPlug(node: om2.MObject, attrPath: str) -> om2.MPlug | None:
+    '''
+    Follow the compiled steps from the node down to the plug, None if a step does not exist
+    '''
+    steps = compilePath(attrPath)
+    if attrPath.count('[') != sum(index is not None for _, index in steps):
+        return None  # nested indices, not handled here
+
+    plug = None
+    for name, index in steps:
+        if plug is None:
+            try:
+                plug = om2.MFnDependencyNode(node).findPlug(name, False)
+            except RuntimeError:
+                return None
+        else:
+            plug = childPlug(plug, name)
+            if plug is None:
+                return None
+
+        if index is not None:
+            if not plug.isArray:
+                return None
+            try:
+                plug = plug.elementByLogicalIndex(index)
+            except (RuntimeError, OverflowError, ValueError):
+                return None
+    return plug
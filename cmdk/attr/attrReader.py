@@ -0,0 +1,75 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import maya.api.OpenMaya as om2
+import cmdk.dg.omUtils as omUtils
+import cmdk.attr.plugValues as plugValues
+from cmdk.attr.get import GetAttribute
+
+
+def resolvePlugs(node, names: list) -> list[om2.MPlug]:
+    '''
+    Every plug of names on node, from the node's plug cache where possible
+    Raises one AttributeError listing all the missing attributes
+    '''
+    if not node._isValid:
+        raise AttributeError('The node no longer exists: {}'.format(node))
+    plugs, missing = [], []
+    cache, mobj, nodePath = node._plugCache, node._handle.object(), node.fullPath
+    for name in names:
+        plug = cache.get(name)
+        if plug is None:
+            plug = omUtils.findPlug(mobj, nodePath, name)
+            if plug is None:
+                missing.append(name)
+                continue
+            cache.put(name, plug)
+        plugs.append(plug)
+    if missing:
+        raise AttributeError('The node {} does not have these attributes: {}'.format(node.name, ', '.join(missing)))
+    return plugs
+
+def readValues(node, names: list) -> dict:
+    '''
+    {name: value} of one node, numbers are read from the plugs directly,
+    everything else goes through GetAttribute with the plug already resolved
+    '''
+    values, nodePath = {}, node.fullPath
+    for name, plug in zip(names, resolvePlugs(node, names)):
+        kind = plugValues.numericKind(plug)
+        values[name] = (plugValues.getNumeric(plug, kind) if kind is not None else
+                        GetAttribute(nodePath, name, plug, node).run())
+    return values
+
+def readArray(nodes: list, names: list) -> 'np.ndarray':
+    '''
+    (len(nodes), len(names)) float64 array, every attribute must be a numeric scalar
+    The numeric kind of a static attribute is looked up once per node type
+    '''
+    if np is None:
+        raise ImportError('numpy is required to read attributes as an array')
+    values = np.empty((len(nodes), len(names)), dtype=np.float64)
+    kinds  = {}
+    for row, node in enumerate(nodes):
+        nodeType = node.type
+        for column, (name, plug) in enumerate(zip(names, resolvePlugs(node, names))):
+            key  = (nodeType, name)
+            kind = kinds.get(key) if not plug.isDynamic else None
+            if kind is None:
+                kind = plugValues.numericKind(plug)
+                if kind is None:
+                    raise TypeError('{}.{} is not a numeric scalar attribute'.format(node.name, name))
+                if not plug.isDynamic:
+                    kinds[key] = kind
+            values[row, column] = plugValues.getNumeric(plug, kind)
+    return values
+
+def getAttrs(nodes: list, names: list, asArray: bool = False) -> dict | 'np.ndarray':
+    '''
+    {node full path: {name: value}}, or the (nodes, names) float array with asArray=True
+    '''
+    if asArray:
+        return readArray(nodes, names)
+    return {node.fullPath: readValues(node, names) for node in nodes}
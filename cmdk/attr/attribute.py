@@ -1,189 +1,302 @@
-import maya.cmds as cmds
-import maya.api.OpenMaya as om2
-import cmdk.dg.omUtils as omUtils
-from cmdk.attr.get import GetAttribute
-
-        
-class Attribute(object):
-    
-    def __new__(cls, *args, **kwargs) -> 'self':
-        node, attr = args
-        attrName = '{}.{}'.format(node.fullPath, attr)
-        if not cmds.objExists(attrName):
-            raise AttributeError('The node {} does not have this attribute: {}'.format(node.name, attr))
-            
-        return super().__new__(cls) 
-        
-    def __init__(self, node, attr):
-        self._node = node
-        self._attr = attr
-
-    def __getattr__(self, attr):
-        return self.__dict__.get(attr, Attribute(self._node, '{0}.{1}'.format(self._attr, attr)))
-        
-    def __getitem__(self, index):
-        return Attribute(self._node, '{0}[{1}]'.format(self._attr, index))
-        
-    def __setitem__(self, index, value):
-        self.__getitem__(index).set(value)
-            
-    def __repr__(self):
-        return '<{}.{}>'.format('Attribute', self.fullPath)
-    
-    def __str__(self):
-        return self.fullPath
-        
-    def __lshift__(self, other):
-        other.connect(self)
-        
-    def __rshift__(self, other):
-        self.connect(other)
-    # ---------------------------------------------------------------------
-    @property
-    def nodeName(self):
-        return self._node.name
-        
-    @property
-    def nodeFullPathName(self):
-        return self._node.fullPath
-        
-    @property
-    def type(self) -> str:
-        return cmds.getAttr(self.fullPath, typ=True)
-    @property
-    def path(self) -> str:
-        return self.fullPath.split("|")[-1]
-    @property    
-    def fullPath(self) -> str:
-        return '{}.{}'.format(self.nodeFullPathName, self._attr)
-    @property
-    def name(self) -> str:
-        return '{}.{}'.format(self.nodeName, self._attr)
-    
-    def get(self, *args, **kwargs):
-        return GetAttribute(self.nodeFullPathName, self._attr).run(*args, **kwargs)
-  
-               
-    def set(self, *args, **kwargs):
-        attrLockState = self.isLocked
-        if attrLockState: self.lock(False)
-        # -----------------------------------------------------
-        try:
-            cmds.setAttr(self.fullPath, *args, **kwargs)
-        except:
-            om2.MGlobal.displayWarning('Parameter Error')
-            
-        finally:
-            # -----------------------------------------------------
-            self.lock(attrLockState)
-            return self
-        
-        
-    # -----------------------------------------------------------------
-
-    def connect(self, other):
-        if not isinstance(other, self.__class__):
-            return 
-            
-        if cmds.isConnected(self.fullPath, other.fullPath): # already connected
-            return self
-            
-        try:
-            cmds.connectAttr(self.fullPath, other.fullPath, f=True)
-            return self
-        except:
-            om2.MGlobal.displayWarning('Attributes cannot be connected. ' +
-            'Please check the attribute types and connection order: \noutput: {}\ninput:  {}'.format(
-                                           self.type, other.type))
-                
-    def disconnect(self, inputConnect=True):
-        
-        connections = cmds.listConnections(self.fullPath, s=True, p=True) or []
-        if not connections:
-            return 
-        
-        for attr in connections:
-            src, dst = (self.fullPath, attr) if inputConnect else (attr, self.fullPath)
-            if cmds.isConnected(src, dst):
-                cmds.disconnectAttr(src, dst)
-        #return self
-   
-    # -----------------------------------------------------------------   
-    @property
-    def parent(self):
-        return [self._node[subAttr] for subAttr in self.query(listParent=True) or []]
-    @property    
-    def children(self):
-        return [self._node[subAttr] for subAttr in self.query(listChildren=True) or []]
-        
-    @property
-    def isParent(self) -> bool:
-        return bool(self.parent)
-        
-    @property
-    def isChildren(self) -> bool:
-        return bool(self.children)
-          
-    # -----------------------------------------------------------------   
-    @property
-    def has(self) -> bool:
-        return cmds.objExists(self.fullPath)
-        
-    def query(self, **kwargs):
-        '''
-        attributeQuery cannot query attributes with indices, 
-        '''
-        _attrName = self._attr.split('.')[-1].split('[')[0]
-        return cmds.attributeQuery(_attrName, node=self.nodeFullPathName, **kwargs)
-        
-    def delete(self):
-        self.lock(False)
-        try:
-            cmds.deleteAttr(self.fullPath)
-        except:
-            return om2.MGlobal.displayWarning('Unable to delete default attribute')
-            
-    def lock(self, state=True) -> 'self':
-        cmds.setAttr(self.fullPath, lock=state)
-        return self
-        
-    @property
-    def isLocked(self) -> bool:
-        return cmds.getAttr(self.fullPath, lock=True)
-        
-    def rename(self, newName: str) -> 'self':
-        attrLockState = self.isLocked
-        self.lock(False) if attrLockState else None
-        
-        try:
-            cmds.renameAttr(self.fullPath, newName)
-            return Attribute(self._node, newName).lock(attrLockState)
-        except:
-            om2.MGlobal.displayWarning('Cannot modify the default attribute names of the object')
-            self.lock(attrLockState)
-            return self    
-            
-    def connections(self, **kwargs):
-        nodes = cmds.listConnections(self.fullPath, scn=True, **kwargs) or []
-        if not nodes:
-            return 
-        
-        # -------------------------------------------------------------------
-        from cmdk.dg.depNode import DepNode
-        from cmdk.dag.dagNode import DagNode
-        
-        if any(key in kwargs and kwargs[key] for key in ['plugs', 'p']):
-            # return [Attribute(nodeName=DepNode(node.split('.')[0]), '.'.join(node.split('.')[1:])) for node in nodes]
-            return [DepNode(nodeName=node.split('.')[0])['.'.join(node.split('.')[1:])] for node in nodes]
-        else:
-            return [DagNode(nodeName=node) if omUtils.isDagNode(node) else DepNode(nodeName=node) for node in nodes]
-            
-    
-    # ------------------------------------------------------------------------
-    def __call__(self, *args, **kwargs):
-        return self.get(*args, **kwargs)
-    
-    def __invert__(self):
-        self.disconnect(True)
-        self.disconnect(False)
-            
+import maya.cmds as cmds
+import maya.api.OpenMaya as om2
+import cmdk.dg.omUtils as omUtils
+import cmdk.attr.attrPath as attrPath
+import cmdk.attr.plugValues as plugValues
+import cmdk.attr.transaction as transaction
+import cmdk.attr.multiArray as multiArray
+import cmdk.attr.schema as schema
+import cmdk.attr.codecs as codecs
+from cmdk.attr.get import GetAttribute
+from cmdk.errors import AttrSetError, AttrValueError
+
+        
+class Attribute(object):
+    '''
+    An attribute path on a node, backed by the MPlug it resolves to
+    Plugs are kept in the node's plug cache, so walking input3D[0].input3Dx again costs no scene lookup
+    '''
+    def __init__(self, node, attr: str, plug: om2.MPlug = None):
+        self._node = node
+        self._attr = attr
+        self._plug = self._resolve() if plug is None else plug
+        
+    def _resolve(self) -> om2.MPlug:
+        plugs = self._node._plugCache
+        plug  = plugs.get(self._attr)
+        if plug is None:
+            if self._node._isValid:
+                plug = omUtils.findPlug(self._node._handle.object(), self._node.fullPath, self._attr)
+            if plug is None:
+                raise AttributeError('The node {} does not have this attribute: {}'.format(self._node.name, self._attr))
+            plugs.put(self._attr, plug)
+        return plug
+        
+    def _navigate(self, path: str, findPlug) -> 'Attribute':
+        '''
+        Child or element reached from this plug, falls back to resolving the whole path
+        findPlug is only called on a cache miss
+        '''
+        plugs  = self._node._plugCache
+        cached = plugs.get(path)
+        if cached is not None:
+            return Attribute(self._node, path, cached)
+        plug = findPlug()
+        if plug is None:
+            return Attribute(self._node, path)
+        return Attribute(self._node, path, plugs.put(path, plug))
+
+    def __getattr__(self, attr):
+        if attr.startswith('_'):
+            raise AttributeError(attr)
+        return self._navigate('{0}.{1}'.format(self._attr, attr), 
+                              lambda: attrPath.childPlug(self._plug, attr))
+        
+    def __getitem__(self, index):
+        return self._navigate('{0}[{1}]'.format(self._attr, index), 
+                              lambda: self._plug.elementByLogicalIndex(index) 
+                                      if isinstance(index, int) and index >= 0 and self._plug.isArray else None)
+        
+    def __setitem__(self, index, value):
+        self.__getitem__(index).set(value)
+            
+    def __repr__(self):
+        return '<{}.{}>'.format('Attribute', self.fullPath)
+    
+    def __str__(self):
+        return self.fullPath
+        
+    def __lshift__(self, other):
+        other.connect(self)
+        
+    def __rshift__(self, other):
+        self.connect(other)
+    # ---------------------------------------------------------------------
+    @property
+    def nodeName(self):
+        return self._node.name
+        
+    @property
+    def nodeFullPathName(self):
+        return self._node.fullPath
+        
+    @property
+    def type(self) -> str:
+        return cmds.getAttr(self.fullPath, typ=True)
+    @property
+    def path(self) -> str:
+        return self.fullPath.split("|")[-1]
+    @property    
+    def fullPath(self) -> str:
+        return '{}.{}'.format(self.nodeFullPathName, self._attr)
+    @property
+    def name(self) -> str:
+        return '{}.{}'.format(self.nodeName, self._attr)
+    
+    def get(self, *args, **kwargs):
+        return GetAttribute(self.nodeFullPathName, self._attr, self._plug, self._node).run(*args, **kwargs)
+  
+               
+    def getTree(self):
+        '''
+        Compound or multi attribute as a nested mapping, numeric compounds and matrices as arrays
+        node.input3D.getTree() -> {0: array([1., 0., 0.]), 3: array([0., 2., 0.])}
+        '''
+        return GetAttribute(self.nodeFullPathName, self._attr, self._plug, self._node).compoundTree
+               
+    def getArray(self) -> tuple:
+        '''
+        (indices, values) numpy arrays of a multi attribute, only the existing logical indices
+        node.input1D.getArray() -> (array([0, 3, 7]), array([1., 2., 5.]))
+        '''
+        return multiArray.readMulti(self._plug)
+        
+    def setArray(self, indices, values, undoable: bool = True) -> 'self':
+        '''
+        Sparse write of a multi attribute in one pass, elements not in indices are left as they are
+        undoable=False applies everything through one MDGModifier, faster but not undoable
+        '''
+        multiArray.writeMulti(self._plug, self.fullPath, indices, values, undoable)
+        return self
+               
+    def set(self, *args, undoable: bool = True, **kwargs) -> 'self':
+        '''
+        Lock state is read from the plug and only toggled when the plug is locked
+        undoable=False writes numbers straight through the MPlug, faster for large pose loops
+        but it bypasses the undo queue, other values still go through cmds.setAttr
+        Inside cmdk.batch() the write is only queued, the batch decides how it is applied
+        '''
+        batch = transaction.current()
+        if batch is not None:
+            batch.set(self, *args, **kwargs)
+            return self
+            
+        plug   = self._plug
+        locked = plug.isLocked
+        codec  = self._codec(args)
+        if not undoable and args and not kwargs:
+            if locked: plug.isLocked = False
+            try:
+                if codec is not None:
+                    codec.write(plug, args[0]); written = True
+                else:
+                    written = plugValues.setNumeric(plug, args[0] if len(args) == 1 else args)
+            except (TypeError, ValueError) as e:
+                raise AttrValueError(self.fullPath, str(e)) from e
+            except RuntimeError as e:
+                raise AttrSetError(self.fullPath, str(e)) from e
+            finally:
+                if locked: plug.isLocked = True
+            if written:
+                return self
+                
+        fullPath = self.fullPath
+        try:
+            if codec is not None:
+                args, encoded = codec.encode(args[0])
+                kwargs = dict(kwargs, **encoded)
+            if not locked:
+                cmds.setAttr(fullPath, *args, **kwargs)
+            else:
+                with omUtils.undoChunk('cmdkSetAttr'):
+                    cmds.setAttr(fullPath, lock=False)
+                    try:
+                        cmds.setAttr(fullPath, *args, **kwargs)
+                    finally:
+                        cmds.setAttr(fullPath, lock=True)
+        except (TypeError, ValueError) as e:
+            raise AttrValueError(fullPath, str(e)) from e
+        except RuntimeError as e:
+            raise AttrSetError(fullPath, str(e)) from e
+        return self
+        
+    @property
+    def _schema(self) -> schema.AttrSchema:
+        return schema.getSchema(self._plug, self._node.type, self.nodeFullPathName, self._attr, self._node._schemas)
+        
+    def _codec(self, args: tuple) -> codecs.Codec | None:
+        '''
+        Codec writing a KVector, KMatrix or Maya math value, None for plain setAttr arguments
+        '''
+        if len(args) != 1 or not codecs.isValue(args[0]):
+            return None
+        codec = codecs.get(self._schema.codec)
+        if codec is None:
+            raise AttrValueError(self.fullPath, '{} values cannot be written to a {} attribute'.format(
+                                 type(args[0]).__name__, self._schema.typeName))
+        return codec
+        
+    # -----------------------------------------------------------------
+
+    def connect(self, other):
+        '''
+        Skipped when already connected, inside cmdk.batch() the connection is only queued
+        On its own it is undoable while the undo queue is on and goes through an MDGModifier while it is off
+        '''
+        if not isinstance(other, self.__class__):
+            return 
+        active = transaction.current()
+        batch  = active or transaction.AttrBatch(undoable=None)
+        batch.connect(self, other)
+        if active is None:
+            batch.apply()
+        return self
+                
+    def disconnect(self, inputConnect=True):
+        '''
+        inputConnect=True breaks the connections this plug drives, False the one driving it
+        '''
+        plug  = self._plug
+        pairs = ([(plug, dst) for dst in plug.connectedTo(False, True)] if inputConnect else
+                 [(src, plug) for src in plug.connectedTo(True, False)])
+        if not pairs:
+            return 
+        
+        active = transaction.current()
+        batch  = active or transaction.AttrBatch(undoable=None)
+        for src, dst in pairs:
+            batch.disconnect(src, dst)
+        if active is None:
+            batch.apply()
+        #return self
+   
+    # -----------------------------------------------------------------   
+    @property
+    def parent(self):
+        return [self._node[subAttr] for subAttr in self.query(listParent=True) or []]
+    @property    
+    def children(self):
+        return [self._node[subAttr] for subAttr in self.query(listChildren=True) or []]
+        
+    @property
+    def isParent(self) -> bool:
+        return bool(self.parent)
+        
+    @property
+    def isChildren(self) -> bool:
+        return bool(self.children)
+          
+    # -----------------------------------------------------------------   
+    @property
+    def has(self) -> bool:
+        return cmds.objExists(self.fullPath)
+        
+    def query(self, **kwargs):
+        '''
+        attributeQuery cannot query attributes with indices, 
+        '''
+        return cmds.attributeQuery(attrPath.leafName(self._attr), node=self.nodeFullPathName, **kwargs)
+        
+    def delete(self):
+        self._node._plugCache.discard(self._attr); self._node._schemas.clear()
+        self.lock(False)
+        try:
+            cmds.deleteAttr(self.fullPath)
+        except:
+            return om2.MGlobal.displayWarning('Unable to delete default attribute')
+            
+    def lock(self, state=True) -> 'self':
+        cmds.setAttr(self.fullPath, lock=state)
+        return self
+        
+    @property
+    def isLocked(self) -> bool:
+        return self._plug.isLocked
+        
+    def rename(self, newName: str) -> 'self':
+        attrLockState = self.isLocked
+        self.lock(False) if attrLockState else None
+        
+        try:
+            cmds.renameAttr(self.fullPath, newName)
+            self._node._plugCache.discard(self._attr); self._node._schemas.clear()
+            return Attribute(self._node, newName).lock(attrLockState)
+        except:
+            om2.MGlobal.displayWarning('Cannot modify the default attribute names of the object')
+            self.lock(attrLockState)
+            return self    
+            
+    def connections(self, **kwargs):
+        nodes = cmds.listConnections(self.fullPath, scn=True, **kwargs) or []
+        if not nodes:
+            return 
+        
+        # -------------------------------------------------------------------
+        from cmdk.dg.depNode import DepNode
+        from cmdk.dag.dagNode import DagNode
+        
+        if any(key in kwargs and kwargs[key] for key in ['plugs', 'p']):
+            # return [Attribute(nodeName=DepNode(node.split('.')[0]), '.'.join(node.split('.')[1:])) for node in nodes]
+            return [DepNode(nodeName=node.split('.')[0])['.'.join(node.split('.')[1:])] for node in nodes]
+        else:
+            return [DagNode(nodeName=node) if omUtils.isDagNode(node) else DepNode(nodeName=node) for node in nodes]
+            
+    
+    # ------------------------------------------------------------------------
+    def __call__(self, *args, **kwargs):
+        return self.get(*args, **kwargs)
+    
+    def __invert__(self):
+        self.disconnect(True)
+        self.disconnect(False)
+            
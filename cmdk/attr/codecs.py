@@ -0,0 +1,133 @@
+from abc import ABC, abstractmethod
+import maya.api.OpenMaya as om2
+import cmdk.attr.plugValues as plugValues
+from cmdk.attr.kVector import KVector
+from cmdk.attr.kMatrix import KMatrix
+
+
+class Codec(ABC):
+    '''
+    Reads a plug straight into a cmdk value and writes such a value back
+    read   : plug -> value
+    write  : the value through the plug, or queued on a modifier
+    encode : the value as cmds.setAttr (args, kwargs), used where the write has to be undoable
+    '''
+    name = ''
+
+    @abstractmethod
+    def read(self, plug: om2.MPlug):
+        ...
+
+    @abstractmethod
+    def write(self, plug: om2.MPlug, value, modifier: om2.MDGModifier = None):
+        ...
+
+    @abstractmethod
+    def encode(self, value) -> tuple[tuple, dict]:
+        ...
+
+
+class VectorCodec(Codec):
+    '''
+    double3 / float3 compounds, children are read one by one so angle and distance units match cmds
+    '''
+    name = 'vector'
+
+    def read(self, plug: om2.MPlug) -> KVector:
+        return KVector.fromMVector(om2.MVector(*(plugValues.getNumeric(plug.child(index)) for index in range(3))))
+
+    def write(self, plug: om2.MPlug, value, modifier: om2.MDGModifier = None):
+        for index, number in enumerate(_components(value, 3)):
+            child = plug.child(index)
+            plugValues.writeNumeric(child, plugValues.numericKind(child), number, modifier)
+
+    def encode(self, value) -> tuple[tuple, dict]:
+        return tuple(_components(value, 3)), {}
+
+
+class MatrixCodec(Codec):
+    '''
+    matrix data, read from MFnMatrixData without listing the 16 floats
+    '''
+    name = 'matrix'
+
+    def read(self, plug: om2.MPlug) -> KMatrix:
+        return KMatrix.adopt(plugValues.getMatrix(plug))
+
+    def write(self, plug: om2.MPlug, value, modifier: om2.MDGModifier = None):
+        plugValues.setMatrix(plug, _toMMatrix(value), modifier)
+
+    def encode(self, value) -> tuple[tuple, dict]:
+        return (list(_toMMatrix(value)),), {'type': 'matrix'}
+
+
+class QuaternionCodec(Codec):
+    '''
+    <name>X/Y/Z/W double compounds such as the quatNodes outputs, there is no cmdk quaternion type so MQuaternion is returned
+    Other double4 or four child compounds (vector4, RGBA) stay on the generic path
+    '''
+    name = 'quaternion'
+
+    def read(self, plug: om2.MPlug) -> om2.MQuaternion:
+        return om2.MQuaternion(*(plugValues.getNumeric(plug.child(index)) for index in range(4)))
+
+    def write(self, plug: om2.MPlug, value, modifier: om2.MDGModifier = None):
+        for index, number in enumerate(_components(value, 4)):
+            child = plug.child(index)
+            plugValues.writeNumeric(child, plugValues.numericKind(child), number, modifier)
+
+    def encode(self, value) -> tuple[tuple, dict]:
+        return tuple(_components(value, 4)), {}
+
+
+'''
+Codecs keyed by name, schemas store the name of the codec their data type maps to
+'''
+_CODECS = {}
+_TYPES  = {}
+
+def register(codec: Codec, types: tuple = ()):
+    '''
+    Add a codec, types are the getAttr data type names it reads
+    '''
+    _CODECS[codec.name] = codec
+    for typeName in types:
+        _TYPES[typeName] = codec.name
+
+def get(name: str | None) -> Codec | None:
+    return _CODECS.get(name)
+
+def codecName(typeName: str, children: tuple, attrName: str = '', childTypes: tuple = ()) -> str | None:
+    '''
+    Codec of an attribute from its data type
+    A compound is a quaternion only when its children are exactly <attrName>X/Y/Z/W and all of them doubles
+    '''
+    if typeName in _TYPES:
+        return _TYPES[typeName]
+    if typeName in ('TdataCompound', 'double4') and attrName and \
+       children == tuple(attrName + axis for axis in 'XYZW') and childTypes == ('double',) * 4:
+        return QuaternionCodec.name
+    return None
+
+def isValue(value) -> bool:
+    '''
+    Values cmds.setAttr cannot take as they are, they are written through a codec
+    '''
+    return isinstance(value, (KVector, KMatrix, om2.MVector, om2.MPoint, om2.MMatrix, om2.MQuaternion))
+
+register(VectorCodec(),     ('double3', 'float3'))
+register(MatrixCodec(),     ('matrix',))
+register(QuaternionCodec())
+
+# ---------------------------------------------------------------------------------------
+
+def _components(value, count: int) -> list:
+    components = [value.x, value.y, value.z, value.w] if isinstance(value, om2.MQuaternion) else list(value)
+    if len(components) < count:
+        raise ValueError('Expected {} components, got {}'.format(count, len(components)))
+    return components[:count]
+
+def _toMMatrix(value) -> om2.MMatrix:
+    if isinstance(value, KMatrix):
+        return value._omMatrix
+    return om2.MMatrix(value)
@@ -0,0 +1,112 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om2
+import cmdk.dg.omUtils as omUtils
+import cmdk.attr.plugValues as plugValues
+
+
+class CompoundReader(object):
+    '''
+    Walk a compound or multi plug once through the plug tree
+    Multis become {logical index: value}, compounds {child name: value}
+    numeric compounds such as input3D[0] and matrices are packed into float arrays, tuples without numpy
+    message and string leaves return the connected node like GetAttribute does
+
+    CompoundReader().read(plug)  ->  {0: array([1., 0., 0.]), 3: array([0., 2., 0.])}
+    '''
+    def __init__(self):
+        '''
+        Leaf kinds keyed by attribute name, the elements of a multi share their children's attributes
+        '''
+        self._kinds = {}
+
+    def read(self, plug: om2.MPlug):
+        if plug.isArray:
+            return {index: self.read(plug.elementByLogicalIndex(index))
+                    for index in sorted(plug.getExistingArrayAttributeIndices())}
+        if plug.isCompound:
+            children = [plug.child(index) for index in range(plug.numChildren())]
+            kinds    = [self._kind(child) for child in children]
+            if all(kind[0] == 'numeric' for kind in kinds):
+                return _pack([plugValues.getNumeric(child, kind[1]) for child, kind in zip(children, kinds)])
+            return {om2.MFnAttribute(child.attribute()).name: self._readLeaf(child, kind)
+                    for child, kind in zip(children, kinds)}
+        return self._readLeaf(plug, self._kind(plug))
+
+    def leaves(self, plug: om2.MPlug) -> list:
+        '''
+        Leaf values depth first, in the order of cmds.listAttr(multi=True) with the compounds left out
+        Numeric children come one by one and matrices as 16 floats, like cmds.getAttr returns them
+        '''
+        values = []
+        self._collect(plug, values)
+        return values
+
+    def _collect(self, plug: om2.MPlug, values: list):
+        if plug.isArray:
+            for index in sorted(plug.getExistingArrayAttributeIndices()):
+                self._collect(plug.elementByLogicalIndex(index), values)
+        elif plug.isCompound:
+            for index in range(plug.numChildren()):
+                self._collect(plug.child(index), values)
+        else:
+            kind = self._kind(plug)
+            values.append(list(plugValues.getMatrix(plug)) if kind[0] == 'matrix' else self._readLeaf(plug, kind))
+
+    def _readLeaf(self, plug: om2.MPlug, kind: tuple):
+        if kind[0] in ('array', 'compound'):
+            return self.read(plug)
+        if kind[0] == 'numeric':
+            return plugValues.getNumeric(plug, kind[1])
+        if kind[0] == 'matrix':
+            return _pack(list(plugValues.getMatrix(plug)), (4, 4))
+        if kind[0] == 'message':
+            return _connectedNode(plug)
+        if kind[0] == 'string':
+            return _connectedNode(plug) or plug.asString()
+        return cmds.getAttr(omUtils.plugPath(plug))
+
+    def _kind(self, plug: om2.MPlug) -> tuple:
+        if plug.isArray:
+            return ('array',)
+        if plug.isCompound:
+            return ('compound',)
+        attr = plug.attribute()
+        name = om2.MFnAttribute(attr).name
+        kind = self._kinds.get(name)
+        if kind is None:
+            kind = self._kinds[name] = _leafKind(plug, attr)
+        return kind
+
+
+def _leafKind(plug: om2.MPlug, attr: om2.MObject) -> tuple:
+    numericKind = plugValues.numericKind(plug)
+    if numericKind is not None:
+        return ('numeric', numericKind)
+    if attr.hasFn(om2.MFn.kMessageAttribute):
+        return ('message',)
+    if plugValues.isMatrix(plug):
+        return ('matrix',)
+    if attr.hasFn(om2.MFn.kTypedAttribute) and om2.MFnTypedAttribute(attr).attrType() == om2.MFnData.kString:
+        return ('string',)
+    return ('other',)
+
+def _pack(values: list, shape: tuple = None):
+    if np is None:
+        return tuple(values)
+    array = np.array(values, dtype=np.float64)
+    return array.reshape(shape) if shape else array
+
+def _connectedNode(plug: om2.MPlug):
+    from cmdk.dg.resolver import connectedNode
+    return connectedNode(plug)
+
+def readCompound(plug: om2.MPlug):
+    return CompoundReader().read(plug)
+
+def readLeaves(plug: om2.MPlug) -> list:
+    return CompoundReader().leaves(plug)
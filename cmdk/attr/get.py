@@ -1,136 +1,165 @@
-import maya.cmds as cmds
-import maya.api.OpenMaya as om2
-import cmdk.dg.omUtils as omUtils
-from cmdk.attr.kMatrix import KMatrix
-from cmdk.attr.kVector import KVector
-
-class GetAttribute(object):
-    
-    def __init__(self, nodeName: str, attrName: str):
-        self.nodeName = nodeName
-        self.attrName = attrName
-    
-    @property    
-    def fullPath(self):
-        return '{}.{}'.format(self.nodeName, self.attrName)
-        
-    @property
-    def name(self):
-        return self.fullPath.split('.')[-1].split('[')[0]
-        
-    @property    
-    def isMulti(self) -> bool:
-        if cmds.getAttr(self.fullPath, s=True) > 1:
-            return True
-            
-        _isMulti= cmds.attributeQuery(self.name, node=self.nodeName, multi=True)
-        return ']' != self.fullPath[-1] and  _isMulti
-        
-    # attr types -----------------------------------------------------------
-    def queryType(self, _type: str) -> bool:
-        return cmds.getAttr(self.fullPath, typ=True) == _type
-        
-    @property
-    def isMessage(self) -> bool:
-        return self.queryType('message')
-        
-    @property
-    def isString(self) -> bool:
-        return self.queryType('string')
-        
-    @property
-    def isCompoundAttr(self) -> bool:
-        return self.queryType('TdataCompound')
-        
-    @property
-    def isVector(self) -> bool:
-        pass
-        
-    @property
-    def isMatrix(self) -> bool:
-        pass
-        
-    @property
-    def isQuaternion(self) -> bool:
-        pass
-        
-
-    #  attr datas ---------------------------------------------------------------------------------------------    
-
-    @property
-    def messageData(self):
-        from cmdk.dg.depNode  import DepNode
-        from cmdk.dag.dagNode import DagNode
-        if self.isMulti:
-            nodes = cmds.listConnections(self.fullPath) or []
-            return [DagNode(nodeName=node) if omUtils.isDagNode(node) else DepNode(nodeName=node) for node in nodes]
-            
-        nodes = cmds.listConnections(self.fullPath, s=False) or cmds.listConnections(self.fullPath, d=False)
-        if nodes is None:
-            return
-        return DagNode(nodeName=nodes[0]) if omUtils.isDagNode(nodes[0]) else DepNode(nodeName=nodes[0])
-        
-    @property
-    def stringData(self):
-        '''
-        The string attribute and the information attribute are very similar
-        The node's message attribute can be connected with the string attribute
-        so it will preferentially return the connected object rather than the string
-        '''
-        _messageData = self.messageData
-        if _messageData: 
-            return _messageData
-        # ------------------------------
-        return cmds.getAttr(self.fullPath) # get string 
-        
-    @property
-    def compoundAttrData(self):
-        subAttr = cmds.listAttr(self.fullPath, multi=True) or []
-        _compoundAttrData = []
-        for attr in subAttr:
-            a = GetAttribute(self.nodeName, attr)
-            if a.isMessage:
-                data = a.messageData
-            elif a.isString:
-                data = a.stringData
-            elif a.isCompoundAttr:
-                continue
-                #data = None    
-            else:
-                data = cmds.getAttr('{}.{}'.format(self.nodeName, attr))
-                    
-            _compoundAttrData.append(data)
-            
-        return _compoundAttrData
-            
-    #  -----------------------------------------------------------------------------------------------
-    def run(self, *args, **kwargs):
-        if self.isMessage:
-            return self.messageData
-        elif self.isString:
-            return self.stringData
-        elif self.isCompoundAttr:
-            return self.compoundAttrData
-        
-            
-        return cmds.getAttr(self.fullPath, *args, **kwargs)
-            
-        
-        
-if __name__ == '__main__':
-    a = GetAttribute('blendMatrix1', 'target'); a.run()
-
-
-#cmds.getAttr('sb.boundingBoxMin', typ=True) 
-
-'''
-cmds.attributeQuery('target', node='blendMatrix1', multi=True)
-cmds.getAttr('{}.{}'.format('blendMatrix1', 'target[0]'), s=True)
-cmds.listAttr('{}.{}'.format('blendMatrix1', 'target[0]'), multi=True)
-'''
-
-        
-
-
-
-
+import maya.cmds as cmds
+import maya.api.OpenMaya as om2
+import cmdk.dg.omUtils as omUtils
+import cmdk.attr.attrPath as attrPath
+import cmdk.attr.schema as schema
+import cmdk.attr.compoundReader as compoundReader
+import cmdk.attr.codecs as codecs
+
+class GetAttribute(object):
+    
+    def __init__(self, nodeName: str, attrName: str, plug: om2.MPlug = None, node=None):
+        '''
+        plug and node are optional, the Attribute that owns them passes them in
+        so the schema is found without asking Maya again
+        '''
+        self.nodeName = nodeName
+        self.attrName = attrName
+        self._plug    = plug
+        self._node    = node
+        self._schema  = None
+        
+    @property
+    def plug(self) -> om2.MPlug:
+        if self._plug is None:
+            self._plug = (omUtils.findPlug(self._node._handle.object(), self.nodeName, self.attrName)
+                          if self._node is not None else
+                          om2.MGlobal.getSelectionListByName(self.fullPath).getPlug(0))
+        return self._plug
+        
+    @property
+    def schema(self) -> schema.AttrSchema:
+        '''
+        Type, multi-ness and children come from the schema cache,
+        only the first read of an attribute per node type queries them
+        '''
+        if self._schema is None:
+            if self._node is not None:
+                nodeType, dynamicCache = self._node.type, self._node._schemas
+            else:
+                nodeType, dynamicCache = om2.MFnDependencyNode(self.plug.node()).typeName, None
+            self._schema = schema.getSchema(self.plug, nodeType, self.nodeName, self.attrName, dynamicCache)
+        return self._schema
+    
+    @property    
+    def fullPath(self):
+        return '{}.{}'.format(self.nodeName, self.attrName)
+        
+    @property
+    def name(self):
+        return attrPath.leafName(self.attrName)
+        
+    @property    
+    def isMulti(self) -> bool:
+        return self.schema.isMulti
+        
+    # attr types -----------------------------------------------------------
+    def queryType(self, _type: str) -> bool:
+        return self.schema.typeName == _type
+        
+    @property
+    def isMessage(self) -> bool:
+        return self.queryType('message')
+        
+    @property
+    def isString(self) -> bool:
+        return self.queryType('string')
+        
+    @property
+    def isCompoundAttr(self) -> bool:
+        return self.queryType('TdataCompound')
+        
+    @property
+    def isVector(self) -> bool:
+        return self.schema.codec == 'vector'
+        
+    @property
+    def isMatrix(self) -> bool:
+        return self.schema.codec == 'matrix'
+        
+    @property
+    def isQuaternion(self) -> bool:
+        return self.schema.codec == 'quaternion'
+        
+
+    #  attr datas ---------------------------------------------------------------------------------------------    
+
+    @property
+    def messageData(self):
+        '''
+        Connected nodes are read from the MPlug, a multi returns every element's nodes in logical index order
+        '''
+        from cmdk.dg.resolver import connectedNodes, connectedNode
+        if self.isMulti:
+            return connectedNodes(self.plug)
+        return connectedNode(self.plug)
+        
+    @property
+    def stringData(self):
+        '''
+        The string attribute and the information attribute are very similar
+        The node's message attribute can be connected with the string attribute
+        so it will preferentially return the connected object rather than the string
+        '''
+        _messageData = self.messageData
+        if _messageData: 
+            return _messageData
+        # ------------------------------
+        return cmds.getAttr(self.fullPath) # get string 
+        
+    @property
+    def compoundTree(self):
+        '''
+        Nested {child name / logical index: value} read in one walk of the plug tree
+        '''
+        return compoundReader.readCompound(self.plug)
+        
+    @property
+    def compoundAttrData(self):
+        '''
+        Flat list of the leaf values, what get() has always returned for compounds
+        Read in one walk of the plug tree, nested compounds included, compoundTree keeps the structure
+        '''
+        return compoundReader.readLeaves(self.plug)
+            
+    #  -----------------------------------------------------------------------------------------------
+    def run(self, *args, **kwargs):
+        '''
+        Vectors, matrices and quaternions are read by their codec into KVector / KMatrix / MQuaternion,
+        unless getAttr flags are given
+        '''
+        schema = self.schema
+        codec  = codecs.get(schema.codec)
+        if codec is not None and not schema.isMulti and not args and not kwargs:
+            return codec.read(self.plug)
+            
+        kind = schema.kind
+        if kind == 'message':
+            return self.messageData
+        elif kind == 'string':
+            return self.stringData
+        elif kind == 'compound':
+            return self.compoundAttrData
+        
+            
+        return cmds.getAttr(self.fullPath, *args, **kwargs)
+            
+        
+        
+if __name__ == '__main__':
+    a = GetAttribute('blendMatrix1', 'target'); a.run()
+
+
+#cmds.getAttr('sb.boundingBoxMin', typ=True) 
+
+'''
+cmds.attributeQuery('target', node='blendMatrix1', multi=True)
+cmds.getAttr('{}.{}'.format('blendMatrix1', 'target[0]'), s=True)
+cmds.listAttr('{}.{}'.format('blendMatrix1', 'target[0]'), multi=True)
+'''
+
+        
+
+
+
+
@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+from cmdk.attr.kVector import KVector, _isMatrix
+from cmdk.attr.kVectorArray import KVectorArray, _wrap as _wrapVectors
+
+
+class KMatrixArray(object):
+    '''
+    N matrices in one (N, 4, 4) float64 array, row-major like MMatrix: rows are v1, v2, v3, off
+    The operators follow KMatrix, vectors are rows multiplied on the left of the matrix
+    A single KMatrix, a (4, 4) array, a KVector or a (3,) array on the other side is broadcast
+    Only needs numpy, KMatrix is only used once Maya has loaded it
+
+    matrices * matrices  : matrix product, same order as KMatrix * KMatrix
+    matrices * points    : points transformed, translation included   (KMatrix.mul)
+    vectors  % matrices  : vectors transformed, no translation        (KMatrix.mulVectorlR)
+    matrices % vectors   : the 3x3 part times column vectors          (KMatrix.mulVectorlL)
+    ~matrices            : inverse
+
+    world = locals * parents
+    points = world * offsets
+    '''
+    __slots__ = ('_array',)
+
+    def __init__(self, values=(), copy: bool = True):
+        if isinstance(values, KMatrixArray):
+            values = values._array
+        elif isinstance(values, (list, tuple)) and values and \
+             not isinstance(values[0], (list, tuple, np.ndarray, int, float, np.number)):
+            values, copy = [tuple(matrix) for matrix in values], False
+
+        array = np.array(values, dtype=np.float64) if copy else np.asarray(values, dtype=np.float64)
+        if array.size == 0:
+            array = array.reshape(0, 4, 4)
+        elif array.shape[-1:] == (16,):
+            array = array.reshape(-1, 4, 4)
+        elif array.shape == (4, 4):
+            array = array.reshape(1, 4, 4)
+        if array.ndim != 3 or array.shape[1:] != (4, 4):
+            raise ValueError('Expected matrices of shape (N, 4, 4) or (N, 16), got {}'.format(array.shape))
+        self._array = array
+
+    @classmethod
+    def identity(cls, count: int) -> 'KMatrixArray':
+        return _wrap(np.tile(np.eye(4), (count, 1, 1)))
+
+    @classmethod
+    def fromAxes(cls, v1, v2, v3, off) -> 'KMatrixArray':
+        '''
+        Build from per matrix axes, each a KVectorArray, an (N, 3) array or a KVector shared by all of them
+        '''
+        axes  = np.broadcast_arrays(*(_vectors(axis) for axis in (v1, v2, v3, off)))
+        array = np.zeros(axes[0].shape[:-1] + (4, 4))
+        for row, axis in enumerate(axes):
+            array[..., row, :3] = axis
+        array[..., 3, 3] = 1.0
+        return _wrap(array.reshape(-1, 4, 4))
+
+    @property
+    def array(self) -> np.ndarray:
+        '''
+        The (N, 4, 4) array itself, not a copy
+        '''
+        return self._array
+
+    def __array__(self, dtype=None, copy=None):
+        return self._array if dtype is None else self._array.astype(dtype)
+
+    def __repr__(self):
+        return 'KMatrixArray({} matrices)'.format(len(self._array))
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    def __iter__(self):
+        return iter(self._array)
+
+    def matrix(self, index: int):
+        '''
+        The matrix as a KMatrix copy, needs Maya
+        '''
+        from cmdk.attr.kMatrix import KMatrix
+        return KMatrix.adopt(self._array[index].ravel().tolist())
+
+    def toMatrices(self) -> list:
+        from cmdk.attr.kMatrix import KMatrix
+        return [KMatrix.adopt(values) for values in self._array.reshape(-1, 16).tolist()]
+
+    # -------------------------------------------
+    '''
+    Axes as zero-copy KVectorArray views, writing to them writes to the matrices
+    '''
+    @property
+    def v1(self) -> KVectorArray:
+        return _wrapVectors(self._array[:, 0, :3])
+
+    @v1.setter
+    def v1(self, vectors):
+        self._array[:, 0, :3] = _vectors(vectors)
+
+    @property
+    def v2(self) -> KVectorArray:
+        return _wrapVectors(self._array[:, 1, :3])
+
+    @v2.setter
+    def v2(self, vectors):
+        self._array[:, 1, :3] = _vectors(vectors)
+
+    @property
+    def v3(self) -> KVectorArray:
+        return _wrapVectors(self._array[:, 2, :3])
+
+    @v3.setter
+    def v3(self, vectors):
+        self._array[:, 2, :3] = _vectors(vectors)
+
+    @property
+    def off(self) -> KVectorArray:
+        return _wrapVectors(self._array[:, 3, :3])
+
+    @off.setter
+    def off(self, vectors):
+        self._array[:, 3, :3] = _vectors(vectors)
+
+    @property
+    def getScale(self) -> KVectorArray:
+        return _wrapVectors(np.sqrt(np.einsum('nij,nij->ni', self._array[:, :3, :3], self._array[:, :3, :3])))
+
+    def isEqual(self, other, epsilon=1e-10) -> np.ndarray:
+        '''
+        Per matrix, tests component-wise if the difference is no bigger than epsilon
+        '''
+        return np.all(np.abs(self._array - _matrices(other)) <= epsilon, axis=(1, 2))
+
+    def mul(self, points) -> KVectorArray:
+        '''
+        Multiply the points by the matrices, this includes any translation in the matrices
+        '''
+        return _wrapVectors(_transform(_vectors(points), self._array, True))
+
+    def mulVectorlR(self, vectors) -> KVectorArray:
+        '''
+        Multiply the vectors by the matrices, this does not include any translation
+        '''
+        return _wrapVectors(_transform(_vectors(vectors), self._array, False))
+
+    def mulVectorlL(self, vectors) -> KVectorArray:
+        '''
+        Multiply the matrices by the column vectors, this does not include any translation
+        '''
+        vectors = _vectors(vectors)
+        return _wrapVectors(np.matmul(self._array[:, :3, :3], vectors[..., :, None])[..., 0])
+
+    def inverse(self) -> 'KMatrixArray':
+        '''
+        Inverts the matrices
+        '''
+        return _wrap(np.linalg.inv(self._array))
+
+    def transpose(self) -> 'KMatrixArray':
+        return _wrap(np.ascontiguousarray(self._array.swapaxes(1, 2)))
+
+    # -----------------------------------------------------
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return self._array[index]
+        return _wrap(self._array[index])
+
+    def __setitem__(self, index, value):
+        self._array[index] = _matrices(value)
+
+    def __add__(self, other) -> 'KMatrixArray':
+        other = _matrices(other)
+        return NotImplemented if other is None else _wrap(self._array + other)
+
+    def __radd__(self, other) -> 'KMatrixArray':
+        return self.__add__(other)
+
+    def __iadd__(self, other):
+        other = _matrices(other)
+        if other is None:
+            return NotImplemented
+        self._array += other
+        return self
+
+    def __sub__(self, other) -> 'KMatrixArray':
+        other = _matrices(other)
+        return NotImplemented if other is None else _wrap(self._array - other)
+
+    def __rsub__(self, other) -> 'KMatrixArray':
+        other = _matrices(other)
+        return NotImplemented if other is None else _wrap(other - self._array)
+
+    def __isub__(self, other):
+        other = _matrices(other)
+        if other is None:
+            return NotImplemented
+        self._array -= other
+        return self
+
+    def __mul__(self, other):
+        if isinstance(other, (int, float, np.number)):
+            return _wrap(self._array * other)
+        matrices = _matrices(other)
+        if matrices is not None:
+            return _wrap(np.matmul(self._array, matrices))
+        vectors = _vectors(other)
+        return NotImplemented if vectors is None else _wrapVectors(_transform(vectors, self._array, True))
+
+    def __rmul__(self, other):
+        '''
+        Matrices on the left keep their order, points and numbers behave as they do on the right
+        '''
+        matrices = _matrices(other)
+        if matrices is not None and not isinstance(other, (int, float, np.number)):
+            return _wrap(np.matmul(matrices, self._array))
+        return self.__mul__(other)
+
+    def __imul__(self, other):
+        if isinstance(other, (int, float, np.number)):
+            self._array *= other
+            return self
+        matrices = _matrices(other)
+        if matrices is None:
+            return NotImplemented
+        self._array[...] = np.matmul(self._array, matrices)
+        return self
+
+    def __truediv__(self, other) -> 'KMatrixArray':
+        '''
+        Like KMatrix, the axes and the offset are divided and the last column is reset to (0, 0, 0, 1)
+        '''
+        if not isinstance(other, (int, float, np.number)):
+            return NotImplemented
+        array = self._array / other
+        array[:, :, 3] = (0.0, 0.0, 0.0, 1.0)
+        return _wrap(array)
+
+    def __invert__(self) -> 'KMatrixArray':
+        return self.inverse()
+
+    def __mod__(self, other) -> KVectorArray:
+        vectors = _vectors(other)
+        return NotImplemented if vectors is None else self.mulVectorlL(vectors)
+
+    def __rmod__(self, other) -> KVectorArray:
+        vectors = _vectors(other)
+        return NotImplemented if vectors is None else self.mulVectorlR(vectors)
+
+
+_new = object.__new__
+
+def _wrap(array: np.ndarray) -> KMatrixArray:
+    '''
+    KMatrixArray around an (N, 4, 4) array that is already checked, no copy
+    '''
+    matrices = _new(KMatrixArray)
+    matrices._array = array
+    return matrices
+
+def _matrices(other):
+    '''
+    The other side as (N, 4, 4) or (4, 4), None when it is not a matrix
+    Numbers are accepted for + and -, which add them to every component like MMatrix does
+    '''
+    if isinstance(other, KMatrixArray):
+        return other._array
+    if _isMatrix(other):
+        return np.fromiter(other._omMatrix, dtype=np.float64, count=16).reshape(4, 4)
+    if isinstance(other, np.ndarray) and other.shape[-2:] == (4, 4):
+        return other
+    if isinstance(other, (int, float, np.number)):
+        return other
+    return None
+
+def _vectors(other):
+    '''
+    The other side as (N, 3) or (3,), None when it is not a vector
+    '''
+    if isinstance(other, KVectorArray):
+        return other._array
+    if isinstance(other, KVector):
+        return np.array((other.x, other.y, other.z))
+    if isinstance(other, np.ndarray) and other.shape[-1:] == (3,):
+        return other
+    return None
+
+def _transform(vectors: np.ndarray, matrices: np.ndarray, translate: bool) -> np.ndarray:
+    '''
+    Row vectors times the upper 3x3, plus the offset row for points
+    Same as MPoint * MMatrix and MVector * MMatrix for affine matrices
+    '''
+    result = np.matmul(vectors[..., None, :], matrices[..., :3, :3])[..., 0, :]
+    if translate:
+        result = result + matrices[..., 3, :3]
+    return result.reshape(-1, 3)
@@ -1,492 +1,486 @@
-# -*- coding: utf-8 -*-
-import maya.cmds as cmds
-import maya.api.OpenMaya as om2
-import cmdk.attr.attrUtils as attrUtils
-
-
-class KVector(object):
-    
-    def __init__(self, x: float = 0, 
-                       y: float = 0, 
-                       z: float = 0):
-        
-        self._omVector = x if isinstance(x, (self.__class__, om2.MVector, list, tuple)) else (x, y, z)
-
-
-    def __repr__(self):
-        return 'KVector({}, {}, {})'.format(*self)
-        
-    def __str__(self):
-        return str((*self,))
-    
-    def __iter__(self):
-        return (i for i in (self.x, self.y, self.z))
-        
-    @property
-    def _omVector(self) -> om2.MVector:
-        return self.__omVector
-        
-    @_omVector.setter
-    @attrUtils.checkVectorType
-    def _omVector(self, value):
-        self.__omVector = om2.MVector(*value)
-        
-    @property
-    def _omPoint(self) -> om2.MPoint:
-        return om2.MPoint(self._omVector)
-        
-    @property
-    def x(self) -> float:
-        return self._omVector.x
-        
-    @x.setter
-    @attrUtils.checkNumberType
-    def x(self, value):
-        self._omVector.x = value
-        
-    @property
-    def y(self) -> float:
-        return self._omVector.y
-        
-    @y.setter
-    @attrUtils.checkNumberType
-    def y(self, value):
-        self._omVector.y = value
-        
-    @property
-    def z(self) -> float:
-        return self._omVector.z
-        
-    @z.setter
-    @attrUtils.checkNumberType
-    def z(self, value):
-        self._omVector.z = value
-        
-    # -------------------------------------------
-    @property
-    def getHashCode(self) -> int:
-        '''
-        Returns the hash code of the vector used for hash maps and comparisons
-        '''
-        hashX = int(self.x * 738566456)
-        hashY = int(self.y * 193496634)
-        hashZ = int(self.z * 834927916)
-
-        return hashX ^ hashY ^ hashZ
-    
-    @attrUtils.checkClass
-    def isEqual(self, other, epsilon=1e-10) -> bool:
-        '''
-        Tests component-wise if the difference is no bigger than epsilon
-        '''
-        return self._omVector.isEquivalent(other._omVector, epsilon)
-        
-    def isZero(self, epsilon=1e-10) -> bool:
-        '''
-        Checks if each component is zero
-        '''
-        return all(abs(n) < epsilon for n in self)
-            
-    def setZero(self) -> 'self':
-        '''
-        Sets all components to zero
-        '''
-        self.x, self.y, self.z = 0, 0, 0
-        return self
-    
-    @property    
-    def getAverage(self) -> float:
-        '''
-        Calculates the average value of x, y and z
-        '''
-        return (self.x + self.y + self.z) / 3.0
-        
-    @property
-    def getSum(self) -> float:
-        '''
-        Calculates the sum of x, y and z
-        '''
-        return self.x + self.y + self.z
-
-    @attrUtils.checkClass
-    def setMin(self, other) -> 'self':
-        '''
-        Set the minimum of each component
-        '''
-        self.x = min(self.x, other.x)
-        self.y = min(self.y, other.y)
-        self.z = min(self.z, other.z)
-        return self
-        
-    @attrUtils.checkClass
-    def setMax(self, other) -> 'self':
-        '''
-        Set the maximum of each component
-        '''
-        self.x = max(self.x, other.x)
-        self.y = max(self.y, other.y)
-        self.z = max(self.z, other.z)
-        return self
-    
-    @attrUtils.checkClass
-    def min(self, other) -> 'KVector':
-        '''
-        Calculates the minimum of each component
-        '''
-        return KVector(
-        x=min(self.x, other.x),
-        y=min(self.y, other.y),
-        z=min(self.z, other.z))
-    
-    @attrUtils.checkClass
-    def max(self, other) -> 'KVector':
-        '''
-        Calculates the maximum of each component
-        '''
-        return KVector(
-        x=max(self.x, other.x),
-        y=max(self.y, other.y),
-        z=max(self.z, other.z))
-    
-    @property
-    def clamp01(self) -> 'KVector':
-        '''
-        Returns a vector that is clamped to the range [0.0 .. 1.0]
-        '''
-        clampedX = max(0.0, min(self.x, 1.0))
-        clampedY = max(0.0, min(self.y, 1.0))
-        clampedZ = max(0.0, min(self.z, 1.0))
-        return KVector(clampedX, clampedY, clampedZ)
-        
-    @property    
-    def getLength(self) -> float:
-        '''
-        Calculates the length of the vector
-        '''
-        return self._omVector.length()
-        
-    @property
-    def getSquaredLength(self) -> float:
-        '''
-        Returns the squared length of the vector
-        '''
-        return pow(self.getLength, 2)
-        
-
-    def getNormalized(self) -> 'KVector':
-        '''
-        Calculates the normalized vector, so that getLength returns 1
-        '''
-        nv = self._omVector.normal()
-        return KVector(nv.x, nv.y, nv.z)
-        
-    def normalize(self) -> 'self':
-        '''
-        Normalizes the vector, so that getLength returns 1
-        '''
-        self._omVector.normalize()
-        return self
-        
-        
-    @property
-    def getMin(self) -> float:
-        '''
-        Returns the minimum of x, y and z
-        '''
-        return min(self.x, self.y, self.z)
-    
-    @property
-    def getMax(self) -> float:
-        '''
-        Returns the maximum of x, y and z
-        '''
-        return max(self.x, self.y, self.z)
-        
-    def getRightRotated(self, rots) -> 'KVector':
-        '''
-        Returns a vector where the components have been rotated to the right (in the usual (x, y, z)-representation)
-        E.g., with a value of 1 for rots, the result will be (z, x, y)
-        
-        rots = 1; x, y, z = z, x, y
-        rots = 2; x, y, z = y, z, x
-        rots = 3; x, y, z = x, y, z (no change)
-        '''
-        coords = [self.x, self.y, self.z]
-        rots = rots % 3
-        rotatedCoords = coords[-rots:] + coords[:-rots]
-        return KVector(*rotatedCoords)
-        
-    @attrUtils.checkClass    
-    def dot(self, other) -> float:
-        '''
-        Calculates the dot product of the self and other
-        '''
-        return self._omVector * other._omVector
-        
-    @property
-    def abs(self):
-        '''
-        Returns the vector with absolute value for each entry
-        '''
-        return KVector(abs(self.x), abs(self.y), abs(self.z))
-        
-    @attrUtils.checkClass       
-    def getAngle(self, other) -> float:
-        '''
-        Calculates angle (in radians) between self and other
-        '''
-        return self._omVector.angle(other._omVector)
-        
-    @attrUtils.checkClass       
-    def cross(self, other) -> 'KVector':
-        '''
-        Calculates the cross product of the self and other
-        '''
-        #crossProduct = self._omVector ^ other._omVector
-        #return KVector(crossProduct.x, crossProduct.y, crossProduct.z)
-        return KVector(self._omVector ^ other._omVector)
-        
-    @attrUtils.checkClass  
-    def getDistance(self, other) -> float:
-        '''
-        Retrieve the distance between two vectors
-        '''
-        return self._omPoint.distanceTo(other._omPoint)
-        
-    @staticmethod
-    def GetDistance(v1, v2) -> float:
-        '''
-        Retrieve the distance between two vectors
-        '''
-        return v1._omPoint.distanceTo(v2._omPoint)
-    
-    # -----------------------------------------------------
-    
-    @attrUtils.checkNumberType     
-    def __getitem__(self, index) -> float:
-        '''
-        Retrieves the value of the x, y or z component of the vector
-        '''
-        return self._omVector[index]
-    
-    @attrUtils.checkNumberType        
-    def __setitem__(self, index, value):
-        '''
-        Assigns a value to the x, y or z component of the vector
-        '''
-        self._omVector[index] = value
-            
-    def __add__(self, other) -> 'KVector':
-        '''
-        Adds an operand to the vector
-        '''
-        if isinstance(other, self.__class__):
-            addVec = self._omVector + other._omVector
-            return KVector(addVec.x, addVec.y, addVec.z)
-        elif isinstance(other, (int, float, complex)):
-            return KVector(self.x + other, self.y + other, self.z + other)
-        else:
-            return NotImplemented
-            
-    def __radd__(self, other) -> 'KVector':
-        '''
-        Adds the vector to an operand
-        '''
-        return self.__add__(other)
-    
-    def __iadd__(self, other):
-        if isinstance(other, self.__class__):
-            self._omVector += other._omVector
-        elif isinstance(other, (int, float)):
-            self.x += other
-            self.y += other
-            self.z += other
-        else:
-            return NotImplemented
-        return self
-    
-    def __isub__(self, other):
-        if isinstance(other, self.__class__):
-            self._omVector -= other._omVector
-        elif isinstance(other, (int, float)):
-            self.x -= other
-            self.y -= other
-            self.z -= other
-        else:
-            return NotImplemented
-        return self
-        
-        
-    def __sub__(self, other) -> 'KVector':
-        '''
-        Subtracts an operand from the vector
-        '''
-        if isinstance(other, self.__class__):
-            subVec = self._omVector - other._omVector
-            return KVector(subVec.x, subVec.y, subVec.z)
-        elif isinstance(other, (int, float, complex)):
-            return KVector(self.x - other, self.y - other, self.z - other)
-        else:
-            return NotImplemented
-    
-    def __rsub__(self, other) -> 'KVector':
-        '''
-        Subtracts the vector from an operand
-        '''
-        if isinstance(other, self.__class__):
-            return other.__sub__(self)
-        elif isinstance(other, (int, float)):
-            return KVector(other - self.x, other - self.y, other - self.z)
-        else:
-            return NotImplemented
-    
-    @attrUtils.checkClass        
-    def __ne__(self, other) -> bool:
-        return self._omVector.__ne__(other._omVector) 
-        
-    @attrUtils.checkClass        
-    def __eq__(self, other) -> bool:
-        return self._omVector.__eq__(other._omVector)
-        
-    def __invert__(self) -> 'KVector':
-        '''
-        Returns the inverse of the vector
-        '''
-        return KVector(-self.x, -self.y, -self.z)
-        
-    def __neg__(self) -> 'KVector':
-        return self.__invert__()
-        
-    def __abs__(self) -> 'KVector':
-        return self.abs
-    
-    @attrUtils.checkNumberType
-    def __truediv__(self, other):
-        return KVector(self.x / other, self.y / other, self.z / other)
-        
-    @attrUtils.checkNumberType
-    def __itruediv__ (self, other):
-        self._omVector /= other
-        return self
-
-            
-    @attrUtils.checkNumberType
-    def __floordiv__(self, other):
-        return KVector(self.x // other, self.y // other, self.z // other)
-    
-    @attrUtils.checkNumberType
-    def __ifloordiv__(self, other):
-        self.x //= other
-        self.y //= other
-        self.z //= other
-        return self
-        
-    def __mul__(self, other):
-        from cmdk.attr.kMatrix import KMatrix
-        
-        if isinstance(other, (int, float, complex)):
-            return KVector(self.x * other, self.y * other, self.z * other)
-        elif isinstance(other, self.__class__):
-            return self.dot(other)
-        elif isinstance(other, KMatrix):
-            return other.__mul__(self)
-        else:
-            return NotImplemented
-            
-    def __rmul__(self, other):
-        return self.__mul__(other)
-            
-    def __imul__(self, other):
-        from cmdk.attr.kMatrix import KMatrix
-        
-        if isinstance(other, (int, float, complex)):
-            self._omVector *= other
-        elif isinstance(other, self.__class__):
-            return self.dot(other)
-        elif isinstance(other, KMatrix):
-            return other.__imul__(self)
-        return self
-        
-    @attrUtils.checkClass
-    def __xor__(self, other):
-        '''
-        Calculates the cross product of the vector and an operand
-        '''
-        return self.cross(other)
-    
-    @attrUtils.checkClass
-    def __rxor__(self, other):
-        '''
-        Calculates the cross product of the vector and an operand
-        '''
-        return self.__xor__(other)
-        
-    def __mod__(self, other):
-        '''
-        Calculates an alternative product operation of the vector and a left-side operand
-
-        If other is a vector, calculates the component-wise product of the vectors
-        If other is a matrix, the vector is transformed by it, excluding translations
-        '''
-        if isinstance(other, self.__class__):
-            return KVector(self.x*other.x, self.y*other.y, self.z*other.z)
-        else:
-            return NotImplemented
-            
-    def __rmod__(self, other):
-        from cmdk.attr.kMatrix import KMatrix
-        if isinstance(other, KMatrix):
-            return other.__rmod__(self) 
-        # elif isinstance(other, self.__class__):
-        #     return self.dot(other)
-        else:
-            return self.__xor__(other)
-       
-    def __imod__(self, other):
-        from cmdk.attr.kMatrix import KMatrix
-        if isinstance(other, self.__class__):
-            self.x *= other.x
-            self.y *= other.y
-            self.z *= other.z
-        elif isinstance(other, KMatrix):
-            return other.__imod__(self) 
-        else:
-            return NotImplemented
-        return self
-    
-        
- 
-    
-if __name__ == '__main__':
-    v1 = KVector(1, 0, 0)
-    v1._omVector
-    
-    vec1 = KVector(v1)
-    vec1._omVector
-    
-    vec1.x = 3
-    
-    v3 = KVector((5, 6, 3))
-    v3._omVector
-    # v = KVector(3, 2, 6)
-    # v2 = KVector(5, 8, 3)
-    
-    # aad = KVector((5, 6, 3))
-    # aad._omVector
-    
-    # sb = KVector(v)
-    # sb.normalize()
-
-    # print(v)
-    
-    # v3 = KVector(v2)
-    
-    # vv = om2.MVector(8, 9, 6)
-    # vv3 = KVector(vv)
-    # vv3.normalize()
-    # vv3._omVector
-
-
-
-
-
+# -*- coding: utf-8 -*-
+import sys
+import math
+from numbers import Real
+try:
+    import maya.api.OpenMaya as om2
+except ImportError:
+    om2 = None
+
+
+class KVector(object):
+    '''
+    x, y and z are stored in the _x, _y and _z slots, arguments are checked once when the vector is built
+    results of the operators are built without checks, their components are already numbers
+    the public x, y and z setters and __setitem__ go through float(), so a component is always a number
+    Maya is only needed for _omVector / _omPoint / fromMVector
+    '''
+    __slots__ = ('_x', '_y', '_z')
+
+    def __init__(self, x: float = 0,
+                       y: float = 0,
+                       z: float = 0):
+
+        if x.__class__ is float and y.__class__ is float and z.__class__ is float:
+            self._x, self._y, self._z = x, y, z
+        elif isinstance(x, Real) and isinstance(y, Real) and isinstance(z, Real):
+            self._x, self._y, self._z = float(x), float(y), float(z)
+        else:
+            self._x, self._y, self._z = _components(x)
+
+    @classmethod
+    def fromMVector(cls, vector: 'om2.MVector') -> 'KVector':
+        '''
+        Build from an MVector or MPoint
+        '''
+        return _make(vector.x, vector.y, vector.z)
+
+    def __repr__(self):
+        return 'KVector({}, {}, {})'.format(self._x, self._y, self._z)
+
+    def __str__(self):
+        return str((self._x, self._y, self._z))
+
+    def __iter__(self):
+        return iter((self._x, self._y, self._z))
+
+    def __len__(self) -> int:
+        return 3
+
+    @property
+    def x(self) -> float:
+        return self._x
+
+    @x.setter
+    def x(self, value: float):
+        self._x = float(value)
+
+    @property
+    def y(self) -> float:
+        return self._y
+
+    @y.setter
+    def y(self, value: float):
+        self._y = float(value)
+
+    @property
+    def z(self) -> float:
+        return self._z
+
+    @z.setter
+    def z(self, value: float):
+        self._z = float(value)
+
+    @property
+    def _omVector(self) -> 'om2.MVector':
+        return om2.MVector(self._x, self._y, self._z)
+
+    @property
+    def _omPoint(self) -> 'om2.MPoint':
+        return om2.MPoint(self._x, self._y, self._z)
+
+    # -------------------------------------------
+    @property
+    def getHashCode(self) -> int:
+        '''
+        Returns the hash code of the vector used for hash maps and comparisons
+        '''
+        hashX = int(self._x * 738566456)
+        hashY = int(self._y * 193496634)
+        hashZ = int(self._z * 834927916)
+
+        return hashX ^ hashY ^ hashZ
+
+    def isEqual(self, other, epsilon=1e-10) -> bool:
+        '''
+        Tests component-wise if the difference is no bigger than epsilon
+        '''
+        return abs(self._x - other.x) <= epsilon and abs(self._y - other.y) <= epsilon and abs(self._z - other.z) <= epsilon
+
+    def isZero(self, epsilon=1e-10) -> bool:
+        '''
+        Checks if each component is zero
+        '''
+        return abs(self._x) < epsilon and abs(self._y) < epsilon and abs(self._z) < epsilon
+
+    def setZero(self) -> 'self':
+        '''
+        Sets all components to zero
+        '''
+        self._x, self._y, self._z = 0.0, 0.0, 0.0
+        return self
+
+    @property
+    def getAverage(self) -> float:
+        '''
+        Calculates the average value of x, y and z
+        '''
+        return (self._x + self._y + self._z) / 3.0
+
+    @property
+    def getSum(self) -> float:
+        '''
+        Calculates the sum of x, y and z
+        '''
+        return self._x + self._y + self._z
+
+    def setMin(self, other) -> 'self':
+        '''
+        Set the minimum of each component
+        '''
+        self._x = min(self._x, other.x)
+        self._y = min(self._y, other.y)
+        self._z = min(self._z, other.z)
+        return self
+
+    def setMax(self, other) -> 'self':
+        '''
+        Set the maximum of each component
+        '''
+        self._x = max(self._x, other.x)
+        self._y = max(self._y, other.y)
+        self._z = max(self._z, other.z)
+        return self
+
+    def min(self, other) -> 'KVector':
+        '''
+        Calculates the minimum of each component
+        '''
+        return _make(min(self._x, other.x), min(self._y, other.y), min(self._z, other.z))
+
+    def max(self, other) -> 'KVector':
+        '''
+        Calculates the maximum of each component
+        '''
+        return _make(max(self._x, other.x), max(self._y, other.y), max(self._z, other.z))
+
+    @property
+    def clamp01(self) -> 'KVector':
+        '''
+        Returns a vector that is clamped to the range [0.0 .. 1.0]
+        '''
+        return _make(max(0.0, min(self._x, 1.0)), max(0.0, min(self._y, 1.0)), max(0.0, min(self._z, 1.0)))
+
+    @property
+    def getLength(self) -> float:
+        '''
+        Calculates the length of the vector
+        '''
+        return math.sqrt(self._x * self._x + self._y * self._y + self._z * self._z)
+
+    @property
+    def getSquaredLength(self) -> float:
+        '''
+        Returns the squared length of the vector
+        '''
+        return self._x * self._x + self._y * self._y + self._z * self._z
+
+
+    def getNormalized(self) -> 'KVector':
+        '''
+        Calculates the normalized vector, so that getLength returns 1
+        A zero vector stays zero
+        '''
+        length = math.sqrt(self._x * self._x + self._y * self._y + self._z * self._z)
+        if not length:
+            return _make(self._x, self._y, self._z)
+        return _make(self._x / length, self._y / length, self._z / length)
+
+    def normalize(self) -> 'self':
+        '''
+        Normalizes the vector, so that getLength returns 1
+        '''
+        length = math.sqrt(self._x * self._x + self._y * self._y + self._z * self._z)
+        if length:
+            self._x /= length; self._y /= length; self._z /= length
+        return self
+
+
+    @property
+    def getMin(self) -> float:
+        '''
+        Returns the minimum of x, y and z
+        '''
+        return min(self._x, self._y, self._z)
+
+    @property
+    def getMax(self) -> float:
+        '''
+        Returns the maximum of x, y and z
+        '''
+        return max(self._x, self._y, self._z)
+
+    def getRightRotated(self, rots) -> 'KVector':
+        '''
+        Returns a vector where the components have been rotated to the right (in the usual (x, y, z)-representation)
+        E.g., with a value of 1 for rots, the result will be (z, x, y)
+
+        rots = 1; x, y, z = z, x, y
+        rots = 2; x, y, z = y, z, x
+        rots = 3; x, y, z = x, y, z (no change)
+        '''
+        coords = [self._x, self._y, self._z]
+        rots = rots % 3
+        rotatedCoords = coords[-rots:] + coords[:-rots]
+        return _make(*rotatedCoords)
+
+    def dot(self, other) -> float:
+        '''
+        Calculates the dot product of the self and other
+        '''
+        return self._x * other.x + self._y * other.y + self._z * other.z
+
+    @property
+    def abs(self):
+        '''
+        Returns the vector with absolute value for each entry
+        '''
+        return _make(abs(self._x), abs(self._y), abs(self._z))
+
+    def getAngle(self, other) -> float:
+        '''
+        Calculates angle (in radians) between self and other
+        '''
+        return math.atan2(self.cross(other).getLength, self.dot(other))
+
+    def cross(self, other) -> 'KVector':
+        '''
+        Calculates the cross product of the self and other
+        '''
+        return _make(self._y * other.z - self._z * other.y,
+                     self._z * other.x - self._x * other.z,
+                     self._x * other.y - self._y * other.x)
+
+    def getDistance(self, other) -> float:
+        '''
+        Retrieve the distance between two vectors
+        '''
+        x, y, z = self._x - other.x, self._y - other.y, self._z - other.z
+        return math.sqrt(x * x + y * y + z * z)
+
+    @staticmethod
+    def GetDistance(v1, v2) -> float:
+        '''
+        Retrieve the distance between two vectors
+        '''
+        return v1.getDistance(v2)
+
+    # -----------------------------------------------------
+
+    def __getitem__(self, index) -> float:
+        '''
+        Retrieves the value of the x, y or z component of the vector
+        '''
+        return (self._x, self._y, self._z)[index]
+
+    def __setitem__(self, index, value):
+        '''
+        Assigns a value to the x, y or z component of the vector
+        '''
+        values = [self._x, self._y, self._z]
+        values[index] = float(value)
+        self._x, self._y, self._z = values
+
+    def __add__(self, other) -> 'KVector':
+        '''
+        Adds an operand to the vector
+        '''
+        if isinstance(other, KVector):
+            return _make(self._x + other._x, self._y + other._y, self._z + other._z)
+        elif isinstance(other, (int, float)):
+            return _make(self._x + other, self._y + other, self._z + other)
+        else:
+            return NotImplemented
+
+    def __radd__(self, other) -> 'KVector':
+        '''
+        Adds the vector to an operand
+        '''
+        return self.__add__(other)
+
+    def __iadd__(self, other):
+        if isinstance(other, KVector):
+            self._x += other._x; self._y += other._y; self._z += other._z
+        elif isinstance(other, (int, float)):
+            self._x += other; self._y += other; self._z += other
+        else:
+            return NotImplemented
+        return self
+
+    def __isub__(self, other):
+        if isinstance(other, KVector):
+            self._x -= other._x; self._y -= other._y; self._z -= other._z
+        elif isinstance(other, (int, float)):
+            self._x -= other; self._y -= other; self._z -= other
+        else:
+            return NotImplemented
+        return self
+
+
+    def __sub__(self, other) -> 'KVector':
+        '''
+        Subtracts an operand from the vector
+        '''
+        if isinstance(other, KVector):
+            return _make(self._x - other._x, self._y - other._y, self._z - other._z)
+        elif isinstance(other, (int, float)):
+            return _make(self._x - other, self._y - other, self._z - other)
+        else:
+            return NotImplemented
+
+    def __rsub__(self, other) -> 'KVector':
+        '''
+        Subtracts the vector from an operand
+        '''
+        if isinstance(other, KVector):
+            return other.__sub__(self)
+        elif isinstance(other, (int, float)):
+            return _make(other - self._x, other - self._y, other - self._z)
+        else:
+            return NotImplemented
+
+    def __ne__(self, other) -> bool:
+        if not isinstance(other, KVector):
+            return NotImplemented
+        return self._x != other._x or self._y != other._y or self._z != other._z
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, KVector):
+            return NotImplemented
+        return self._x == other._x and self._y == other._y and self._z == other._z
+
+    def __invert__(self) -> 'KVector':
+        '''
+        Returns the inverse of the vector
+        '''
+        return _make(-self._x, -self._y, -self._z)
+
+    def __neg__(self) -> 'KVector':
+        return self.__invert__()
+
+    def __abs__(self) -> 'KVector':
+        return self.abs
+
+    def __truediv__(self, other):
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+        return _make(self._x / other, self._y / other, self._z / other)
+
+    def __itruediv__ (self, other):
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+        self._x /= other; self._y /= other; self._z /= other
+        return self
+
+    def __floordiv__(self, other):
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+        return _make(self._x // other, self._y // other, self._z // other)
+
+    def __ifloordiv__(self, other):
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+        self._x //= other; self._y //= other; self._z //= other
+        return self
+
+    def __mul__(self, other):
+        if isinstance(other, (int, float)):
+            return _make(self._x * other, self._y * other, self._z * other)
+        elif isinstance(other, KVector):
+            return self._x * other._x + self._y * other._y + self._z * other._z
+        elif _isMatrix(other):
+            return other.__mul__(self)
+        return NotImplemented
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __imul__(self, other):
+        if isinstance(other, (int, float)):
+            self._x *= other; self._y *= other; self._z *= other
+            return self
+        elif isinstance(other, KVector):
+            return self.dot(other)
+        elif _isMatrix(other):
+            return other.__imul__(self)
+        return self
+
+    def __xor__(self, other):
+        '''
+        Calculates the cross product of the vector and an operand
+        '''
+        if not isinstance(other, KVector):
+            return NotImplemented
+        return self.cross(other)
+
+    def __rxor__(self, other):
+        '''
+        Calculates the cross product of the vector and an operand
+        '''
+        return self.__xor__(other)
+
+    def __mod__(self, other):
+        '''
+        Calculates an alternative product operation of the vector and a left-side operand
+
+        If other is a vector, calculates the component-wise product of the vectors
+        If other is a matrix, the vector is transformed by it, excluding translations
+        '''
+        if isinstance(other, KVector):
+            return _make(self._x * other._x, self._y * other._y, self._z * other._z)
+        else:
+            return NotImplemented
+
+    def __rmod__(self, other):
+        if _isMatrix(other):
+            return other.__rmod__(self)
+        return self.__xor__(other)
+
+    def __imod__(self, other):
+        if isinstance(other, KVector):
+            self._x *= other._x; self._y *= other._y; self._z *= other._z
+            return self
+        elif _isMatrix(other):
+            return other.__imod__(self)
+        return NotImplemented
+
+
+_new = object.__new__
+
+def _make(x: float, y: float, z: float) -> KVector:
+    '''
+    Build a vector from components that are known to be numbers, skips the argument checks
+    '''
+    vector = _new(KVector)
+    vector._x, vector._y, vector._z = x, y, z
+    return vector
+
+def _isMatrix(value) -> bool:
+    '''
+    KMatrix needs Maya, a KMatrix can only exist once its module is loaded so it is not imported here
+    '''
+    kMatrix = sys.modules.get('cmdk.attr.kMatrix')
+    return kMatrix is not None and isinstance(value, kMatrix.KMatrix)
+
+def _components(value) -> tuple:
+    '''
+    x, y, z of a KVector, MVector, MPoint or sequence, TypeError unless the first three are numbers
+    '''
+    try:
+        values = tuple(value)[:3]
+    except TypeError:
+        values = (value,)
+    if len(values) != 3 or not all(isinstance(n, Real) for n in values):
+        raise TypeError('Please ensure all parameters are numeric :{}'.format(value))
+    return float(values[0]), float(values[1]), float(values[2])
+
+
+
+if __name__ == '__main__':
+    v1 = KVector(1, 0, 0)
+
+    vec1 = KVector(v1)
+    vec1.x = 3
+
+    v3 = KVector((5, 6, 3))
+    v3 ^ vec1
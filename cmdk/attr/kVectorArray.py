@@ -0,0 +1,347 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+from cmdk.attr.kVector import KVector, _isMatrix
+
+
+class KVectorArray(object):
+    '''
+    N vectors in one (N, 3) float64 array, with the operators of KVector applied to every row at once
+    A single KVector, a (3,) array or a number on the other side is broadcast over the rows
+    A (3,) array is always a vector, per row numbers for * and / are an (N, 1) column: weights[:, None]
+    Only needs numpy, the module can be used outside Maya
+
+    array[i]        : zero-copy (3,) view of a row, writing to it writes to the array
+    array[i:j]      : zero-copy KVectorArray of the rows
+    array.vector(i) : the row as a KVector copy
+    '''
+    __slots__ = ('_array',)
+
+    def __init__(self, values=(), copy: bool = True):
+        if isinstance(values, KVectorArray):
+            values = values._array
+        elif isinstance(values, (list, tuple)) and values and isinstance(values[0], KVector):
+            values, copy = [(vector.x, vector.y, vector.z) for vector in values], False
+
+        array = np.array(values, dtype=np.float64) if copy else np.asarray(values, dtype=np.float64)
+        if array.size == 0:
+            array = array.reshape(0, 3)
+        elif array.shape == (3,):
+            array = array.reshape(1, 3)
+        if array.ndim != 2 or array.shape[1] != 3:
+            raise ValueError('Expected vectors of shape (N, 3), got {}'.format(array.shape))
+        self._array = array
+
+    @classmethod
+    def zeros(cls, count: int) -> 'KVectorArray':
+        return _wrap(np.zeros((count, 3)))
+
+    @property
+    def array(self) -> np.ndarray:
+        '''
+        The (N, 3) array itself, not a copy
+        '''
+        return self._array
+
+    def __array__(self, dtype=None, copy=None):
+        return self._array if dtype is None else self._array.astype(dtype)
+
+    def __repr__(self):
+        return 'KVectorArray({})'.format(np.array2string(self._array, separator=', ', threshold=12))
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    def __iter__(self):
+        return iter(self._array)
+
+    def vector(self, index: int) -> KVector:
+        x, y, z = self._array[index].tolist()
+        return KVector(x, y, z)
+
+    def toVectors(self) -> list[KVector]:
+        return [KVector(x, y, z) for x, y, z in self._array.tolist()]
+
+    # -------------------------------------------
+    @property
+    def x(self) -> np.ndarray:
+        return self._array[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self._array[:, 1]
+
+    @property
+    def z(self) -> np.ndarray:
+        return self._array[:, 2]
+
+    def isEqual(self, other, epsilon=1e-10) -> np.ndarray:
+        '''
+        Per row, tests component-wise if the difference is no bigger than epsilon
+        '''
+        return np.all(np.abs(self._array - _operand(other, True)) <= epsilon, axis=1)
+
+    def isZero(self, epsilon=1e-10) -> np.ndarray:
+        return np.all(np.abs(self._array) < epsilon, axis=1)
+
+    def setZero(self) -> 'self':
+        self._array[:] = 0.0
+        return self
+
+    @property
+    def getAverage(self) -> np.ndarray:
+        return self._array.mean(axis=1)
+
+    @property
+    def getSum(self) -> np.ndarray:
+        return self._array.sum(axis=1)
+
+    def setMin(self, other) -> 'self':
+        np.minimum(self._array, _operand(other, True), out=self._array)
+        return self
+
+    def setMax(self, other) -> 'self':
+        np.maximum(self._array, _operand(other, True), out=self._array)
+        return self
+
+    def min(self, other) -> 'KVectorArray':
+        return _wrap(np.minimum(self._array, _operand(other, True)))
+
+    def max(self, other) -> 'KVectorArray':
+        return _wrap(np.maximum(self._array, _operand(other, True)))
+
+    @property
+    def clamp01(self) -> 'KVectorArray':
+        return _wrap(np.clip(self._array, 0.0, 1.0))
+
+    @property
+    def getLength(self) -> np.ndarray:
+        return np.sqrt(np.einsum('ij,ij->i', self._array, self._array))
+
+    @property
+    def getSquaredLength(self) -> np.ndarray:
+        return np.einsum('ij,ij->i', self._array, self._array)
+
+    def getNormalized(self) -> 'KVectorArray':
+        '''
+        Every row scaled to length 1, zero rows stay zero
+        '''
+        return _wrap(self._array / _safeLength(self._array))
+
+    def normalize(self) -> 'self':
+        self._array /= _safeLength(self._array)
+        return self
+
+    @property
+    def getMin(self) -> np.ndarray:
+        return self._array.min(axis=1)
+
+    @property
+    def getMax(self) -> np.ndarray:
+        return self._array.max(axis=1)
+
+    def getRightRotated(self, rots) -> 'KVectorArray':
+        return _wrap(np.roll(self._array, rots % 3, axis=1))
+
+    def dot(self, other) -> np.ndarray:
+        return np.einsum('ij,ij->i', *np.broadcast_arrays(self._array, _operand(other, True)))
+
+    @property
+    def abs(self) -> 'KVectorArray':
+        return _wrap(np.abs(self._array))
+
+    def getAngle(self, other) -> np.ndarray:
+        '''
+        Angle (in radians) between every row and other
+        '''
+        other = _operand(other, True)
+        cross = np.cross(self._array, other)
+        return np.arctan2(np.sqrt(np.einsum('ij,ij->i', cross, cross)), self.dot(other))
+
+    def cross(self, other) -> 'KVectorArray':
+        return _wrap(np.cross(self._array, _operand(other, True)))
+
+    def getDistance(self, other) -> np.ndarray:
+        delta = self._array - _operand(other, True)
+        return np.sqrt(np.einsum('ij,ij->i', delta, delta))
+
+    @staticmethod
+    def GetDistance(v1, v2) -> np.ndarray:
+        return KVectorArray(v1, copy=False).getDistance(v2)
+
+    # -----------------------------------------------------
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return self._array[index]
+        return _wrap(self._array[index])
+
+    def __setitem__(self, index, value):
+        '''
+        value is a KVector, a KVectorArray, a number or any sequence of numbers that fits the rows selected by index
+        '''
+        target = self._array[index]
+        if isinstance(value, KVectorArray):
+            value = value._array
+        elif isinstance(value, KVector):
+            value = (value.x, value.y, value.z)
+        try:
+            value = np.asarray(value, dtype=np.float64)
+        except (TypeError, ValueError):
+            raise TypeError('Expected numbers or vectors, got {}'.format(value))
+        try:
+            np.broadcast_to(value, target.shape)
+        except ValueError:
+            raise ValueError('Cannot assign shape {} to rows of shape {}'.format(value.shape, target.shape))
+        self._array[index] = value
+
+    def __add__(self, other) -> 'KVectorArray':
+        other = _operand(other)
+        return NotImplemented if other is None else _wrap(self._array + other)
+
+    def __radd__(self, other) -> 'KVectorArray':
+        return self.__add__(other)
+
+    def __iadd__(self, other):
+        other = _operand(other)
+        if other is None:
+            return NotImplemented
+        self._array += other
+        return self
+
+    def __sub__(self, other) -> 'KVectorArray':
+        other = _operand(other)
+        return NotImplemented if other is None else _wrap(self._array - other)
+
+    def __rsub__(self, other) -> 'KVectorArray':
+        other = _operand(other)
+        return NotImplemented if other is None else _wrap(other - self._array)
+
+    def __isub__(self, other):
+        other = _operand(other)
+        if other is None:
+            return NotImplemented
+        self._array -= other
+        return self
+
+    def __invert__(self) -> 'KVectorArray':
+        return _wrap(-self._array)
+
+    def __neg__(self) -> 'KVectorArray':
+        return self.__invert__()
+
+    def __abs__(self) -> 'KVectorArray':
+        return self.abs
+
+    def __truediv__(self, other) -> 'KVectorArray':
+        other = _scalars(other, len(self._array))
+        return NotImplemented if other is None else _wrap(self._array / other)
+
+    def __itruediv__(self, other):
+        other = _scalars(other, len(self._array))
+        if other is None:
+            return NotImplemented
+        self._array /= other
+        return self
+
+    def __floordiv__(self, other) -> 'KVectorArray':
+        other = _scalars(other, len(self._array))
+        return NotImplemented if other is None else _wrap(self._array // other)
+
+    def __mul__(self, other):
+        '''
+        A number, or an (N, 1) column of numbers, scales the rows; vectors give the per row dot product
+        '''
+        scalars = _scalars(other, len(self._array))
+        if scalars is not None:
+            return _wrap(self._array * scalars)
+        if _isMatrix(other):
+            return _matrixArray(other).__rmul__(self)
+        other = _operand(other, True)
+        return NotImplemented if other is None else self.dot(other)
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __imul__(self, other):
+        scalars = _scalars(other, len(self._array))
+        if scalars is None:
+            return NotImplemented
+        self._array *= scalars
+        return self
+
+    def __xor__(self, other) -> 'KVectorArray':
+        other = _operand(other, True)
+        return NotImplemented if other is None else _wrap(np.cross(self._array, other))
+
+    def __rxor__(self, other) -> 'KVectorArray':
+        other = _operand(other, True)
+        return NotImplemented if other is None else _wrap(np.cross(other, self._array))
+
+    def __mod__(self, other) -> 'KVectorArray':
+        '''
+        Component-wise product, a KMatrix transforms the rows without translation like it does a KVector
+        '''
+        if _isMatrix(other):
+            return _matrixArray(other).__rmod__(self)
+        other = _operand(other, True)
+        return NotImplemented if other is None else _wrap(self._array * other)
+
+    def __rmod__(self, other) -> 'KVectorArray':
+        '''
+        A KMatrix on the left multiplies the rows as column vectors, like KMatrix.mulVectorlL
+        '''
+        if _isMatrix(other):
+            return _matrixArray(other).mulVectorlL(self)
+        return self.__mod__(other)
+
+    def __imod__(self, other):
+        other = _operand(other, True)
+        if other is None:
+            return NotImplemented
+        self._array *= other
+        return self
+
+
+_new = object.__new__
+
+def _wrap(array: np.ndarray) -> KVectorArray:
+    '''
+    KVectorArray around an (N, 3) array that is already checked, no copy
+    '''
+    vectors = _new(KVectorArray)
+    vectors._array = array
+    return vectors
+
+def _operand(other, vectorsOnly: bool = False):
+    '''
+    The other side as something numpy broadcasts against (N, 3), None when it is not supported
+    '''
+    if isinstance(other, KVectorArray):
+        return other._array
+    if isinstance(other, KVector):
+        return np.array((other.x, other.y, other.z))
+    if isinstance(other, np.ndarray) and other.shape[-1:] == (3,):
+        return other
+    if not vectorsOnly and isinstance(other, (int, float, np.number)):
+        return other
+    return None
+
+def _scalars(other, count: int):
+    '''
+    A number, or one number per row as an (N, 1) column, None for anything else
+    An (N,) array is not accepted, with three rows it could not be told apart from a vector
+    '''
+    if isinstance(other, (int, float, np.number)):
+        return other
+    if isinstance(other, np.ndarray) and other.shape == (count, 1):
+        return other
+    return None
+
+def _matrixArray(matrix):
+    from cmdk.attr.kMatrixArray import KMatrixArray
+    return KMatrixArray([matrix])
+
+def _safeLength(array: np.ndarray) -> np.ndarray:
+    length = np.sqrt(np.einsum('ij,ij->i', array, array))[:, None]
+    length[length == 0.0] = 1.0
+    return length
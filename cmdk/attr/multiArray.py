@@ -0,0 +1,151 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om2
+import cmdk.dg.omUtils as omUtils
+import cmdk.attr.plugValues as plugValues
+from cmdk.errors import AttrSetError, AttrValueError
+
+
+'''
+Multi attributes read and written as (indices, values) arrays
+values is (N,) for numeric elements, (N, children) for numeric compounds and (N, 4, 4) for matrices
+'''
+
+def elementKind(element: om2.MPlug) -> tuple:
+    '''
+    ('numeric', kind), ('compound', childKinds) or ('matrix',), TypeError for anything else
+    '''
+    kind = plugValues.numericKind(element)
+    if kind is not None:
+        return ('numeric', kind)
+    if element.isCompound:
+        kinds = tuple(plugValues.numericKind(element.child(index)) for index in range(element.numChildren()))
+        if None not in kinds:
+            return ('compound', kinds)
+    elif plugValues.isMatrix(element):
+        return ('matrix',)
+    raise TypeError('{} does not hold numeric, numeric compound or matrix elements'.format(omUtils.plugPath(element)))
+
+def readMulti(plug: om2.MPlug) -> tuple['np.ndarray', 'np.ndarray']:
+    '''
+    Existing logical indices in ascending order and their values, one pass over the physical elements
+    '''
+    _checkMulti(plug)
+    count    = plug.evaluateNumElements()
+    elements = [plug.elementByPhysicalIndex(index) for index in range(count)]
+    indices  = np.fromiter((element.logicalIndex() for element in elements), dtype=np.int64, count=count)
+    kind     = elementKind(elements[0] if elements else plug.elementByLogicalIndex(0))
+
+    if kind[0] == 'numeric':
+        values = np.fromiter((plugValues.getNumeric(element, kind[1]) for element in elements),
+                             dtype=np.float64, count=count)
+    elif kind[0] == 'compound':
+        values = np.array([[plugValues.getNumeric(element.child(index), childKind)
+                            for index, childKind in enumerate(kind[1])] for element in elements],
+                          dtype=np.float64).reshape(count, len(kind[1]))
+    else:
+        values = np.array([list(plugValues.getMatrix(element)) for element in elements],
+                          dtype=np.float64).reshape(count, 4, 4)
+
+    if count > 1 and np.any(np.diff(indices) < 0):
+        order = np.argsort(indices, kind='stable')
+        indices, values = indices[order], values[order]
+    return indices, values
+
+def writeMulti(plug: om2.MPlug, path: str, indices, values, undoable: bool = True):
+    '''
+    Write values at the given logical indices, elements not listed are left as they are
+    undoable=True  : one undo chunk, runs of consecutive numeric indices are written by one setAttr each
+    undoable=False : one MDGModifier and a single doIt(), not undoable
+    '''
+    _checkMulti(plug)
+    indices = _checkIndices(path, indices)
+    if not len(indices):
+        return
+    kind   = elementKind(plug.elementByLogicalIndex(int(indices[0])))
+    values = _shaped(path, kind, np.asarray(values, dtype=np.float64), len(indices))
+    order  = np.argsort(indices, kind='stable')
+    indices, values = indices[order], values[order]
+
+    if undoable:
+        _writeCommands(path, kind, indices, values)
+    else:
+        _writeModifier(plug, path, kind, indices, values)
+
+# ---------------------------------------------------------------------------------------
+
+def _checkMulti(plug: om2.MPlug):
+    if np is None:
+        raise ImportError('numpy is required to access multi attributes as arrays')
+    if not plug.isArray:
+        raise TypeError('{} is not a multi attribute'.format(omUtils.plugPath(plug)))
+
+def _checkIndices(path: str, indices) -> 'np.ndarray':
+    '''
+    Logical indices as int64, checked here so Maya never sees a slice like [-1:3]
+    '''
+    indices = np.asarray(indices).ravel()
+    if not indices.size:
+        return indices.astype(np.int64)
+    if not np.issubdtype(indices.dtype, np.integer):
+        raise AttrValueError(path, 'logical indices must be integers, got {}'.format(indices.dtype))
+    if indices.min() < 0:
+        raise AttrValueError(path, 'logical indices cannot be negative, got {}'.format(int(indices.min())))
+    if len(np.unique(indices)) != len(indices):
+        raise AttrValueError(path, 'logical indices must not repeat')
+    return indices.astype(np.int64)
+
+def _shaped(path: str, kind: tuple, values: 'np.ndarray', count: int) -> 'np.ndarray':
+    shape = {'numeric': (count,), 'compound': (count, len(kind[-1])), 'matrix': (count, 4, 4)}[kind[0]]
+    if values.size != int(np.prod(shape)):
+        raise AttrValueError(path, 'expected values of shape {}, got {}'.format(shape, values.shape))
+    return values.reshape(shape)
+
+def _writeCommands(path: str, kind: tuple, indices: 'np.ndarray', values: 'np.ndarray'):
+    '''
+    indices are sorted and unique, so every run of consecutive indices is a valid [start:end] slice
+    Only a chunk with a setAttr in it is undone, undoing an empty one would undo the user's previous action
+    '''
+    failed, applied = None, 0
+    with omUtils.undoChunk('cmdkSetArray'):
+        try:
+            if kind[0] == 'numeric':
+                for run in np.split(np.arange(len(indices)), np.flatnonzero(np.diff(indices) != 1) + 1):
+                    start, end = indices[run[0]], indices[run[-1]]
+                    cmds.setAttr('{}[{}:{}]'.format(path, start, end), *values[run].tolist())
+                    applied += 1
+            elif kind[0] == 'compound':
+                for index, row in zip(indices.tolist(), values.tolist()):
+                    cmds.setAttr('{}[{}]'.format(path, index), *row)
+                    applied += 1
+            else:
+                for index, matrix in zip(indices.tolist(), values.reshape(-1, 16).tolist()):
+                    cmds.setAttr('{}[{}]'.format(path, index), matrix, type='matrix')
+                    applied += 1
+        except (RuntimeError, TypeError, ValueError) as e:
+            failed = e
+    if failed is not None:
+        if applied and cmds.undoInfo(q=True, state=True):
+            cmds.undo()
+        raise AttrSetError(path, str(failed)) from failed
+
+def _writeModifier(plug: om2.MPlug, path: str, kind: tuple, indices: 'np.ndarray', values: 'np.ndarray'):
+    modifier = om2.MDGModifier()
+    for index, value in zip(indices.tolist(), values.tolist()):
+        element = plug.elementByLogicalIndex(index)
+        if kind[0] == 'numeric':
+            plugValues.writeNumeric(element, kind[1], value, modifier)
+        elif kind[0] == 'compound':
+            for child, (childKind, number) in enumerate(zip(kind[1], value)):
+                plugValues.writeNumeric(element.child(child), childKind, number, modifier)
+        else:
+            plugValues.setMatrix(element, om2.MMatrix([number for row in value for number in row]), modifier)
+    try:
+        modifier.doIt()
+    except RuntimeError as e:
+        modifier.undoIt()
+        raise AttrSetError(path, str(e)) from e
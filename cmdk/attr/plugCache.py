@@ -0,0 +1,66 @@
+from collections import OrderedDict
+import maya.api.OpenMaya as om2
+
+
+class PlugCache(object):
+    '''
+    Resolved MPlugs of one node keyed by attribute path, bounded and least recently used first out
+    Plugs stay valid through renames, the cache is dropped when the node is removed
+    Dynamic attributes can be removed behind cmdk's back (deleteAttr, undoing addAttr), their plugs are
+    checked against the node on every hit and evicted once the attribute is gone
+    '''
+    MAXSIZE = 256
+
+    def __init__(self, maxSize: int = None):
+        self.maxSize  = self.MAXSIZE if maxSize is None else maxSize
+        self._plugs   = OrderedDict()
+        self._dynamic = set()
+
+    def __len__(self) -> int:
+        return len(self._plugs)
+
+    def __contains__(self, attrPath: str) -> bool:
+        return attrPath in self._plugs
+
+    def get(self, attrPath: str) -> om2.MPlug | None:
+        plug = self._plugs.get(attrPath)
+        if plug is not None:
+            if attrPath in self._dynamic and not _isLive(plug):
+                self.discard(attrPath)
+                return None
+            self._plugs.move_to_end(attrPath)
+        return plug
+
+    def put(self, attrPath: str, plug: om2.MPlug) -> om2.MPlug:
+        self._plugs[attrPath] = plug
+        self._plugs.move_to_end(attrPath)
+        if om2.MFnAttribute(plug.attribute()).dynamic:
+            self._dynamic.add(attrPath)
+        while len(self._plugs) > self.maxSize:
+            self._dynamic.discard(self._plugs.popitem(last=False)[0])
+        return plug
+
+    def discard(self, attrPath: str):
+        '''
+        Forget attrPath and every element or child below it
+        '''
+        for key in [key for key in self._plugs
+                    if key == attrPath or key.startswith(attrPath + '.') or key.startswith(attrPath + '[')]:
+            del self._plugs[key]
+            self._dynamic.discard(key)
+
+    def clear(self):
+        self._plugs.clear()
+        self._dynamic.clear()
+
+
+def _isLive(plug: om2.MPlug) -> bool:
+    '''
+    The plug's attribute still exists and is still the one the node has under that name
+    '''
+    attr = plug.attribute()
+    if not om2.MObjectHandle(attr).isValid():
+        return False
+    name   = om2.MFnAttribute(attr).name
+    fnNode = om2.MFnDependencyNode(plug.node())
+    return fnNode.hasAttribute(name) and fnNode.attribute(name) == attr
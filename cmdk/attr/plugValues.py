@@ -0,0 +1,117 @@
+import maya.api.OpenMaya as om2
+
+
+'''
+Values read and written straight through the MPlug, numbers are in ui units like cmds.getAttr/setAttr
+Nothing written here goes through the undo queue
+'''
+_UNITS = {om2.MFnUnitAttribute.kAngle    : ('MAngle', om2.MAngle),
+          om2.MFnUnitAttribute.kDistance : ('MDistance', om2.MDistance),
+          om2.MFnUnitAttribute.kTime     : ('MTime', om2.MTime)}
+
+_INTS   = {om2.MFnNumericData.kByte, om2.MFnNumericData.kChar, om2.MFnNumericData.kShort,
+           om2.MFnNumericData.kInt, om2.MFnNumericData.kInt64}
+_FLOATS = {om2.MFnNumericData.kFloat, om2.MFnNumericData.kDouble}
+
+
+def numericKind(plug: om2.MPlug) -> tuple | None:
+    '''
+    ('unit', unitType), ('bool',), ('int',) or ('float',), None when the plug is not a numeric scalar
+    '''
+    if plug.isArray or plug.isCompound:
+        return None
+    attr = plug.attribute()
+    if attr.hasFn(om2.MFn.kUnitAttribute):
+        return ('unit', om2.MFnUnitAttribute(attr).unitType())
+    if attr.hasFn(om2.MFn.kEnumAttribute):
+        return ('int',)
+    if attr.hasFn(om2.MFn.kNumericAttribute):
+        numericType = om2.MFnNumericAttribute(attr).numericType()
+        if numericType == om2.MFnNumericData.kBoolean:
+            return ('bool',)
+        if numericType in _INTS:
+            return ('int',)
+        if numericType in _FLOATS:
+            return ('float',)
+    return None
+
+def isScalar(plug: om2.MPlug) -> bool:
+    return numericKind(plug) is not None
+
+def isMatrix(plug: om2.MPlug) -> bool:
+    attr = plug.attribute()
+    if attr.hasFn(om2.MFn.kMatrixAttribute):
+        return True
+    return attr.hasFn(om2.MFn.kTypedAttribute) and om2.MFnTypedAttribute(attr).attrType() == om2.MFnData.kMatrix
+
+def getMatrix(plug: om2.MPlug) -> om2.MMatrix:
+    '''
+    Matrix data of the plug, identity when nothing was ever written to it
+    '''
+    data = plug.asMObject()
+    return om2.MMatrix() if data.isNull() else om2.MFnMatrixData(data).matrix()
+
+def setMatrix(plug: om2.MPlug, matrix: om2.MMatrix, modifier: om2.MDGModifier = None):
+    data = om2.MFnMatrixData().create(matrix)
+    if modifier is None:
+        plug.setMObject(data)
+    else:
+        modifier.newPlugValue(plug, data)
+
+def getNumeric(plug: om2.MPlug, kind: tuple = None) -> float | int | bool | None:
+    '''
+    The plug's number, None when it is not a numeric scalar
+    kind skips the attribute lookup when the caller already knows it
+    '''
+    kind = kind or numericKind(plug)
+    if kind is None:
+        return None
+    if kind[0] == 'unit':
+        if kind[1] not in _UNITS:
+            return plug.asDouble()
+        typeName, unitClass = _UNITS[kind[1]]
+        return getattr(plug, 'as' + typeName)().asUnits(unitClass.uiUnit())
+    if kind[0] == 'bool':
+        return plug.asBool()
+    if kind[0] == 'int':
+        return plug.asInt()
+    return plug.asDouble()
+
+def setNumeric(plug: om2.MPlug, value, modifier: om2.MDGModifier = None) -> bool:
+    '''
+    Write a number, or a sequence of numbers to a numeric compound such as translate
+    With a modifier the write is only queued on it, nothing changes until modifier.doIt()
+    False when the plug is not numeric, the caller falls back to cmds.setAttr
+    '''
+    if plug.isCompound:
+        if not isinstance(value, (tuple, list)) or len(value) != plug.numChildren():
+            return False
+        children = [plug.child(index) for index in range(plug.numChildren())]
+        kinds    = [numericKind(child) for child in children]
+        if None in kinds:
+            return False
+        for child, kind, number in zip(children, kinds, value):
+            writeNumeric(child, kind, number, modifier)
+        return True
+
+    kind = numericKind(plug)
+    if kind is None or isinstance(value, (tuple, list, str)):
+        return False
+    writeNumeric(plug, kind, value, modifier)
+    return True
+
+def writeNumeric(plug: om2.MPlug, kind: tuple, value, modifier: om2.MDGModifier = None):
+    if kind[0] == 'unit' and kind[1] in _UNITS:
+        typeName, unitClass = _UNITS[kind[1]]
+        value = unitClass(value, unitClass.uiUnit())
+    elif kind[0] == 'bool':
+        typeName, value = 'Bool', bool(value)
+    elif kind[0] == 'int':
+        typeName, value = 'Int', int(value)
+    else:
+        typeName, value = 'Double', float(value)
+
+    if modifier is None:
+        getattr(plug, 'set' + typeName)(value)
+    else:
+        getattr(modifier, 'newPlugValue' + typeName)(plug, value)
@@ -1,27 +1,49 @@
-# -*- coding: utf-8 -*-
-from importlib import reload
-
-import cmdk.attr.attribute as attribute
-import cmdk.attr.attrUtils as attrUtils
-import cmdk.attr.get as get
-
-import cmdk.attr.kVector as kVector
-import cmdk.attr.kMatrix as kMatrix
-import cmdk.attr.KQuaternion as KQuaternion
-
-
-
-
-
-
-def reloadIt():
-    reload(attribute)
-    reload(attrUtils)
-    reload(get)
-    reload(kVector)
-    reload(kMatrix)
-    reload(KQuaternion)
-
-
-
+# -*- coding: utf-8 -*-
+from importlib import reload
+
+import cmdk.attr.attrPath as attrPath
+import cmdk.attr.plugCache as plugCache
+import cmdk.attr.codecs as codecs
+import cmdk.attr.schema as schema
+import cmdk.attr.plugValues as plugValues
+import cmdk.attr.transaction as transaction
+import cmdk.attr.multiArray as multiArray
+import cmdk.attr.attribute as attribute
+import cmdk.attr.attrUtils as attrUtils
+import cmdk.attr.compoundReader as compoundReader
+import cmdk.attr.get as get
+import cmdk.attr.attrReader as attrReader
+
+import cmdk.attr.kVector as kVector
+import cmdk.attr.kVectorArray as kVectorArray
+import cmdk.attr.kMatrix as kMatrix
+import cmdk.attr.kMatrixArray as kMatrixArray
+import cmdk.attr.KQuaternion as KQuaternion
+
+
+
+
+
+
+def reloadIt():
+    reload(attrPath)
+    reload(plugCache)
+    reload(codecs)
+    reload(schema)
+    reload(plugValues)
+    reload(transaction)
+    reload(multiArray)
+    reload(attribute)
+    reload(attrUtils)
+    reload(compoundReader)
+    reload(get)
+    reload(attrReader)
+    reload(kVector)
+    reload(kVectorArray)
+    reload(kMatrix)
+    reload(kMatrixArray)
+    reload(KQuaternion)
+
+
+
     print('-------------------- ATTR RELOAD : OK')
\ No newline at end of file
@@ -0,0 +1,96 @@
+import maya.cmds as cmds
+import maya.api.OpenMaya as om2
+import cmdk.attr.attrPath as attrPath
+import cmdk.attr.codecs as codecs
+
+
+class AttrSchema(object):
+    '''
+    What is static about an attribute: its getAttr type, multi-ness, compound children,
+    readable/writable and default value
+    kind tells GetAttribute.run which reader to use: message, string, compound or value
+    codec names the value codec of vector, matrix and quaternion attributes, None for the others
+    '''
+    __slots__ = ('typeName', 'kind', 'isMulti', 'children', 'readable', 'writable', 'default', 'codec')
+
+    KINDS = {'message': 'message', 'string': 'string', 'TdataCompound': 'compound'}
+
+    def __init__(self, typeName: str, isMulti: bool, children: tuple,
+                 readable: bool, writable: bool, default=None, attrName: str = '', childTypes: tuple = ()):
+        self.typeName = typeName
+        self.kind     = self.KINDS.get(typeName, 'value')
+        self.isMulti  = isMulti
+        self.children = children
+        self.readable = readable
+        self.writable = writable
+        self.default  = default
+        self.codec    = codecs.codecName(typeName, children, attrName, childTypes)
+
+    def __repr__(self):
+        return "AttrSchema('{}', kind='{}', isMulti={})".format(self.typeName, self.kind, self.isMulti)
+
+    @classmethod
+    def build(cls, plug: om2.MPlug, fullPath: str, nodePath: str) -> 'AttrSchema':
+        attr       = om2.MFnAttribute(plug.attribute())
+        typeName   = cmds.getAttr(fullPath, typ=True)
+        childAttrs = [plug.child(i).attribute() for i in range(plug.numChildren())] if plug.isCompound else []
+        children   = tuple(om2.MFnAttribute(child).name for child in childAttrs)
+        childTypes = tuple(_numericType(child) for child in childAttrs)
+        default    = None
+        if cls.KINDS.get(typeName, 'value') == 'value' and not plug.isArray:
+            try:
+                default = cmds.attributeQuery(attr.name, node=nodePath, listDefault=True)
+            except RuntimeError:
+                pass
+        return cls(typeName, plug.isArray, children, attr.readable, attr.writable, default, attr.name, childTypes)
+
+
+def _numericType(attr: om2.MObject) -> str | None:
+    '''
+    'double' for plain double children, what the quaternion codec checks, None for anything else
+    '''
+    if attr.hasFn(om2.MFn.kNumericAttribute) and \
+       om2.MFnNumericAttribute(attr).numericType() == om2.MFnNumericData.kDouble:
+        return 'double'
+    return None
+
+
+'''
+Static attributes look the same on every node of a type, they are shared here
+Dynamic attributes are kept by the node wrapper that owns them, as (MObjectHandle, AttrSchema)
+'''
+_STATIC = {}
+
+def shapeOf(attrName: str) -> tuple:
+    '''
+    Attribute path without its index values, 'input3D[4].input3Dx' and 'input3D[0].input3Dx' share a schema
+    '''
+    return tuple((name, index is not None) for name, index in attrPath.compilePath(attrName))
+
+def getSchema(plug: om2.MPlug, nodeType: str, nodePath: str, attrName: str,
+              dynamicCache: dict = None) -> AttrSchema:
+    '''
+    dynamicCache is the owning node's dict for dynamic attributes, without it they are built every time
+    Dynamic schemas are stored with the handle of the attribute they were built from
+    cmds.deleteAttr / addAttr, and undoing them, replace the attribute, the schema is rebuilt when it no longer matches
+    '''
+    fullPath = '{}.{}'.format(nodePath, attrName)
+    if plug.isDynamic:
+        if dynamicCache is None:
+            return AttrSchema.build(plug, fullPath, nodePath)
+        key, attr = shapeOf(attrName), plug.attribute()
+        entry     = dynamicCache.get(key)
+        if entry is not None and entry[0].isValid() and entry[0].object() == attr:
+            return entry[1]
+        schema = AttrSchema.build(plug, fullPath, nodePath)
+        dynamicCache[key] = (om2.MObjectHandle(attr), schema)
+        return schema
+
+    key    = (nodeType, shapeOf(attrName))
+    schema = _STATIC.get(key)
+    if schema is None:
+        schema = _STATIC[key] = AttrSchema.build(plug, fullPath, nodePath)
+    return schema
+
+def clear():
+    _STATIC.clear()
@@ -0,0 +1,244 @@
+import maya.cmds as cmds
+import maya.api.OpenMaya as om2
+import cmdk.dg.omUtils as omUtils
+import cmdk.attr.plugValues as plugValues
+from cmdk.errors import AttrSetError, AttrValueError, AttrConnectError, AttrGroupError
+
+
+'''
+Open batches, the innermost one collects the writes and connections made through Attribute
+'''
+_ACTIVE = []
+
+def current() -> 'AttrBatch | None':
+    return _ACTIVE[-1] if _ACTIVE else None
+
+
+class AttrBatch(object):
+    '''
+    Attribute writes and connections collected and applied together in order, all of them or none
+
+    undoable=True  : one command per operation inside a single undo chunk, undone as one step
+                     a failure undoes the chunk, so the undo queue has to be on
+    undoable=False : everything queued on one MDGModifier and applied by a single doIt()
+                     a failure is rolled back with undoIt(), the batch does not enter the undo queue
+    undoable=None  : follows the undo queue when the batch is applied, True while it is on, False while it is off
+                     what single connections and cmdk.setAttrs / connectAttrs use, so scripts running without undo keep working
+    Locked plugs are unlocked together before the writes and locked again afterwards
+    Connections already in place are skipped, all the failures are reported together
+
+    with cmdk.batch():
+        for joint, pose in zip(joints, poses):
+            joint.rotate = pose
+            joint.worldMatrix[0] >> decompose.inputMatrix
+    '''
+    def __init__(self, undoable: bool | None = True):
+        self.undoable = undoable
+        self._ops     = []
+
+    def __len__(self) -> int:
+        return len(self._ops)
+
+    def __enter__(self) -> 'self':
+        _ACTIVE.append(self)
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        _ACTIVE.remove(self)
+        if excType is None:
+            self.apply()
+        else:
+            self.discard()
+        return False
+
+    def set(self, attr, *args, **kwargs) -> 'self':
+        '''
+        Queue a write, args and kwargs are what Attribute.set takes
+        '''
+        if self.undoable is False and (kwargs or not args):
+            raise AttrValueError(attr.fullPath, 'only plain values can be written without undo, flags need undoable=True')
+        self._ops.append(('set', attr, args, kwargs, attr._codec(args)))
+        return self
+
+    def connect(self, src, dst) -> 'self':
+        '''
+        Queue src >> dst, Attributes or MPlugs, an existing input of dst is replaced
+        '''
+        self._ops.append(('connect', _toPlug(src), _toPlug(dst)))
+        return self
+
+    def disconnect(self, src, dst) -> 'self':
+        self._ops.append(('disconnect', _toPlug(src), _toPlug(dst)))
+        return self
+
+    def discard(self):
+        self._ops = []
+
+    def apply(self):
+        ops, self._ops = self._ops, []
+        ops, errors    = _validate(ops)
+        if errors:
+            raise _grouped(errors)
+        if not ops:
+            return
+        undoable = cmds.undoInfo(q=True, state=True)
+        if self.undoable is not None:
+            if self.undoable and not undoable:
+                raise AttrSetError('batch', 'the undo queue is off, an undoable batch could not be rolled back, use undoable=False')
+            undoable = self.undoable
+        locked = [op[1] for op in ops if op[0] == 'set' and op[1]._plug.isLocked]
+        if undoable:
+            self._applyCommands(ops, [attr.fullPath for attr in locked])
+        else:
+            self._applyModifier(ops, [attr._plug for attr in locked])
+
+    # ------------------------------------------------------------------------
+
+    def _applyCommands(self, ops: list, lockedPaths: list):
+        '''
+        applied counts the commands that made it into the chunk, Maya records no empty chunk
+        so undoing one with nothing in it would undo the user's previous action instead
+        '''
+        applied, errors = 0, []
+        cmds.undoInfo(openChunk=True, chunkName='cmdkBatch')
+        try:
+            for path in lockedPaths:
+                cmds.setAttr(path, lock=False)
+                applied += 1
+            for op in ops:
+                try:
+                    if op[0] == 'set':
+                        args, kwargs = op[2], op[3]
+                        if op[4] is not None:
+                            args, encoded = op[4].encode(args[0])
+                            kwargs = dict(kwargs, **encoded)
+                        cmds.setAttr(op[1].fullPath, *args, **kwargs)
+                    elif op[0] == 'connect':
+                        cmds.connectAttr(omUtils.plugPath(op[1]), omUtils.plugPath(op[2]), f=True)
+                    else:
+                        cmds.disconnectAttr(omUtils.plugPath(op[1]), omUtils.plugPath(op[2]))
+                    applied += 1
+                except (RuntimeError, TypeError, ValueError) as e:
+                    errors.append(_error(op, e))
+            for path in lockedPaths:
+                cmds.setAttr(path, lock=True)
+                applied += 1
+        finally:
+            cmds.undoInfo(closeChunk=True)
+        if errors:
+            if applied and cmds.undoInfo(q=True, state=True):
+                cmds.undo()
+            raise _grouped(errors)
+
+    def _applyModifier(self, ops: list, lockedPlugs: list):
+        '''
+        Everything is queued before anything is applied, a value that does not fit fails the whole batch untouched
+        '''
+        modifier, errors = om2.MDGModifier(), []
+        for op in ops:
+            if op[0] == 'set' and (op[3] or not op[2]):
+                errors.append(AttrValueError(op[1].fullPath, 'flags cannot be written without undo, turn the undo queue on'))
+                continue
+            try:
+                if not _queue(modifier, op):
+                    errors.append(AttrValueError(op[1].fullPath, 'only numeric values can be written without undo'))
+            except (RuntimeError, TypeError, ValueError) as e:
+                errors.append(_error(op, e))
+        if errors:
+            raise _grouped(errors)
+
+        for plug in lockedPlugs:
+            plug.isLocked = False
+        try:
+            modifier.doIt()
+        except RuntimeError as e:
+            modifier.undoIt()
+            raise _grouped(_diagnose(ops) or [AttrSetError('batch', str(e))]) from e
+        finally:
+            for plug in lockedPlugs:
+                plug.isLocked = True
+
+
+def _toPlug(attr) -> om2.MPlug:
+    return attr if isinstance(attr, om2.MPlug) else attr._plug
+
+def _validate(ops: list) -> tuple[list, list]:
+    '''
+    Drop connections already in place, collect the ones that cannot work before anything runs
+    Connect ops get the plug driving the destination at that point appended, the modifier disconnects it first
+    drivers follows the destinations as the earlier ops of the batch leave them, not as the scene is now
+    '''
+    valid, errors, drivers = [], [], {}
+    for op in ops:
+        if op[0] == 'set':
+            valid.append(op)
+            continue
+        src, dst = op[1], op[2]
+        key      = omUtils.plugPath(dst)
+        if key in drivers:
+            driver = drivers[key]
+        else:
+            sources = dst.connectedTo(True, False)
+            driver  = sources[0] if sources else None
+        if op[0] == 'disconnect':
+            if driver is not None and driver == src:
+                valid.append(op)
+                drivers[key] = None
+        elif driver is not None and driver == src:
+            continue
+        elif not om2.MFnAttribute(src.attribute()).readable:
+            errors.append(_error(op, 'the source is not readable'))
+        elif not om2.MFnAttribute(dst.attribute()).writable:
+            errors.append(_error(op, 'the destination is not writable'))
+        elif dst.isLocked:
+            errors.append(_error(op, 'the destination is locked'))
+        else:
+            valid.append(op + (driver,))
+            drivers[key] = src
+    return valid, errors
+
+def _queue(modifier: om2.MDGModifier, op: tuple) -> bool:
+    if op[0] == 'set':
+        args = op[2]
+        if op[4] is not None:
+            op[4].write(op[1]._plug, args[0], modifier)
+            return True
+        return plugValues.setNumeric(op[1]._plug, args[0] if len(args) == 1 else args, modifier)
+    if op[0] == 'connect':
+        if op[3] is not None:
+            modifier.disconnect(op[3], op[2])
+        modifier.connect(op[1], op[2])
+    else:
+        modifier.disconnect(op[1], op[2])
+    return True
+
+def _diagnose(ops: list) -> list:
+    '''
+    doIt() does not say which op failed, replay them in order on a modifier each
+    the later ops depend on the earlier ones, so everything applied is only undone at the end
+    '''
+    errors, applied = [], []
+    try:
+        for op in ops:
+            modifier = om2.MDGModifier()
+            try:
+                _queue(modifier, op)
+                modifier.doIt()
+                applied.append(modifier)
+            except (RuntimeError, TypeError, ValueError) as e:
+                errors.append(_error(op, e))
+    finally:
+        for modifier in reversed(applied):
+            modifier.undoIt()
+    return errors
+
+def _error(op: tuple, error: Exception | str) -> Exception:
+    message = str(error)
+    if op[0] == 'set':
+        if isinstance(error, (TypeError, ValueError)):
+            return AttrValueError(op[1].fullPath, message)
+        return AttrSetError(op[1].fullPath, message)
+    return AttrConnectError(omUtils.plugPath(op[1]), omUtils.plugPath(op[2]), message, op[0])
+
+def _grouped(errors: list) -> Exception:
+    return errors[0] if len(errors) == 1 else AttrGroupError(errors)
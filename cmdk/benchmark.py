@@ -0,0 +1,571 @@
+'''
+Timings for the hot paths of cmdk, run them from the script editor or mayapy
+
+import cmdk.benchmark as benchmark
+benchmark.benchAdd(20000)
+
+Every benchmark builds its own nodes and deletes them afterwards
+'''
+import sys
+import time
+import importlib
+import maya.cmds as cmds
+import maya.api.OpenMaya as om2
+import cmdk.attr.attrUtils as attrUtils
+from cmdk.dg.depNode import DepNode
+
+
+def timeIt(func, *args, repeat: int = 3, **kwargs) -> float:
+    '''
+    Best wall time of repeat runs, in seconds
+    '''
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def report(title: str, timings: dict, unit: str = 's') -> dict:
+    '''
+    Print the timings, speedups are relative to the first entry
+    unit labels other measures printed the same way, lower is better for them too
+    '''
+    base = next(iter(timings.values()))
+    print('-------------------- {}'.format(title))
+    for name, seconds in timings.items():
+        print('{:<24}{:>10.4f} {} {:>8.2f}x'.format(name, seconds, unit, base / seconds if seconds else 0.0))
+    return timings
+
+def _createNodes(count: int, nodeType: str) -> list[str]:
+    return [cmds.createNode(nodeType, n='cmdkBench{}'.format(i)) for i in range(count)]
+
+def _coldRun(func, *args):
+    '''
+    Start every run from an empty cache, the wrappers are dropped as soon as the run ends
+    '''
+    DepNode.clearCache()
+    func(*args)
+
+# add / ls --------------------------------------------------------------------
+
+def _legacyAdd(names: list) -> list:
+    '''
+    The per name path cmdk.add used before the bulk resolver
+    '''
+    from cmdk.dag.dagNode import DagNode
+    from cmdk.dg.omUtils import isDagNode
+    if not all(cmds.objExists(n) for n in names):
+        raise ValueError('Contains one or more invalid objects: {}'.format(names))
+    return [DagNode(nodeName=n) if isDagNode(n) else DepNode(nodeName=n) for n in names]
+
+def benchAdd(count: int = 20000, nodeType: str = 'joint', repeat: int = 3) -> dict:
+    from cmdk.dg.resolver import wrapNames
+    names = _createNodes(count, nodeType)
+    try:
+        return report('add {} {} nodes'.format(count, nodeType), {
+            'per name'  : timeIt(_coldRun, _legacyAdd, names, repeat=repeat),
+            'bulk'      : timeIt(_coldRun, wrapNames, names, repeat=repeat)})
+    finally:
+        cmds.delete(names)
+
+# hierarchy -------------------------------------------------------------------
+
+def _createHierarchy(count: int, chainLength: int) -> tuple[str, str]:
+    '''
+    A root joint with chains of chainLength joints below it, returns the root and the deepest joint
+    '''
+    root = cmds.createNode('joint', n='cmdkBenchRoot')
+    leaf = root
+    for i in range(count):
+        parent = root if i % chainLength == 0 else leaf
+        leaf   = cmds.createNode('joint', n='cmdkBench{}'.format(i), p=parent)
+    return root, cmds.ls(leaf, long=True)[0]
+
+def _legacyAllParent(name: str) -> list:
+    from cmdk.dag.dagNode import DagNode
+    parents = []
+    parent  = cmds.listRelatives(name, p=True, f=True)
+    while parent:
+        parents.append(DagNode(nodeName=parent[0]))
+        parent = cmds.listRelatives(parent[0], p=True, f=True)
+    return parents
+
+def _legacyChildren(name: str) -> list:
+    from cmdk.dag.dagNode import DagNode
+    children = []
+    for child in cmds.listRelatives(name, c=True, f=True, ni=True) or []:
+        shapes = cmds.listRelatives(name, s=True, f=True, ni=True) or []
+        if child not in shapes:
+            children.append(DagNode(nodeName=child))
+    return children
+
+def benchHierarchy(count: int = 5000, chainLength: int = 50, repeat: int = 3) -> dict:
+    from cmdk.dag.dagNode import DagNode
+    root, leaf = _createHierarchy(count, chainLength)
+    try:
+        rootNode, leafNode = DagNode(nodeName=root), DagNode(nodeName=leaf)
+        children = report('children of {} chains'.format(count // chainLength), {
+            'listRelatives'    : timeIt(_legacyChildren, root, repeat=repeat),
+            'traversal'        : timeIt(lambda: rootNode.children, repeat=repeat)})
+        allChildren = report('allChildren of {} joints'.format(count), {
+            'listRelatives -ad': timeIt(lambda: [DagNode(nodeName=c) for c in 
+                                        cmds.listRelatives(root, ad=True, f=True, ni=True)], repeat=repeat),
+            'traversal'        : timeIt(lambda: rootNode.allChildren, repeat=repeat)})
+        allParent = report('allParent of a {} joint chain'.format(chainLength), {
+            'listRelatives -p' : timeIt(_legacyAllParent, leaf, repeat=repeat),
+            'traversal'        : timeIt(lambda: leafNode.allParent, repeat=repeat)})
+        return {'children': children, 'allChildren': allChildren, 'allParent': allParent}
+    finally:
+        cmds.delete(root)
+
+# attributes ------------------------------------------------------------------
+
+def benchAttributePaths(count: int = 10000, repeat: int = 3) -> dict:
+    '''
+    Deep compound/multi access, the old path ran cmds.objExists on every dot
+    '''
+    from cmdk.dg.depNode import DepNode
+    name = cmds.createNode('plusMinusAverage', n='cmdkBenchMath')
+    try:
+        node     = DepNode(nodeName=name)
+        nodePath = node.fullPath
+        prefixes = ['input3D', 'input3D[3]', 'input3D[3].input3Dz']
+        return report('input3D[3].input3Dz x {}'.format(count), {
+            'objExists per dot': timeIt(lambda: [cmds.objExists('{}.{}'.format(nodePath, prefix)) 
+                                                 for _ in range(count) for prefix in prefixes], repeat=repeat),
+            'chained access'   : timeIt(lambda: [node.input3D[3].input3Dz for _ in range(count)], repeat=repeat),
+            'path access'      : timeIt(lambda: [node['input3D[3].input3Dz'] for _ in range(count)], repeat=repeat)})
+    finally:
+        cmds.delete(name)
+
+def _legacyGet(fullPath: str, attrName: str, nodePath: str):
+    typ = cmds.getAttr(fullPath, typ=True)
+    if typ in ('message', 'string', 'TdataCompound'):
+        return None
+    cmds.getAttr(fullPath, s=True); cmds.attributeQuery(attrName, node=nodePath, multi=True)
+    return cmds.getAttr(fullPath)
+
+def benchGetAttr(count: int = 5000, repeat: int = 3) -> dict:
+    '''
+    get() on many nodes of one type, the old dispatch asked Maya for the type on every call
+    '''
+    from cmdk.dg.depNode import DepNode
+    names = _createNodes(count, 'transform')
+    try:
+        nodes = [DepNode(nodeName=name) for name in names]
+        attrs = [node.translateX for node in nodes]
+        return report('translateX.get() x {}'.format(count), {
+            'per call queries': timeIt(lambda: [_legacyGet('{}.translateX'.format(name), 'translateX', name)
+                                                for name in names], repeat=repeat),
+            'schema cache'    : timeIt(lambda: [attr.get() for attr in attrs], repeat=repeat)})
+    finally:
+        cmds.delete(names)
+
+def _legacySet(fullPath: str, value):
+    locked = cmds.getAttr(fullPath, lock=True)
+    if locked: cmds.setAttr(fullPath, lock=False)
+    try:
+        cmds.setAttr(fullPath, value)
+    finally:
+        cmds.setAttr(fullPath, lock=locked)
+
+def benchSetAttr(count: int = 5000, repeat: int = 3) -> dict:
+    '''
+    Pose-style writes to unlocked attributes, the old set ran four commands per value
+    '''
+    from cmdk.dg.depNode import DepNode
+    names = _createNodes(count, 'transform')
+    try:
+        attrs = [DepNode(nodeName=name).rotateX for name in names]
+        return report('rotateX.set() x {}'.format(count), {
+            'lock toggling'  : timeIt(lambda: [_legacySet('{}.rotateX'.format(name), 10) for name in names], repeat=repeat),
+            'set'            : timeIt(lambda: [attr.set(10) for attr in attrs], repeat=repeat),
+            'set undoable=0' : timeIt(lambda: [attr.set(10, undoable=False) for attr in attrs], repeat=repeat)})
+    finally:
+        cmds.delete(names)
+
+def benchGetAttrs(count: int = 2000, repeat: int = 3) -> dict:
+    '''
+    Export-style reads of many attributes on many nodes
+    '''
+    import cmdk.attr.attrReader as attrReader
+    from cmdk.dg.depNode import DepNode
+    names = _createNodes(count, 'joint')
+    attrs = ['tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'sx', 'sy', 'sz', 'visibility']
+    try:
+        nodes   = [DepNode(nodeName=name) for name in names]
+        timings = {'get per attribute': timeIt(lambda: [[node[attr].get() for attr in attrs] for node in nodes], repeat=repeat),
+                   'getAttrs dict'    : timeIt(lambda: attrReader.getAttrs(nodes, attrs), repeat=repeat)}
+        if attrReader.np is not None:
+            timings['getAttrs array'] = timeIt(lambda: attrReader.getAttrs(nodes, attrs, asArray=True), repeat=repeat)
+        return report('{} attributes x {} joints'.format(len(attrs), count), timings)
+    finally:
+        cmds.delete(names)
+
+def benchSetAttrs(count: int = 2000, repeat: int = 3) -> dict:
+    '''
+    Applying a pose to many joints, separate set() calls against one batch
+    '''
+    import cmdk.core as core
+    from cmdk.dg.depNode import DepNode
+    names = _createNodes(count, 'joint')
+    attrs = ['rx', 'ry', 'rz']
+    try:
+        nodes  = [DepNode(nodeName=name) for name in names]
+        values = {node[attr]: 10.0 for node in nodes for attr in attrs}
+        return report('{} attributes x {} joints'.format(len(attrs), count), {
+            'set per attribute'  : timeIt(lambda: [attr.set(value) for attr, value in values.items()], repeat=repeat),
+            'setAttrs'           : timeIt(lambda: core.setAttrs(values), repeat=repeat),
+            'setAttrs undoable=0': timeIt(lambda: core.setAttrs(values, undoable=False), repeat=repeat)})
+    finally:
+        cmds.delete(names)
+
+def _legacyWire(pairs: list):
+    for src, dst in pairs:
+        if not cmds.isConnected(src, dst):
+            cmds.connectAttr(src, dst, f=True)
+    for src, dst in pairs:
+        if cmds.isConnected(src, dst):
+            cmds.disconnectAttr(src, dst)
+
+def benchConnections(count: int = 5000, repeat: int = 3) -> dict:
+    '''
+    Wiring and unwiring many plugs, every run connects all pairs and disconnects them again
+    '''
+    import cmdk.core as core
+    from cmdk.dg.depNode import DepNode
+    names = _createNodes(count * 2, 'transform')
+    try:
+        paths = [('{}.translate'.format(src), '{}.translate'.format(dst)) for src, dst in zip(names[::2], names[1::2])]
+        nodes = [DepNode(nodeName=name) for name in names]
+        attrs = [(src.translate, dst.translate) for src, dst in zip(nodes[::2], nodes[1::2])]
+        def wire(undoable):
+            core.connectAttrs(attrs, undoable=undoable)
+            core.disconnectAttrs(attrs, undoable=undoable)
+        return report('connect + disconnect x {}'.format(count), {
+            'isConnected per pair'  : timeIt(_legacyWire, paths, repeat=repeat),
+            'connectAttrs'          : timeIt(wire, True, repeat=repeat),
+            'connectAttrs undoable=0': timeIt(wire, False, repeat=repeat)})
+    finally:
+        cmds.delete(names)
+
+def benchCompound(count: int = 500, repeat: int = 3) -> dict:
+    '''
+    A multi compound with many elements, the flat reader ran commands for every child
+    '''
+    from cmdk.dg.depNode import DepNode
+    name = cmds.createNode('plusMinusAverage', n='cmdkBenchCompound')
+    try:
+        for index in range(count):
+            cmds.setAttr('{}.input3D[{}]'.format(name, index), index, index, index)
+        attr = DepNode(nodeName=name).input3D
+        return report('input3D x {} elements'.format(count), {
+            'compoundAttrData': timeIt(lambda: attr.get(), repeat=repeat),
+            'getTree'         : timeIt(lambda: attr.getTree(), repeat=repeat)})
+    finally:
+        cmds.delete(name)
+
+def benchMultiArray(count: int = 10000, repeat: int = 3) -> dict:
+    '''
+    Reading and writing a sparse numeric multi, element by element against the array calls
+    '''
+    from cmdk.dg.depNode import DepNode
+    name = cmds.createNode('plusMinusAverage', n='cmdkBenchMulti')
+    try:
+        indices = list(range(0, count * 2, 2))
+        for index in indices:
+            cmds.setAttr('{}.input1D[{}]'.format(name, index), index)
+        attr = DepNode(nodeName=name).input1D
+        return report('input1D x {} elements'.format(count), {
+            'element get/set'    : timeIt(lambda: [attr[index].set(attr[index].get()) for index in indices], repeat=repeat),
+            'getArray/setArray'  : timeIt(lambda: attr.setArray(*attr.getArray()), repeat=repeat),
+            'setArray undoable=0': timeIt(lambda: attr.setArray(*attr.getArray(), undoable=False), repeat=repeat)})
+    finally:
+        cmds.delete(name)
+
+def _legacyMessages(fullPath: str) -> list:
+    from cmdk.dag.dagNode import DagNode
+    import cmdk.dg.omUtils as omUtils
+    return [DagNode(nodeName=node) if omUtils.isDagNode(node) else DepNode(nodeName=node)
+            for node in cmds.listConnections(fullPath) or []]
+
+def benchMessages(count: int = 3000, repeat: int = 3) -> dict:
+    '''
+    A meta network whose message multi holds many children
+    '''
+    from cmdk.dg.depNode import DepNode
+    meta  = cmds.createNode('network', n='cmdkBenchMeta')
+    names = _createNodes(count, 'transform')
+    try:
+        cmds.addAttr(meta, ln='metaChilds', at='message', multi=True)
+        for index, name in enumerate(names):
+            cmds.connectAttr('{}.message'.format(name), '{}.metaChilds[{}]'.format(meta, index))
+        attr = DepNode(nodeName=meta).metaChilds
+        return report('metaChilds x {}'.format(count), {
+            'listConnections': timeIt(_legacyMessages, '{}.metaChilds'.format(meta), repeat=repeat),
+            'from the MPlug' : timeIt(lambda: attr.get(), repeat=repeat)})
+    finally:
+        cmds.delete(names + [meta])
+
+def benchCodecs(count: int = 5000, repeat: int = 3) -> dict:
+    '''
+    Matrix reads, getAttr lists wrapped into KMatrix against the codec reading MFnMatrixData
+    '''
+    from cmdk.attr.kMatrix import KMatrix
+    from cmdk.dg.depNode import DepNode
+    names = _createNodes(count, 'joint')
+    try:
+        attrs = [DepNode(nodeName=name).worldMatrix[0] for name in names]
+        paths = [attr.fullPath for attr in attrs]
+        return report('worldMatrix[0] x {}'.format(count), {
+            'getAttr + KMatrix': timeIt(lambda: [KMatrix(cmds.getAttr(path)) for path in paths], repeat=repeat),
+            'codec'            : timeIt(lambda: [attr.get() for attr in attrs], repeat=repeat)})
+    finally:
+        cmds.delete(names)
+
+# math ------------------------------------------------------------------------
+
+class _LegacyKVector(object):
+    '''
+    The KVector before the slotted rewrite, an MVector behind checked properties
+    only the parts benchVectorMath times are kept
+    '''
+    def __init__(self, x: float = 0,
+                       y: float = 0,
+                       z: float = 0):
+
+        self._omVector = x if isinstance(x, (self.__class__, om2.MVector, list, tuple)) else (x, y, z)
+
+    def __iter__(self):
+        return (i for i in (self.x, self.y, self.z))
+
+    @property
+    def _omVector(self) -> om2.MVector:
+        return self.__omVector
+
+    @_omVector.setter
+    @attrUtils.checkVectorType
+    def _omVector(self, value):
+        self.__omVector = om2.MVector(*value)
+
+    @property
+    def x(self) -> float:
+        return self._omVector.x
+
+    @x.setter
+    @attrUtils.checkNumberType
+    def x(self, value):
+        self._omVector.x = value
+
+    @property
+    def y(self) -> float:
+        return self._omVector.y
+
+    @y.setter
+    @attrUtils.checkNumberType
+    def y(self, value):
+        self._omVector.y = value
+
+    @property
+    def z(self) -> float:
+        return self._omVector.z
+
+    @z.setter
+    @attrUtils.checkNumberType
+    def z(self, value):
+        self._omVector.z = value
+
+    def getNormalized(self) -> '_LegacyKVector':
+        nv = self._omVector.normal()
+        return _LegacyKVector(nv.x, nv.y, nv.z)
+
+    def dot(self, other) -> float:
+        return self._omVector * other._omVector
+
+    def cross(self, other) -> '_LegacyKVector':
+        return _LegacyKVector(self._omVector ^ other._omVector)
+
+    def __add__(self, other) -> '_LegacyKVector':
+        if isinstance(other, self.__class__):
+            addVec = self._omVector + other._omVector
+            return _LegacyKVector(addVec.x, addVec.y, addVec.z)
+        elif isinstance(other, (int, float, complex)):
+            return _LegacyKVector(self.x + other, self.y + other, self.z + other)
+        return NotImplemented
+
+    def __mul__(self, other):
+        from cmdk.attr.kMatrix import KMatrix
+
+        if isinstance(other, (int, float, complex)):
+            return _LegacyKVector(self.x * other, self.y * other, self.z * other)
+        elif isinstance(other, self.__class__):
+            return self.dot(other)
+        elif isinstance(other, KMatrix):
+            return other.__mul__(self)
+        return NotImplemented
+
+    @attrUtils.checkClass
+    def __xor__(self, other):
+        return self.cross(other)
+
+def benchVectorMath(count: int = 100000, repeat: int = 3) -> dict:
+    '''
+    The MVector backed KVector, the slotted KVector and raw MVector side by side
+    for the operations of alignment and mirroring tools
+    '''
+    from cmdk.attr.kVector import KVector
+    pairs = {'legacy KVector': [(_LegacyKVector(i, i + 1, i + 2), _LegacyKVector(i + 2, i, i + 1)) for i in range(count)],
+             'KVector'       : [(KVector(i, i + 1, i + 2), KVector(i + 2, i, i + 1)) for i in range(count)],
+             'MVector'       : [(om2.MVector(i, i + 1, i + 2), om2.MVector(i + 2, i, i + 1)) for i in range(count)]}
+    operations = {'add'      : lambda a, b: a + b,
+                  'mul'      : lambda a, b: a * 2.0,
+                  'dot'      : lambda a, b: a * b,
+                  'cross'    : lambda a, b: a ^ b,
+                  'normalize': lambda a, b: a.normal() if isinstance(a, om2.MVector) else a.getNormalized()}
+    return {name: report('{} x {}'.format(name, count), {
+                label: timeIt(lambda: [operation(a, b) for a, b in vectors], repeat=repeat)
+                for label, vectors in pairs.items()})
+            for name, operation in operations.items()}
+
+def benchVectorArray(count: int = 100000, repeat: int = 3) -> dict:
+    '''
+    The same operations on a list of KVector and on one KVectorArray
+    '''
+    from cmdk.attr.kVector import KVector
+    from cmdk.attr.kVectorArray import KVectorArray
+    vectors = [KVector(i, i + 1, i + 2) for i in range(count)]
+    others  = [KVector(i + 2, i, i + 1) for i in range(count)]
+    array, otherArray = KVectorArray(vectors), KVectorArray(others)
+    offset = KVector(1, 2, 3)
+    operations = {'add'      : (lambda: [a + b for a, b in zip(vectors, others)],    lambda: array + otherArray),
+                  'offset'   : (lambda: [a + offset for a in vectors],               lambda: array + offset),
+                  'dot'      : (lambda: [a * b for a, b in zip(vectors, others)],    lambda: array * otherArray),
+                  'cross'    : (lambda: [a ^ b for a, b in zip(vectors, others)],    lambda: array ^ otherArray),
+                  'normalize': (lambda: [a.getNormalized() for a in vectors],        lambda: array.getNormalized()),
+                  'distance' : (lambda: [a.getDistance(b) for a, b in zip(vectors, others)], lambda: array.getDistance(otherArray))}
+    return {name: report('{} x {}'.format(name, count), {
+                'KVector list': timeIt(loop, repeat=repeat),
+                'KVectorArray': timeIt(vectorized, repeat=repeat)})
+            for name, (loop, vectorized) in operations.items()}
+
+def benchMatrixArray(count: int = 20000, repeat: int = 3) -> dict:
+    '''
+    World matrices and offsets for a list of KMatrix against one KMatrixArray
+    '''
+    from cmdk.attr.kVector import KVector
+    from cmdk.attr.kMatrix import KMatrix
+    from cmdk.attr.kMatrixArray import KMatrixArray
+    locals_  = [KMatrix(KVector(1, 0, 0), KVector(0, 1, 0), KVector(0, 0, 1), KVector(i, 1, 0)) for i in range(count)]
+    parents  = [KMatrix(KVector(0, 1, 0), KVector(-1, 0, 0), KVector(0, 0, 1), KVector(0, i, 2)) for i in range(count)]
+    offset   = KVector(1, 2, 3)
+    localArray, parentArray = KMatrixArray(locals_), KMatrixArray(parents)
+    operations = {'multiply' : (lambda: [a * b for a, b in zip(locals_, parents)], lambda: localArray * parentArray),
+                  'inverse'  : (lambda: [a.inverse() for a in locals_],           lambda: localArray.inverse()),
+                  'transform': (lambda: [a * offset for a in locals_],            lambda: localArray * offset),
+                  'axes'     : (lambda: [(a.v1, a.v2, a.v3, a.off) for a in locals_],
+                                lambda: (localArray.v1, localArray.v2, localArray.v3, localArray.off))}
+    return {name: report('{} x {}'.format(name, count), {
+                'KMatrix list': timeIt(loop, repeat=repeat),
+                'KMatrixArray': timeIt(vectorized, repeat=repeat)})
+            for name, (loop, vectorized) in operations.items()}
+
+def _allocations(func, count: int) -> dict:
+    '''
+    Python allocations of count calls, blocks still held by the results and the peak while they ran
+    Memory Maya allocates on its own side is not traced
+    '''
+    import tracemalloc
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        before  = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        results = [func() for _ in range(count)]
+        peak    = tracemalloc.get_traced_memory()[1]
+        after   = tracemalloc.take_snapshot()
+    finally:
+        if started:
+            tracemalloc.stop()
+    held = sum(stat.count_diff for stat in after.compare_to(before, 'filename') if stat.count_diff > 0)
+    del results
+    return {'blocks per call': held / count, 'peak bytes per call': peak / count}
+
+def _legacyMatrix(matrix):
+    '''
+    What KMatrix(matrix) did before: 16 floats listed, sliced into rows, rebuilt
+    '''
+    values = [*matrix]
+    return om2.MMatrix((values[0:4], values[4:8], values[8:12], values[12:16]))
+
+def benchMatrixAllocations(count: int = 10000) -> dict:
+    '''
+    Allocation counts of KMatrix construction, axis access and in-place ops against the older paths
+    '''
+    from cmdk.attr.kVector import KVector
+    from cmdk.attr.kMatrix import KMatrix
+    source = om2.MMatrix((1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 1, 2, 3, 1))
+    flat   = list(source)
+    matrix = KMatrix.adopt(om2.MMatrix(source))
+    other  = KMatrix.adopt(om2.MMatrix(source))
+
+    def legacyAxis():
+        omMatrix = matrix._omMatrix
+        return KVector(om2.MVector(omMatrix[12], omMatrix[13], omMatrix[14]))
+
+    def legacyAdd():
+        matrix._omMatrix = KMatrix.matrixtoVectors(matrix._omMatrix + other._omMatrix)
+
+    def add():
+        target = matrix
+        target += other
+
+    cases = {'construct from MMatrix': {'legacy': lambda: _legacyMatrix(source),         'KMatrix(m)': lambda: KMatrix(source),
+                                        'adopt': lambda: KMatrix.adopt(om2.MMatrix(source))},
+             'construct from floats' : {'legacy': lambda: _legacyMatrix(flat),           'adopt': lambda: KMatrix.adopt(flat)},
+             'axis'                  : {'legacy': legacyAxis,                            'off': lambda: matrix.off},
+             'in-place add'          : {'legacy': legacyAdd,                             '+=': add}}
+    results = {}
+    for name, funcs in cases.items():
+        stats = {label: _allocations(func, count) for label, func in funcs.items()}
+        results[name] = {measure: report('{} x {} : {}'.format(name, count, measure),
+                                         {label: values[measure] for label, values in stats.items()}, unit=unit)
+                         for measure, unit in (('blocks per call', 'blocks'), ('peak bytes per call', 'bytes'))}
+    return results
+
+# import ----------------------------------------------------------------------
+
+def _cmdkModules() -> list[str]:
+    return sorted(name for name in sys.modules if name == 'cmdk' or name.startswith('cmdk.'))
+
+def benchImport() -> dict:
+    '''
+    Re-import cmdk from scratch and report the time and the modules loaded at every stage
+    Wrappers created before the run belong to the old classes, run this in a fresh session
+    '''
+    for name in _cmdkModules():
+        if name != __name__:
+            del sys.modules[name]
+
+    stages = {}
+    def stage(title, func):
+        before = set(_cmdkModules())
+        start  = time.perf_counter()
+        func()
+        stages[title] = {'seconds': time.perf_counter() - start,
+                         'modules': sorted(set(_cmdkModules()) - before)}
+
+    stage('import cmdk', lambda: importlib.import_module('cmdk'))
+    cmdk = sys.modules['cmdk']
+    stage('cmdk.vector', lambda: cmdk.vector(1, 2, 3))
+    stage('cmdk.ls'    , lambda: cmdk.ls(type='time'))
+    stage('node type check', lambda: cmdk.createDepNode('network').delete())
+
+    from cmdk.dg.nodeTypes import registry
+    print('-------------------- import')
+    for title, result in stages.items():
+        print('{:<24}{:>10.4f} s {:>4} modules'.format(title, result['seconds'], len(result['modules'])))
+    print('node types loaded     : {}'.format(registry._types is not None))
+    return stages
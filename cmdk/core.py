@@ -1,52 +1,120 @@
-from typing import Union
-import maya.cmds as cmds
-from cmdk.dg.omUtils import isDagNode
-from cmdk.dg.depNode import DepNode
-from cmdk.dag.dagNode import DagNode
-from cmdk.attr.kVector import KVector
-from cmdk.attr.kMatrix import KMatrix
-
-def vector(x=0, y=0, z=0):
-    return KVector(x, y, z)
-    
-def matrix(v1=KVector(1, 0, 0), v2=KVector(0, 1, 0), v3=KVector(0, 0, 1), off=KVector(0, 0, 0)):
-    return KMatrix(v1, v2, v3, off)
-
-def createDagNode(typ: str, name :str = '') -> DagNode:
-    return DagNode(typ, name)
-    
-def createDepNode(typ: str, name :str = '') -> DepNode:
-    return DepNode(typ, name)
-    
-def add(name: Union[str, tuple, list]) -> DepNode | DagNode:
-    if isinstance(name, str):
-        if not cmds.objExists(name):
-            raise ValueError('The specified object does not exist: {}'.format(name))
-        return DagNode(nodeName=name) if isDagNode(name) else DepNode(nodeName=name)
-    
-    elif isinstance(name, (tuple, list)):
-        if not all(cmds.objExists(_n) for _n in name):
-            raise ValueError('Contains one or more invalid objects: {}'.format(name))
-        return [DagNode(nodeName=_n) if isDagNode(_n) else DepNode(nodeName=_n) for _n in name]
-    else:
-         raise ValueError('Invalid input type: {}. Expected str, tuple, or list.'.format(type(name).__name__))
-
-def getCache() -> dict:
-    return DepNode.getCache()
-    
-def clearCache() -> None:
-    return DepNode.clearCache()
-    
-def removeFromCache(uuid: str) -> None:
-    return DepNode.removeFromCache(uuid)
-    
-def delete(nodes, *args, **kwargs):
-    cmds.delete(str(nodes.lock(False)) if not isinstance(nodes, (tuple, list)) 
-    else (str(n.lock(False)) for n in nodes), *args, **kwargs)
-    
-def ls(*args, **kwargs):
-    nodes = cmds.ls(*args, **kwargs)
-    return [DagNode(nodeName=n) if isDagNode(n) else DepNode(nodeName=n) for n in nodes] 
-
-    
+from typing import Union
+import maya.cmds as cmds
+from cmdk.dg.resolver import wrapNames
+from cmdk.dg.depNode import DepNode
+from cmdk.dg.nodeIter import iterNodes
+from cmdk.dg.nodeEvents import EventBus, NodeCacheInvalidator
+from cmdk.dag.dagNode import DagNode
+from cmdk.dag.deleter import deleteNodes
+from cmdk.kMath import vector, matrix
+import cmdk.attr.attrReader as attrReader
+from cmdk.attr.transaction import AttrBatch
+
+def createDagNode(typ: str, name :str = '') -> DagNode:
+    return DagNode(typ, name)
+    
+def createDepNode(typ: str, name :str = '') -> DepNode:
+    return DepNode(typ, name)
+    
+def add(name: Union[str, tuple, list]) -> DepNode | DagNode:
+    if isinstance(name, str):
+        try:
+            return wrapNames([name])[0]
+        except ValueError:
+            raise ValueError('The specified object does not exist: {}'.format(name)) from None
+    
+    elif isinstance(name, (tuple, list)):
+        return wrapNames(name)
+    else:
+         raise ValueError('Invalid input type: {}. Expected str, tuple, or list.'.format(type(name).__name__))
+
+def getCache() -> dict:
+    return DepNode.getCache()
+    
+def clearCache() -> None:
+    return DepNode.clearCache()
+    
+def removeFromCache(uuid: str) -> None:
+    return DepNode.removeFromCache(uuid)
+    
+def enableCacheEvents(source: EventBus = None) -> NodeCacheInvalidator:
+    '''
+    Opt in to scene message driven cache invalidation
+    source defaults to the Maya message bus, pass an EventBus to drive it by hand
+    '''
+    disableCacheEvents()
+    return NodeCacheInvalidator(source).enable()
+    
+def disableCacheEvents() -> None:
+    if DepNode._TRACKER is not None:
+        DepNode._TRACKER.disable()
+    
+def delete(nodes, *args, **kwargs):
+    '''
+    Unlock and delete nodes with their hierarchies in one undo step, connected nodes are not protected
+    '''
+    deleteNodes(nodes, *args, protectConnections=False, **kwargs)
+    
+def getAttrs(nodes, names: list, asArray: bool = False) -> dict:
+    '''
+    Read names on every node in one pass, plugs are resolved once per node
+    {node full path: {name: value}}, or with asArray=True a (nodes, names) float array of numeric scalar attributes
+    '''
+    nodes = nodes if isinstance(nodes, (tuple, list)) else [nodes]
+    names = [names] if isinstance(names, str) else list(names)
+    strs  = [node for node in nodes if isinstance(node, str)]
+    if strs:
+        wrapped = iter(wrapNames(strs))
+        nodes   = [next(wrapped) if isinstance(node, str) else node for node in nodes]
+    return attrReader.getAttrs(nodes, names, asArray)
+    
+def batch(undoable: bool = True) -> AttrBatch:
+    '''
+    Collect every Attribute.set made inside the with block and apply them together when it ends
+    undoable=False applies numeric values through one MDGModifier, faster but not undoable
+    '''
+    return AttrBatch(undoable)
+    
+def setAttrs(values: dict, undoable: bool | None = None) -> None:
+    '''
+    Set many attributes as one transaction, all of them or none
+    undoable=None follows the undo queue, True refuses to run while it is off
+    values: {'node.attr' or Attribute: value}, a tuple or list value is passed on as the setAttr arguments
+    '''
+    attrs = _toAttributes(values)
+    with AttrBatch(undoable) as attrBatch:
+        for key, value in values.items():
+            attrBatch.set(attrs[key] if isinstance(key, str) else key, *(value if isinstance(value, (tuple, list)) else (value,)))
+    
+def connectAttrs(pairs: list, undoable: bool | None = None) -> None:
+    '''
+    Connect every (src, dst) pair as one transaction, pairs already connected are skipped
+    src and dst are Attributes or 'node.attr' strings, all the failures are raised together
+    '''
+    _pairsBatch(pairs, undoable, 'connect')
+    
+def disconnectAttrs(pairs: list, undoable: bool | None = None) -> None:
+    _pairsBatch(pairs, undoable, 'disconnect')
+    
+def _pairsBatch(pairs: list, undoable: bool | None, action: str):
+    pairs = [tuple(pair) for pair in pairs]
+    attrs = _toAttributes([attr for pair in pairs for attr in pair])
+    with AttrBatch(undoable) as attrBatch:
+        for src, dst in pairs:
+            getattr(attrBatch, action)(*(attrs[attr] if isinstance(attr, str) else attr for attr in (src, dst)))
+            
+def _toAttributes(attrs) -> dict:
+    '''
+    {'node.attr': Attribute} of the strings in attrs, the nodes are resolved together
+    '''
+    paths = list(dict.fromkeys(attr for attr in attrs if isinstance(attr, str)))
+    if not paths:
+        return {}
+    nodes = wrapNames([path.split('.', 1)[0] for path in paths])
+    return {path: node[path.split('.', 1)[1]] for path, node in zip(paths, nodes)}
+    
+def ls(*args, **kwargs):
+    return wrapNames(cmds.ls(*args, **kwargs) or [])
+
+    
     
\ No newline at end of file
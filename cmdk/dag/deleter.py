@@ -0,0 +1,94 @@
+import maya.cmds as cmds
+import maya.api.OpenMaya as om2
+import cmdk.dg.omUtils as omUtils
+import cmdk.dag.traversal as traversal
+from cmdk.dg.depNode import DepNode
+from cmdk.dg.resolver import resolveNodes
+
+
+def deleteNodes(nodes, *args, protectConnections: bool = True, **kwargs):
+    '''
+    Delete nodes and their whole hierarchies as one undo step
+
+    nodes              : a wrapper, a name, or a list of them, a name that does not exist raises ValueError
+    protectConnections : lock the connected nodes while deleting so they are not deleted with the targets
+    args, kwargs       : passed on to cmds.delete
+    Locked targets are unlocked for the delete, the ones a flag such as ch=True leaves in place are locked again
+    '''
+    roots = _toApiObjects(nodes if isinstance(nodes, (tuple, list)) else [nodes])
+    if not roots:
+        return
+
+    '''
+    Collect every target iteratively, a root below another root is deleted with it
+    '''
+    subtrees = [[root, *(traversal.iterDescendantPaths(root, intermediates=True)
+                         if isinstance(root, om2.MDagPath) else [])] for root in roots]
+    nested   = {_hashCode(item) for subtree in subtrees for item in subtree[1:]}
+    roots    = [root for root in roots if _hashCode(root) not in nested]
+    targets  = list({_hashCode(item): item for subtree in subtrees for item in subtree}.values())
+    handles  = [om2.MObjectHandle(_toMObject(item)) for item in targets]
+    names    = [_nameOf(item) for item in targets]
+
+    neighbours = []
+    protected  = [_nameOf(item) for item in targets if not _toMObject(item).hasFn(om2.MFn.kShape)]
+    if protectConnections and protected:
+        connected  = cmds.listConnections(protected, scn=True) or []
+        targetSet  = set(names)
+        neighbours = [node for node in dict.fromkeys(cmds.ls(connected, long=True) or [])
+                      if node not in targetSet]
+
+    with omUtils.undoChunk('cmdkDelete'):
+        lockStates = cmds.lockNode(neighbours, q=True, lock=True) if neighbours else []
+        if neighbours:
+            cmds.lockNode(neighbours, lock=True)
+        locked = [(handle, name) for handle, name, state in zip(handles, names, cmds.lockNode(names, q=True, lock=True))
+                  if state]
+        try:
+            if locked:
+                cmds.lockNode([name for _, name in locked], lock=False)
+            cmds.delete([_nameOf(root) for root in roots], *args, **kwargs)
+        finally:
+            unlocked = [node for node, state in zip(neighbours, lockStates) if not state]
+            if unlocked:
+                cmds.lockNode(unlocked, lock=False)
+            survivors = [_nameOf(_survivor(handle)) for handle, _ in locked if handle.isValid()]
+            if survivors:
+                cmds.lockNode(survivors, lock=True)
+
+    for handle in handles:
+        node = DepNode._lookup(handle) if not handle.isValid() else None
+        if node is not None:
+            node._invalidate()
+
+def _toApiObjects(nodes: list) -> list[om2.MObject | om2.MDagPath]:
+    apiObjects = []
+    names      = [node for node in nodes if isinstance(node, str)]
+    resolved   = dict(zip(names, resolveNodes(names)))
+    for node in nodes:
+        if isinstance(node, str):
+            apiNode = resolved[node]
+            if not apiNode:
+                raise ValueError('No object matches name: {}'.format(node))
+        elif isinstance(node, DepNode):
+            apiNode = node.apiNode
+            if isinstance(apiNode, om2.MFnDependencyNode):
+                apiNode = apiNode.object()
+        else:
+            apiNode = node
+        if apiNode:
+            apiObjects.append(apiNode)
+    return apiObjects
+
+def _survivor(handle: om2.MObjectHandle) -> om2.MObject | om2.MDagPath:
+    mobj = handle.object()
+    return om2.MDagPath.getAPathTo(mobj) if mobj.hasFn(om2.MFn.kDagNode) else mobj
+
+def _toMObject(item: om2.MObject | om2.MDagPath) -> om2.MObject:
+    return item.node() if isinstance(item, om2.MDagPath) else item
+
+def _hashCode(item: om2.MObject | om2.MDagPath) -> int:
+    return omUtils.getHashCode(_toMObject(item))
+
+def _nameOf(item: om2.MObject | om2.MDagPath) -> str:
+    return item.fullPathName() if isinstance(item, om2.MDagPath) else om2.MFnDependencyNode(item).name()
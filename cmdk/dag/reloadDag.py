@@ -1,11 +1,15 @@
-from importlib import reload
-import cmdk.dag.dagNode as dagNode
-
-
-
-def reloadIt():
-    reload(dagNode)
-
-
-
+from importlib import reload
+import cmdk.dag.traversal as traversal
+import cmdk.dag.dagNode as dagNode
+import cmdk.dag.deleter as deleter
+
+
+
+def reloadIt():
+    reload(traversal)
+    reload(dagNode)
+    reload(deleter)
+
+
+
     print('-------------------- DAG RELOAD : OK')
\ No newline at end of file
@@ -0,0 +1,61 @@
+from collections import deque
+import maya.api.OpenMaya as om2
+import cmdk.dg.omUtils as omUtils
+
+
+def isVisibleShape(mobj: om2.MObject) -> bool:
+    '''
+    Shape that is not an intermediate object, what listRelatives -s -ni returns
+    '''
+    return not om2.MFnDagNode(mobj).isIntermediateObject
+
+def iterChildPaths(path: om2.MDagPath, shapes: bool = False, transforms: bool = True, 
+                   intermediates: bool = False):
+    '''
+    Direct children of path, intermediate shapes are skipped unless intermediates is set
+    '''
+    for index in range(path.childCount()):
+        mobj = path.child(index)
+        if mobj.hasFn(om2.MFn.kShape):
+            if not shapes or not (intermediates or isVisibleShape(mobj)):
+                continue
+        elif not transforms:
+            continue
+        child = om2.MDagPath(path)
+        child.push(mobj)
+        yield child
+
+def iterDescendantPaths(path: om2.MDagPath, depth: int = None, typ: str | list = None,
+                        breadthFirst: bool = False, shapes: bool = True, intermediates: bool = False):
+    '''
+    Walk below path without ever querying a node twice
+
+    depth        : levels to walk, 1 only returns the children, None walks everything
+    typ          : only yield these node types (and derived types), traversal still goes through the others
+    breadthFirst : level by level instead of depth first
+    shapes       : also yield shapes
+    intermediates: also yield intermediate shapes
+    '''
+    typeNames = omUtils.derivedTypes(typ)
+    children  = [(child, 1) for child in iterChildPaths(path, shapes, True, intermediates)]
+    pending   = deque(children if breadthFirst else reversed(children))
+    while pending:
+        current, level = pending.popleft() if breadthFirst else pending.pop()
+        if depth is None or level < depth:
+            children = [(child, level + 1) for child in iterChildPaths(current, shapes, True, intermediates)]
+            '''
+            Depth first pops from the right, push reversed to keep the children in order
+            '''
+            pending.extend(children if breadthFirst else reversed(children))
+
+        if typeNames is None or om2.MFnDagNode(current).typeName in typeNames:
+            yield current
+
+def iterParentPaths(path: om2.MDagPath):
+    '''
+    Parents of path from the nearest up to the top level node, the world is not included
+    '''
+    parent = om2.MDagPath(path)
+    while parent.length() > 1:
+        parent.pop()
+        yield om2.MDagPath(parent)
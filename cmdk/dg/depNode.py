@@ -1,257 +1,419 @@
-import threading
-import weakref
-
-import maya.cmds as cmds
-import maya.api.OpenMaya as om2
-import cmdk.dg.omUtils as omUtils
-from cmdk.attr.attribute import Attribute
-
-class DepNode(object):
-    _NODETYPE = cmds.allNodeTypes()
-    _CACHE = weakref.WeakValueDictionary()
-    _LOCK = threading.Lock()
-    
-    def __new__(cls, *args, **kwargs) -> 'self':
-    
-        nodeType = kwargs.get('nodeType', args[0] if args else None)
-        if nodeType and nodeType not in cls._NODETYPE:
-            raise TypeError('Not a Maya node type')
-            
-        nodeName = kwargs.get('nodeName', args[1] if len(args) > 1 else None)
-        '''
-        if not isinstance(nodeName, str) or len(nodeName) == 0:
-            raise TypeError('The nodeName must be a non-empty string')
-        '''
-
-        if nodeType is None:
-            uuid = omUtils.getUUID(nodeName)
-            with cls._LOCK:
-                if omUtils.UUIDExists(uuid) and uuid in cls._CACHE:
-                    return cls._CACHE[uuid]
-        
-        instance = super().__new__(cls) 
-        instance.__dict__['_initAttrs'] = False
-        return instance
-    
-    @classmethod
-    def clearCache(cls):
-        with cls._LOCK:
-            cls._CACHE.clear()
-            
-    @classmethod
-    def removeFromCache(cls, uuid):
-        with cls._LOCK:
-            if uuid in cls._CACHE:
-                del cls._CACHE[uuid]
-                
-    @classmethod
-    def getCache(cls):
-        with cls._LOCK:
-            return {uuid: node for uuid, node in cls._CACHE.items()}
-                
-    def __init__(self, nodeType :str = '', nodeName :str = ''):
-        if hasattr(self, '_init') and self._init:
-            return
-            
-        self._check(nodeName)
-        if not self.has and nodeType:
-            self._create(nodeType, nodeName)
-        
-        if self._apiNode:
-            self._instanceUUID = self.uuid
-            '''
-            Add to cache dict to help implement the singleton pattern
-            '''
-            with DepNode._LOCK:
-                DepNode._CACHE[self._instanceUUID] = self
-        
-        '''
-        Avoid repeated initialization
-        '''    
-        self._init = True; self._initAttrs = True
-         
-                
-    def __repr__(self) -> str:
-        try:
-            return "<{0} {1} '{2}'>".format(self.__class__.__name__, self.type, 
-                                     omUtils.getNodeNameFromUUID(self._instanceUUID))
-        except Exception:
-            '''
-            Once I add error handling, unexpected situations may occur!!
-            For example, when deleting an object, running the repr method on the instance will trigger an error.
-            if I undo the operation and run repr again, everything returns to normal
-            '''
-            return 'Invalid Object'
-            
-            
-    def __str__(self) -> str:
-        fullPath = self.fullPath
-        return '<Null>' if fullPath is None else fullPath
-            
-            
-    def __eq__(self, other):
-        if isinstance(other, self.__class__):
-            return self.fullPath == other.fullPath
-        elif self.fullPath == other:
-            return True
-        elif self.path == other:
-            return True
-        else:
-            return False
-    
-    def _check(self, nodeName: str):
-        self._apiNode = omUtils.toMDagPathOrDepNode(nodeName) if cmds.objExists(nodeName) else False
-    
-    def _create(self, nodeType: str, nodeName: str):
-        node = omUtils.createNode(nodeType, nodeName)
-        self._check(node)
-        
-    @property
-    def apiNode(self) -> om2.MFnDependencyNode:
-        if self._apiNode is None and omUtils.UUIDExists(self._instanceUUID):
-            nodeName = omUtils.getNodeNameFromUUID(self._instanceUUID)
-            self._apiNode = omUtils.toMDagPathOrDepNode(nodeName)
-                
-        return self._apiNode
-        
-    @property    
-    def has(self) -> bool:
-        return self.fullPath and cmds.objExists(self.fullPath)
-        
-    def hasAttr(self, attr: str) -> bool:
-        return cmds.objExists('{}.{}'.format(self.fullPath, attr))
-        
-    # -----------------------------------------------------------
-    
-    def __getattr__(self, attr):
-        if attr == '_init':
-            raise AttributeError
-            
-        '''
-        When calling the delete() method, self._apiNode is None
-        so when dynamically generating attribute classes
-        we should check whether the object has been deleted to avoid recursion
-        '''
-        try:
-            return Attribute(self, attr) if self.fullPath else None
-        except RecursionError:
-            return 
-
-    def __setattr__(self, attr, value):
-        '''
-        Note: Do not use self.__dict__.get(attr) is None to check if an attribute is an instance attribute,
-        because calling get will trigger the __getattr__ method again, causing infinite recursion !!!
-        '''
-        if self._initAttrs and attr not in self.__dict__:
-            getattr(self, attr).set(value)
-        else:
-            object.__setattr__(self, attr, value)
-            
-    def __getitem__(self, attr):
-        if attr not in self.__dict__:
-            return self.__getattr__(attr)
-        return self.__dict__.get(attr)
-
-    def __setitem__(self, attr, value):
-        self.__setattr__(attr, value)
-
-    # -----------------------------------------------------------
-    @property
-    def path(self) -> str | None:
-        return (None 
-                if self.fullPath is None 
-                else 
-                self.fullPath.split('|')[-1])
-                
-    @property
-    def fullPath(self) -> str | None:
-        if self.apiNode:
-            return (self._apiNode.fullPathName() 
-                    if isinstance(self._apiNode, om2.MDagPath) 
-                    else self._apiNode.name())        
-        return None
-            
-    @property
-    def name(self) -> str | None:
-        return self.fullPath.split('|')[-1].split(':')[-1]
-        
-    @property
-    def namespace(self) -> str | None:
-        return self.fullPath.split('|')[-1].rpartition(':')[0]
-    
-    @property
-    def type(self) -> str:
-        return cmds.objectType(self.fullPath) if self.has else 'No Type'
-    
-    @property    
-    def uuid(self) -> str:
-        return omUtils.getUUID(self.fullPath)
-        
-    def rename(self, newName: str) -> 'self':
-        cmds.rename(self.fullPath, newName)
-        return self
-        
-    def lock(self, state=True) -> 'self':
-        cmds.lockNode(self.fullPath, lock=state)
-        return self
-        
-    def select(self, **kwargs) -> 'self':
-        cmds.select(self.fullPath, **kwargs)
-        return self
-    
-    @property
-    def isLocked(self) -> bool:
-        return cmds.lockNode(self.fullPath, query=True, lock=True)[0]
-        
-    def delete(self):
-        '''
-        Lock connected nodes when deleting a node to prevent accidental deletion
-        '''
-        nodes = self.connections()
-        if not nodes: 
-            self.lock(False); cmds.delete(self.fullPath)
-        else:
-            nodeLockStates = [node.isLocked for node in nodes] 
-            for node in nodes: node.lock()
-            # ------------------------------
-            self.lock(False); cmds.delete(self.fullPath)
-            # ------------------------------
-            for node, states in zip(nodes, nodeLockStates): 
-                node.lock(states)
-        self._apiNode = None 
-        
-    # -------------------------------------------------------------------------------------------
-
-    def listAttr(self, **kwargs) -> list[Attribute]:
-        return [Attribute(self, attr) for attr in cmds.listAttr(self.fullPath, **kwargs) or []]
-                
-    def addAttr(self, attrName='', **kwargs) -> Attribute:
-        cmds.addAttr(self.fullPath, ln=attrName, **kwargs)
-        return Attribute(self, attrName)
-    
-    def connections(self, **kwargs) -> list['self'] | None:
-        from cmdk.dag.dagNode import DagNode
-        '''
-        Why use snc=True? 
-        This will avoid returning unitConversion nodes
-        as calling the delete() method will automatically delete them
-        '''
-        nodes = cmds.listConnections(self.fullPath, scn=True, **kwargs) or []
-        if not nodes: return
-        return [DagNode(nodeName=node) if omUtils.isDagNode(node) else DepNode(nodeName=node) for node in nodes]
-
-if __name__ == '__main__':   
-    # create node
-    meta = DepNode('network', 'test')
-    str(meta)
-    meta.delete()
-    
-    meta2 = DepNode('network')
-    meta2.rename('kdd')
-    # add node
-    joint = DepNode(nodeName='joint1')
-    joint.connections()
-    
-    # --------------------------------
-    node = DepNode(nodeName='metaRoot')
-    node.hasAttr('parent')
+import threading
+import weakref
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om2
+import cmdk.dg.omUtils as omUtils
+from cmdk.dg.nameState import NameState
+from cmdk.dg.nodeTypes import registry
+from cmdk.attr.attribute import Attribute
+from cmdk.attr.plugCache import PlugCache
+
+class DepNode(object):
+    _CACHE = weakref.WeakValueDictionary()
+    _LOCK = threading.Lock()
+    '''
+    Set by nodeEvents.NodeCacheInvalidator while scene messages keep the cache in sync
+    _GENERATION is bumped by every event that can change DAG paths
+    '''
+    _TRACKER    = None
+    _GENERATION = 0
+    
+    def __new__(cls, *args, **kwargs) -> 'self':
+    
+        nodeType = kwargs.get('nodeType', args[0] if args else None)
+        if nodeType and not registry.exists(nodeType):
+            raise TypeError('Not a Maya node type')
+            
+        nodeName = kwargs.get('nodeName', args[1] if len(args) > 1 else None)
+        '''
+        if not isinstance(nodeName, str) or len(nodeName) == 0:
+            raise TypeError('The nodeName must be a non-empty string')
+        '''
+
+        mobj = None
+        if not nodeType:
+            '''
+            One selection list lookup, then the handle hash code is the cache key
+            no UUID string is built for nodes that are already wrapped
+            '''
+            mobj = omUtils.findMObject(nodeName)
+            if mobj is not None:
+                node = cls.fromCache(om2.MObjectHandle(mobj))
+                if node is not None:
+                    return node
+        
+        instance = super().__new__(cls) 
+        instance.__dict__['_initAttrs'] = False
+        instance.__dict__['_mobject']   = mobj
+        return instance
+    
+    @classmethod
+    def _lookup(cls, handle: om2.MObjectHandle) -> 'DepNode | None':
+        with cls._LOCK:
+            node = cls._CACHE.get(handle.hashCode())
+        if node is None or node._handle is None or node._handle != handle:
+            return None
+        return node
+    
+    @classmethod
+    def fromCache(cls, handle: om2.MObjectHandle) -> 'DepNode | None':
+        '''
+        Return the cached wrapper of a live node, or None
+        '''
+        node = cls._lookup(handle)
+        if node is None or not node._handle.isValid():
+            return None
+        return node
+    
+    @classmethod
+    def refreshPaths(cls):
+        '''
+        Drop every memoized path, they are rebuilt on next access
+        '''
+        cls._GENERATION += 1
+    
+    @classmethod
+    def clearCache(cls):
+        with cls._LOCK:
+            cls._CACHE.clear()
+            
+    @classmethod
+    def removeFromCache(cls, uuid):
+        with cls._LOCK:
+            for key, node in list(cls._CACHE.items()):
+                if node._instanceUUID == uuid:
+                    del cls._CACHE[key]
+                
+    @classmethod
+    def getCache(cls):
+        '''
+        The cache is keyed by MObjectHandle hash codes, 
+        this UUID keyed dict is only a view built for compatibility
+        '''
+        with cls._LOCK:
+            return {node._instanceUUID: node for node in cls._CACHE.values()}
+                
+    def __init__(self, nodeType :str = '', nodeName :str = ''):
+        if hasattr(self, '_init') and self._init:
+            return
+            
+        mobj = self.__dict__.pop('_mobject', None)
+        self._nameState = None; self._pathGeneration = -1; self._typeName = None
+        self._plugCache = PlugCache(); self._schemas = {}
+        self._check(mobj if mobj is not None and isinstance(nodeName, str) else nodeName)
+        if not self._apiNode and nodeType:
+            self._create(nodeType, nodeName)
+        
+        if self._apiNode:
+            self._instanceUUID = self.uuid
+            '''
+            Add to cache dict to help implement the singleton pattern
+            '''
+            with DepNode._LOCK:
+                DepNode._CACHE[self._handle.hashCode()] = self
+        
+        '''
+        Avoid repeated initialization
+        '''    
+        self._init = True; self._initAttrs = True
+         
+                
+    def __repr__(self) -> str:
+        '''
+        Built from the cached type and names, the handle tells whether the node still exists
+        For example, after deleting the object this returns 'Invalid Object',
+        after undoing the delete the handle is valid again and so is the repr
+        '''
+        if not self._isValid:
+            return 'Invalid Object'
+        return "<{0} {1} '{2}'>".format(self.__class__.__name__, self.type, self.partialPath)
+            
+            
+    def __str__(self) -> str:
+        fullPath = self.fullPath
+        return '<Null>' if fullPath is None else fullPath
+            
+            
+    def __eq__(self, other):
+        if isinstance(other, self.__class__):
+            return self.fullPath == other.fullPath
+        elif self.fullPath == other:
+            return True
+        elif self.path == other:
+            return True
+        else:
+            return False
+    
+    def _check(self, node: str | om2.MObject | om2.MDagPath):
+        mobj = omUtils.findMObject(node)
+        self._handle = None if mobj is None else om2.MObjectHandle(mobj)
+        if mobj is None:
+            self._apiNode = False
+        elif isinstance(node, om2.MDagPath):
+            self._apiNode = om2.MDagPath(node)
+        else:
+            self._apiNode = omUtils.toMDagPathOrDepNode(mobj)
+    
+    def _create(self, nodeType: str, nodeName: str):
+        node = omUtils.createNode(nodeType, nodeName)
+        self._check(node)
+        
+    def _invalidate(self):
+        '''
+        The node was removed from the scene
+        '''
+        self._apiNode = None; self._pathGeneration = -1
+        self._plugCache.clear(); self._schemas.clear()
+        
+    def _refresh(self):
+        self._pathGeneration = -1
+        
+    def refresh(self) -> 'self':
+        '''
+        Drop the memoized names, they are rebuilt on next access
+        '''
+        self._dropStalePath()
+        self._nameState = None; self._pathGeneration = -1
+        return self
+        
+    @property
+    def apiNode(self) -> om2.MFnDependencyNode:
+        if self._handle is None:
+            return self._apiNode
+        
+        if not self._handle.isValid():
+            self._apiNode = None
+        elif self._apiNode is None:
+            self._apiNode = omUtils.toMDagPathOrDepNode(self._handle.object())
+                
+        return self._apiNode
+        
+    @property
+    def _isValid(self) -> bool:
+        return self._handle is not None and self._handle.isValid()
+        
+    @property    
+    def has(self) -> bool:
+        if DepNode._TRACKER is not None:
+            return self._isValid
+        return self.fullPath and cmds.objExists(self.fullPath)
+        
+    def hasAttr(self, attr: str) -> bool:
+        return cmds.objExists('{}.{}'.format(self.fullPath, attr))
+        
+    # -----------------------------------------------------------
+    
+    def __getattr__(self, attr):
+        if attr.startswith('_'):
+            '''
+            Private state is never a Maya attribute
+            '''
+            raise AttributeError(attr)
+            
+        '''
+        When calling the delete() method, self._apiNode is None
+        so when dynamically generating attribute classes
+        we should check whether the object has been deleted to avoid recursion
+        '''
+        try:
+            return Attribute(self, attr) if self.fullPath else None
+        except RecursionError:
+            return 
+
+    def __setattr__(self, attr, value):
+        '''
+        Note: Do not use self.__dict__.get(attr) is None to check if an attribute is an instance attribute,
+        because calling get will trigger the __getattr__ method again, causing infinite recursion !!!
+        '''
+        if self._initAttrs and attr not in self.__dict__ and not attr.startswith('_'):
+            getattr(self, attr).set(value)
+        else:
+            object.__setattr__(self, attr, value)
+            
+    def __getitem__(self, attr):
+        if attr not in self.__dict__:
+            return self.__getattr__(attr)
+        return self.__dict__.get(attr)
+
+    def __setitem__(self, attr, value):
+        self.__setattr__(attr, value)
+
+    # -----------------------------------------------------------
+    @property
+    def path(self) -> str | None:
+        state = self._names()
+        return None if state is None else state.path
+                
+    @property
+    def fullPath(self) -> str | None:
+        state = self._names()
+        return None if state is None else state.fullPath
+        
+    def _names(self) -> NameState | None:
+        '''
+        While scene events are tracked the state is only rebuilt after a rename or reparent,
+        otherwise the path is queried and only split again when it changed
+        '''
+        if DepNode._TRACKER is not None:
+            if self._pathGeneration == DepNode._GENERATION:
+                NameState.STATS['hits'] += 1
+                return self._nameState
+            self._dropStalePath()
+            
+        self._nameState = NameState.update(self._nameState, self._queryFullPath())
+        self._pathGeneration = DepNode._GENERATION
+        return self._nameState
+        
+    def _dropStalePath(self):
+        '''
+        A rename keeps the stored MDagPath valid and fullPathName() follows it, so an instance stays on its own path
+        Only a path a reparent broke is dropped and resolved again from the handle
+        '''
+        if isinstance(self._apiNode, om2.MDagPath) and not self._apiNode.isValid():
+            self._apiNode = None
+        
+    def _queryFullPath(self) -> str | None:
+        if self.apiNode:
+            return (self._apiNode.fullPathName() 
+                    if isinstance(self._apiNode, om2.MDagPath) 
+                    else self._apiNode.name())        
+        return None
+            
+    @property
+    def name(self) -> str | None:
+        state = self._names()
+        return None if state is None else state.name
+        
+    @property
+    def namespace(self) -> str | None:
+        state = self._names()
+        return None if state is None else state.namespace
+        
+    @property
+    def partialPath(self) -> str | None:
+        '''
+        Shortest unique name, what cmds.ls returns by default
+        Not memoized, adding or renaming any other node can make it ambiguous without this path changing
+        '''
+        state = self._names()
+        if state is None:
+            return None
+        apiNode = self.apiNode
+        return apiNode.partialPathName() if isinstance(apiNode, om2.MDagPath) else state.fullPath
+    
+    @property
+    def type(self) -> str:
+        '''
+        A node never changes type, it is read once from the API
+        '''
+        if not self._isValid:
+            return 'No Type'
+        if self._typeName is None:
+            self._typeName = om2.MFnDependencyNode(self._handle.object()).typeName
+        return self._typeName
+        
+    @property
+    def inheritedTypes(self) -> tuple:
+        '''
+        Type names from the base type down to the node's own type
+        '''
+        return registry.inherited(self.type) if self._isValid else ()
+        
+    def isA(self, fnType: int) -> bool:
+        '''
+        om2.MFn classification, cached per node type
+        '''
+        return self._isValid and registry.hasFn(self.type, fnType, self._handle.object())
+        
+    @property
+    def isDag(self) -> bool:
+        return self.isA(om2.MFn.kDagNode)
+        
+    @property
+    def isTransform(self) -> bool:
+        return self.isA(om2.MFn.kTransform)
+        
+    @property
+    def isShape(self) -> bool:
+        return self.isA(om2.MFn.kShape)
+        
+    @property
+    def isJoint(self) -> bool:
+        return self.isA(om2.MFn.kJoint)
+    
+    @property    
+    def uuid(self) -> str:
+        return omUtils.getUUID(self.fullPath)
+        
+    def rename(self, newName: str) -> 'self':
+        cmds.rename(self.fullPath, newName)
+        return self.refresh()
+        
+    def lock(self, state=True) -> 'self':
+        cmds.lockNode(self.fullPath, lock=state)
+        return self
+        
+    def select(self, **kwargs) -> 'self':
+        cmds.select(self.fullPath, **kwargs)
+        return self
+    
+    @property
+    def isLocked(self) -> bool:
+        return cmds.lockNode(self.fullPath, query=True, lock=True)[0]
+        
+    def delete(self):
+        '''
+        Lock connected nodes when deleting a node to prevent accidental deletion
+        DAG nodes are deleted with their whole hierarchy, all in one undo step
+        '''
+        from cmdk.dag.deleter import deleteNodes
+        deleteNodes(self)
+        self._apiNode = None 
+        
+    # -------------------------------------------------------------------------------------------
+
+    def listAttr(self, **kwargs) -> list[Attribute]:
+        return [Attribute(self, attr) for attr in cmds.listAttr(self.fullPath, **kwargs) or []]
+                
+    def getAttrs(self, names: list, asArray: bool = False) -> dict:
+        '''
+        Read many attributes in one pass, {name: value}
+        asArray=True returns a float array of shape (len(names),) for numeric scalar attributes
+        '''
+        import cmdk.attr.attrReader as attrReader
+        if asArray:
+            return attrReader.readArray([self], names)[0]
+        return attrReader.readValues(self, names)
+        
+    def addAttr(self, attrName='', **kwargs) -> Attribute:
+        cmds.addAttr(self.fullPath, ln=attrName, **kwargs)
+        self._plugCache.discard(attrName); self._schemas.clear()
+        return Attribute(self, attrName)
+    
+    def connections(self, **kwargs) -> list['self'] | None:
+        from cmdk.dg.resolver import wrapNames
+        '''
+        Why use snc=True? 
+        This will avoid returning unitConversion nodes
+        as calling the delete() method will automatically delete them
+        '''
+        nodes = cmds.listConnections(self.fullPath, scn=True, **kwargs) or []
+        if not nodes: return
+        return wrapNames(nodes)
+
+if __name__ == '__main__':   
+    # create node
+    meta = DepNode('network', 'test')
+    str(meta)
+    meta.delete()
+    
+    meta2 = DepNode('network')
+    meta2.rename('kdd')
+    # add node
+    joint = DepNode(nodeName='joint1')
+    joint.connections()
+    
+    # --------------------------------
+    node = DepNode(nodeName='metaRoot')
+    node.hasAttr('parent')
@@ -0,0 +1,44 @@
+class NameState(object):
+    '''
+    Full path, short path, leaf name and namespace of a node, split once per full path
+
+    STATS counts how the names were served:
+        hits     : memoized state returned without asking Maya for the path
+        reused   : the path was queried but had not changed, nothing was split again
+        computed : a new state was built
+    '''
+    __slots__ = ('fullPath', 'path', 'name', 'namespace')
+    STATS = {'hits': 0, 'reused': 0, 'computed': 0}
+
+    def __init__(self, fullPath: str):
+        self.fullPath = fullPath
+        self.path     = fullPath.split('|')[-1]
+        self.namespace, _, self.name = self.path.rpartition(':')
+
+    def __repr__(self):
+        return "NameState('{}')".format(self.fullPath)
+
+    @classmethod
+    def update(cls, state: 'NameState | None', fullPath: str | None) -> 'NameState | None':
+        '''
+        Keep state when the path is unchanged, otherwise split the new one
+        '''
+        if not fullPath:
+            return None
+        if state is not None and state.fullPath == fullPath:
+            cls.STATS['reused'] += 1
+            return state
+        cls.STATS['computed'] += 1
+        return cls(fullPath)
+
+    @classmethod
+    def avoided(cls) -> int:
+        '''
+        Number of recomputations the memo saved
+        '''
+        return cls.STATS['hits'] + cls.STATS['reused']
+
+    @classmethod
+    def resetStats(cls):
+        for key in cls.STATS:
+            cls.STATS[key] = 0
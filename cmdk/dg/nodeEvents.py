@@ -0,0 +1,172 @@
+import maya.api.OpenMaya as om2
+from cmdk.dg.depNode import DepNode
+from cmdk.dg.nodeTypes import registry
+import cmdk.attr.schema as schema
+
+
+class EventBus(object):
+    '''
+    In-process event source, subscribers are called in order every time an event is emitted
+    Drive one by hand to fake the Maya message bus
+
+    Events and their arguments:
+        nodeAdded     (mobj)
+        nodeRemoved   (mobj)
+        nameChanged   (mobj, prevName)
+        parentChanged (childPath, parentPath)
+        sceneReset    ()
+        pluginChanged ()
+    '''
+    EVENTS = ('nodeAdded', 'nodeRemoved', 'nameChanged', 'parentChanged', 'sceneReset', 'pluginChanged')
+
+    def __init__(self):
+        self._subscribers = {event: [] for event in self.EVENTS}
+
+    def subscribe(self, event: str, callback) -> tuple:
+        if event not in self._subscribers:
+            raise ValueError('Unknown event: {}'.format(event))
+        self._subscribers[event].append(callback)
+        return event, callback
+
+    def unsubscribe(self, token: tuple):
+        event, callback = token
+        if callback in self._subscribers.get(event, []):
+            self._subscribers[event].remove(callback)
+
+    @property
+    def hasSubscribers(self) -> bool:
+        return any(self._subscribers.values())
+
+    def emit(self, event: str, *args):
+        for callback in list(self._subscribers[event]):
+            callback(*args)
+
+
+class MayaEventSource(EventBus):
+    '''
+    Forwards Maya API messages to the bus
+    The API callbacks only live while something is subscribed
+    '''
+    def __init__(self):
+        super().__init__()
+        self._callbackIds = []
+
+    def subscribe(self, event: str, callback) -> tuple:
+        token = super().subscribe(event, callback)
+        if not self._callbackIds:
+            self._install()
+        return token
+
+    def unsubscribe(self, token: tuple):
+        super().unsubscribe(token)
+        if not self.hasSubscribers:
+            self._uninstall()
+
+    def _install(self):
+        self._callbackIds = [
+            om2.MDGMessage.addNodeAddedCallback(self._onNodeAdded, 'dependNode'),
+            om2.MDGMessage.addNodeRemovedCallback(self._onNodeRemoved, 'dependNode'),
+            om2.MNodeMessage.addNameChangedCallback(om2.MObject.kNullObj, self._onNameChanged),
+            om2.MDagMessage.addParentAddedCallback(self._onParentChanged),
+            om2.MDagMessage.addParentRemovedCallback(self._onParentChanged),
+            om2.MSceneMessage.addCallback(om2.MSceneMessage.kAfterNew, self._onSceneReset),
+            om2.MSceneMessage.addCallback(om2.MSceneMessage.kAfterOpen, self._onSceneReset),
+            om2.MSceneMessage.addStringArrayCallback(om2.MSceneMessage.kAfterPluginLoad, self._onPluginChanged),
+            om2.MSceneMessage.addStringArrayCallback(om2.MSceneMessage.kAfterPluginUnload, self._onPluginChanged)]
+
+    def _uninstall(self):
+        if self._callbackIds:
+            om2.MMessage.removeCallbacks(self._callbackIds)
+        self._callbackIds = []
+
+    # maya callbacks ------------------------------------------------------
+    def _onNodeAdded(self, mobj, *args):
+        self.emit('nodeAdded', mobj)
+
+    def _onNodeRemoved(self, mobj, *args):
+        self.emit('nodeRemoved', mobj)
+
+    def _onNameChanged(self, mobj, prevName, *args):
+        self.emit('nameChanged', mobj, prevName)
+
+    def _onParentChanged(self, childPath, parentPath, *args):
+        self.emit('parentChanged', childPath, parentPath)
+
+    def _onSceneReset(self, *args):
+        self.emit('sceneReset')
+
+    def _onPluginChanged(self, *args):
+        self.emit('pluginChanged')
+
+
+class NodeCacheInvalidator(object):
+    '''
+    Keeps the DepNode cache in step with the scene
+    While enabled, fullPath is memoized and has is answered from the MObjectHandle
+    '''
+    def __init__(self, source: EventBus = None):
+        self.source  = MayaEventSource() if source is None else source
+        self._tokens = []
+
+    @property
+    def isEnabled(self) -> bool:
+        return bool(self._tokens)
+
+    def enable(self) -> 'self':
+        if self.isEnabled:
+            return self
+        handlers = {'nodeAdded'    : self.onNodeAdded,
+                    'nodeRemoved'  : self.onNodeRemoved,
+                    'nameChanged'  : self.onNameChanged,
+                    'parentChanged': self.onParentChanged,
+                    'sceneReset'   : self.onSceneReset,
+                    'pluginChanged': self.onPluginChanged}
+        self._tokens = [self.source.subscribe(event, handler) for event, handler in handlers.items()]
+        DepNode._TRACKER = self
+        DepNode.refreshPaths()
+        return self
+
+    def disable(self):
+        for token in self._tokens:
+            self.source.unsubscribe(token)
+        self._tokens = []
+        if DepNode._TRACKER is self:
+            DepNode._TRACKER = None
+
+    # handlers ---------------------------------------------------------------
+    def onNodeAdded(self, mobj: om2.MObject):
+        '''
+        Undoing a delete brings back the same MObject, refresh its wrapper
+        '''
+        node = DepNode._lookup(om2.MObjectHandle(mobj))
+        if node is not None:
+            node._refresh()
+
+    def onNodeRemoved(self, mobj: om2.MObject):
+        node = DepNode._lookup(om2.MObjectHandle(mobj))
+        if node is not None:
+            node._invalidate()
+
+    def onNameChanged(self, mobj: om2.MObject, prevName: str = ''):
+        '''
+        Renaming a DAG node changes the paths of all its descendants
+        '''
+        if mobj.hasFn(om2.MFn.kDagNode):
+            DepNode.refreshPaths()
+            return
+        node = DepNode._lookup(om2.MObjectHandle(mobj))
+        if node is not None:
+            node._refresh()
+
+    def onParentChanged(self, childPath: om2.MDagPath = None, parentPath: om2.MDagPath = None):
+        DepNode.refreshPaths()
+
+    def onSceneReset(self):
+        DepNode.clearCache()
+        DepNode.refreshPaths()
+
+    def onPluginChanged(self):
+        '''
+        Plug-ins add and remove node types and their attributes
+        '''
+        registry.refresh(); schema.clear()
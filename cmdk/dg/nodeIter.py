@@ -0,0 +1,70 @@
+import maya.api.OpenMaya as om2
+import cmdk.dg.omUtils as omUtils
+from cmdk.dg.resolver import wrapNode
+
+
+def iterNodes(type: str | list = None, dag: bool = False, selection: bool = False,
+              namespace: str = None, chunkSize: int = 0):
+    '''
+    Walk the scene lazily, the filters run on API objects before any wrapper is built
+
+    type      : node type name or names, derived types match as they do in cmds.ls(type=...)
+    dag       : only DAG nodes, walked with MItDag
+    selection : only the active selection
+    namespace : only nodes directly inside this namespace, '' is the root namespace
+    chunkSize : yield lists of up to chunkSize wrappers instead of one wrapper at a time
+    '''
+    typeNames = omUtils.derivedTypes(type)
+    if namespace is not None:
+        namespace = namespace.strip(':')
+
+    nodes = (wrapNode(node) for node in _iterObjects(dag, selection)
+             if _accept(node, typeNames, namespace))
+    if chunkSize <= 0:
+        yield from nodes
+        return
+
+    chunk = []
+    for node in nodes:
+        chunk.append(node)
+        if len(chunk) >= chunkSize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def _iterObjects(dag: bool, selection: bool):
+    '''
+    yield an MDagPath for DAG nodes and an MObject for everything else
+    '''
+    if selection:
+        it = om2.MItSelectionList(om2.MGlobal.getActiveSelectionList())
+        while not it.isDone():
+            if it.itemType() == om2.MItSelectionList.kDagSelectionItem:
+                yield it.getDagPath()
+            elif not dag:
+                yield it.getDependNode()
+            it.next()
+    elif dag:
+        it = om2.MItDag()
+        while not it.isDone():
+            path = it.getPath()
+            if path.length():  # skip the world
+                yield path
+            it.next()
+    else:
+        it = om2.MItDependencyNodes()
+        while not it.isDone():
+            mobj = it.thisNode()
+            yield om2.MDagPath.getAPathTo(mobj) if mobj.hasFn(om2.MFn.kDagNode) else mobj
+            it.next()
+
+def _accept(node: om2.MObject | om2.MDagPath, typeNames: set | None, namespace: str | None) -> bool:
+    if typeNames is None and namespace is None:
+        return True
+    fn = om2.MFnDependencyNode(node.node() if isinstance(node, om2.MDagPath) else node)
+    if typeNames is not None and fn.typeName not in typeNames:
+        return False
+    if namespace is not None and fn.name().rpartition(':')[0] != namespace:
+        return False
+    return True
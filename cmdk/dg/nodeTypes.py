@@ -0,0 +1,65 @@
+import maya.cmds as cmds
+import maya.api.OpenMaya as om2
+
+
+class NodeTypeRegistry(object):
+    '''
+    Hashed, lazily built view of the node types Maya knows
+    Nothing is queried until the first lookup, refresh() drops everything after plug-ins change
+    '''
+    def __init__(self):
+        self._types     = None
+        self._inherited = {}
+        self._derived   = {}
+        self._fnTypes   = {}
+
+    @property
+    def types(self) -> frozenset:
+        if self._types is None:
+            self._types = frozenset(cmds.allNodeTypes())
+        return self._types
+
+    def refresh(self):
+        self._types = None
+        self._inherited.clear(); self._derived.clear(); self._fnTypes.clear()
+
+    def exists(self, typeName: str) -> bool:
+        '''
+        A miss queries the type set again, a plug-in may have been loaded since it was built
+        Only the set is rebuilt, the inheritance and MFn caches of the known types stay
+        '''
+        if typeName in self.types:
+            return True
+        self._types = None
+        return typeName in self.types
+
+    def inherited(self, typeName: str) -> tuple:
+        '''
+        Inheritance chain from the base type down to typeName
+        '''
+        if typeName not in self._inherited:
+            self._inherited[typeName] = tuple(cmds.nodeType(typeName, inherited=True, isTypeName=True) or [typeName])
+        return self._inherited[typeName]
+
+    def derived(self, typeName: str) -> frozenset:
+        '''
+        typeName and every type derived from it
+        '''
+        if typeName not in self._derived:
+            self._derived[typeName] = frozenset(cmds.nodeType(typeName, derived=True, isTypeName=True) or [typeName])
+        return self._derived[typeName]
+
+    def isA(self, typeName: str, baseType: str) -> bool:
+        return baseType in self.inherited(typeName)
+
+    def hasFn(self, typeName: str, fnType: int, mobj: om2.MObject) -> bool:
+        '''
+        MFn classification, asked once per node type and answered from the cache afterwards
+        '''
+        key = (typeName, fnType)
+        if key not in self._fnTypes:
+            self._fnTypes[key] = mobj.hasFn(fnType)
+        return self._fnTypes[key]
+
+
+registry = NodeTypeRegistry()
@@ -1,81 +1,145 @@
-import maya.cmds as cmds
-import maya.api.OpenMaya as om2
-
-
-def toMObject(nodeName: str) -> om2.MObject:
-    '''
-    create mobject
-    '''
-    return om2.MGlobal.getSelectionListByName(nodeName).getDependNode(0)
-
-def toDependencyNode(nodeName: str) -> om2.MFnDependencyNode:
-    '''
-    Convert a node ito an OpenMaya Dependency Node
-    '''
-    return om2.MFnDependencyNode(toMObject(nodeName)) 
-
-def toMDagPath(nodeName: str) -> om2.MDagPath | None:
-    ''' 
-    Convert a node ito an OpenMaya Dag Node
-    '''
-    return om2.MDagPath.getAPathTo(toMObject(nodeName)) 
-    
-
-def toMDagPathOrDepNode(node: str | om2.MObject) -> om2.MDagPath | om2.MFnDependencyNode:
-    '''
-    create dagNode or dgNode
-    '''
-    mobj = toMObject(node) if isinstance(node, str) else node
-    return om2.MDagPath.getAPathTo(mobj) if mobj.hasFn(om2.MFn.kDagNode) else om2.MFnDependencyNode(mobj)
-        
-def getUUID(nodeName: str) -> str | None:
-    '''
-    Get UUID value as string
-    '''
-    try:
-        return toDependencyNode(nodeName).uuid().asString()
-    except:
-        return None
-
-def getNodeNameFromUUID(uuid: str) -> str | None:
-    '''
-    uuid to node name
-    '''
-    try:
-        return cmds.ls(uuid)[0]
-    except:
-        return None
-    
-def UUIDExists(uuid: str | om2.MUuid) -> bool:
-    '''
-    Check if a given UUID string or MUuid object is valid
-    '''
-    if isinstance(uuid, str):
-        return om2.MUuid(uuid).valid()
-    elif isinstance(uuid, om2.MUuid):
-        return uuid.valid()
-    return False
-
-# ---------------------------------------
-def isStr(value):
-    return isinstance(value, str) and len(value) > 0
-    
-def createNode(nodeType, nodeName):
-    nodeArgs = {'n': nodeName} if isStr(nodeName) else {}
-    
-    if nodeType == 'locator':
-        return cmds.spaceLocator(**nodeArgs)[0]
-    return cmds.createNode(nodeType, **nodeArgs)
-    
-
-def isDagNode(nodeName: str) -> bool:
-    if toMObject(nodeName).hasFn(om2.MFn.kDagNode):
-        return True
-    return False
-
-        
-
-        
-
-        
-
+from contextlib import contextmanager
+import maya.cmds as cmds
+import maya.api.OpenMaya as om2
+import cmdk.attr.attrPath as attrPath
+
+
+def toMObject(nodeName: str) -> om2.MObject:
+    '''
+    create mobject
+    '''
+    return om2.MGlobal.getSelectionListByName(nodeName).getDependNode(0)
+
+def findMObject(node: str | om2.MObject | om2.MDagPath) -> om2.MObject | None:
+    '''
+    Resolve a node name, MObject or MDagPath to an MObject
+    Returns None instead of raising when the node does not exist
+    '''
+    if isinstance(node, om2.MObject):
+        return None if node.isNull() else node
+    if isinstance(node, om2.MDagPath):
+        return node.node()
+    if not isStr(node):
+        return None
+    try:
+        return toMObject(node)
+    except RuntimeError:
+        return None
+
+def getHashCode(mobj: om2.MObject | om2.MObjectHandle) -> int:
+    '''
+    Hash code of the node's MObjectHandle, used as the node identity key
+    '''
+    handle = mobj if isinstance(mobj, om2.MObjectHandle) else om2.MObjectHandle(mobj)
+    return handle.hashCode()
+
+def toDependencyNode(nodeName: str) -> om2.MFnDependencyNode:
+    '''
+    Convert a node ito an OpenMaya Dependency Node
+    '''
+    return om2.MFnDependencyNode(toMObject(nodeName)) 
+
+def toMDagPath(nodeName: str) -> om2.MDagPath | None:
+    ''' 
+    Convert a node ito an OpenMaya Dag Node
+    '''
+    return om2.MDagPath.getAPathTo(toMObject(nodeName)) 
+    
+
+def toMDagPathOrDepNode(node: str | om2.MObject) -> om2.MDagPath | om2.MFnDependencyNode:
+    '''
+    create dagNode or dgNode
+    '''
+    mobj = toMObject(node) if isinstance(node, str) else node
+    return om2.MDagPath.getAPathTo(mobj) if mobj.hasFn(om2.MFn.kDagNode) else om2.MFnDependencyNode(mobj)
+        
+def getUUID(nodeName: str) -> str | None:
+    '''
+    Get UUID value as string
+    '''
+    try:
+        return toDependencyNode(nodeName).uuid().asString()
+    except:
+        return None
+
+def getNodeNameFromUUID(uuid: str) -> str | None:
+    '''
+    uuid to node name
+    '''
+    try:
+        return cmds.ls(uuid)[0]
+    except:
+        return None
+    
+def UUIDExists(uuid: str | om2.MUuid) -> bool:
+    '''
+    Check if a given UUID string or MUuid object is valid
+    '''
+    if isinstance(uuid, str):
+        return om2.MUuid(uuid).valid()
+    elif isinstance(uuid, om2.MUuid):
+        return uuid.valid()
+    return False
+
+# ---------------------------------------
+def isStr(value):
+    return isinstance(value, str) and len(value) > 0
+    
+def createNode(nodeType, nodeName):
+    nodeArgs = {'n': nodeName} if isStr(nodeName) else {}
+    
+    if nodeType == 'locator':
+        return cmds.spaceLocator(**nodeArgs)[0]
+    return cmds.createNode(nodeType, **nodeArgs)
+    
+
+def findPlug(node: om2.MObject, nodePath: str, attr: str) -> om2.MPlug | None:
+    '''
+    Resolve 'attr', 'attr[0]' or 'attr[0].child' on a node, None when it does not exist
+    The compiled path is walked plug by plug, anything it cannot follow goes through a selection list
+    '''
+    plug = attrPath.walkPlug(node, attr)
+    if plug is not None or attrPath.isSimple(attr):
+        return plug
+    try:
+        return om2.MGlobal.getSelectionListByName('{}.{}'.format(nodePath, attr)).getPlug(0)
+    except (RuntimeError, TypeError):
+        return None
+
+def plugPath(plug: om2.MPlug) -> str:
+    '''
+    'node.attr[0].child' with the full DAG path, what cmds needs to find the plug again
+    '''
+    node = plug.node()
+    name = (om2.MDagPath.getAPathTo(node).fullPathName() if node.hasFn(om2.MFn.kDagNode) else
+            om2.MFnDependencyNode(node).name())
+    return '{}.{}'.format(name, plug.partialName(includeNonMandatoryIndices=True, useLongNames=True,
+                                                 useFullAttributePath=True))
+
+def isDagNode(node: str | om2.MObject) -> bool:
+    mobj = node if isinstance(node, om2.MObject) else toMObject(node)
+    if mobj.hasFn(om2.MFn.kDagNode):
+        return True
+    return False
+
+def derivedTypes(typ: str | list | tuple | None) -> set | None:
+    '''
+    Node type names plus every type derived from them, None when no type is given
+    '''
+    from cmdk.dg.nodeTypes import registry
+    if not typ:
+        return None
+    if isinstance(typ, str):
+        return registry.derived(typ)
+    return set().union(*(registry.derived(name) for name in typ))
+
+@contextmanager
+def undoChunk(name: str = 'cmdk'):
+    '''
+    Everything run inside is undone as one step
+    '''
+    cmds.undoInfo(openChunk=True, chunkName=name)
+    try:
+        yield
+    finally:
+        cmds.undoInfo(closeChunk=True)
@@ -1,13 +1,23 @@
-from importlib import reload
-import cmdk.dg.depNode as depNode
-import cmdk.dg.omUtils as omUtils
-
-
-
-def reloadIt():
-    reload(depNode)
-    reload(omUtils)
-
-
-
+from importlib import reload
+import cmdk.dg.depNode as depNode
+import cmdk.dg.omUtils as omUtils
+import cmdk.dg.nameState as nameState
+import cmdk.dg.nodeTypes as nodeTypes
+import cmdk.dg.nodeEvents as nodeEvents
+import cmdk.dg.resolver as resolver
+import cmdk.dg.nodeIter as nodeIter
+
+
+
+def reloadIt():
+    reload(nameState)
+    reload(nodeTypes)
+    reload(depNode)
+    reload(omUtils)
+    reload(nodeEvents)
+    reload(resolver)
+    reload(nodeIter)
+
+
+
     print('-------------------- DG RELOAD : OK')
\ No newline at end of file
@@ -0,0 +1,92 @@
+import maya.api.OpenMaya as om2
+from cmdk.dg.depNode import DepNode
+
+
+def resolveNodes(names: list | tuple) -> list[om2.MObject | om2.MDagPath | None]:
+    '''
+    Resolve many names through a single MSelectionList
+    DAG nodes come back as the MDagPath that was named, DG nodes as their MObject
+    missing names come back as None, the order of names is kept
+    '''
+    sel      = om2.MSelectionList()
+    indices  = {}
+    resolved = {}
+    for name in names:
+        if name in indices or name in resolved:
+            continue
+        count = sel.length()
+        try:
+            sel.add(name)
+        except (RuntimeError, TypeError):
+            resolved[name] = None
+            continue
+        '''
+        A second name for an object already in the list does not grow it,
+        resolve that one on its own
+        '''
+        if sel.length() > count:
+            indices[name] = count
+        else:
+            resolved[name] = _resolveOne(name)
+
+    for name, index in indices.items():
+        mobj = sel.getDependNode(index)
+        resolved[name] = sel.getDagPath(index) if mobj.hasFn(om2.MFn.kDagNode) else mobj
+    return [resolved[name] for name in names]
+
+def _resolveOne(name: str) -> om2.MObject | om2.MDagPath:
+    sel  = om2.MGlobal.getSelectionListByName(name)
+    mobj = sel.getDependNode(0)
+    return sel.getDagPath(0) if mobj.hasFn(om2.MFn.kDagNode) else mobj
+
+def wrapNode(node: om2.MObject | om2.MDagPath) -> DepNode:
+    '''
+    Build or fetch the wrapper of a resolved node without going back through its name
+    '''
+    from cmdk.dag.dagNode import DagNode
+    if isinstance(node, om2.MDagPath) or node.hasFn(om2.MFn.kDagNode):
+        return DagNode(nodeName=node)
+    return DepNode(nodeName=node)
+
+def wrapObjects(objects: list) -> list[DepNode]:
+    '''
+    Wrap many MObjects, a node that appears several times is looked up or built once
+    '''
+    wrapped, nodes = {}, []
+    for mobj in objects:
+        handle = om2.MObjectHandle(mobj)
+        entry  = wrapped.get(handle.hashCode())
+        if entry is None or entry[0] != handle:
+            entry = wrapped[handle.hashCode()] = (handle, DepNode.fromCache(handle) or wrapNode(mobj))
+        nodes.append(entry[1])
+    return nodes
+
+def connectedNodes(plug: om2.MPlug) -> list[DepNode]:
+    '''
+    Nodes connected to plug in either direction, read from the MPlug in one pass
+    the elements of a multi are walked in logical index order
+    '''
+    if plug.isArray:
+        elements = sorted((plug.elementByPhysicalIndex(index) for index in range(plug.evaluateNumElements())),
+                          key=lambda element: element.logicalIndex())
+    else:
+        elements = [plug]
+    return wrapObjects([other.node() for element in elements
+                        for other in (element.connectedTo(False, True) + element.connectedTo(True, False))])
+
+def connectedNode(plug: om2.MPlug) -> DepNode | None:
+    '''
+    The node plug drives, otherwise the node driving it
+    '''
+    plugs = plug.connectedTo(False, True) or plug.connectedTo(True, False)
+    return wrapObjects([plugs[0].node()])[0] if plugs else None
+
+def wrapNames(names: list | tuple) -> list[DepNode]:
+    '''
+    Wrap a list of node names, all missing names are reported in one error
+    '''
+    nodes   = resolveNodes(names)
+    missing = [name for name, node in zip(names, nodes) if node is None]
+    if missing:
+        raise ValueError('Contains one or more invalid objects: {}'.format(missing))
+    return [wrapNode(node) for node in nodes]
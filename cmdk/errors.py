@@ -0,0 +1,39 @@
+class CmdkError(Exception):
+    '''
+    Base of the errors cmdk raises itself, they also derive from the builtin error they replace
+    so existing except RuntimeError / except TypeError blocks keep working
+    '''
+
+
+class AttrSetError(CmdkError, RuntimeError):
+    '''
+    Maya refused the value, the attribute is connected, the node is locked or referenced
+    '''
+    def __init__(self, attr: str, message: str):
+        super().__init__('Cannot set {}: {}'.format(attr, message))
+        self.attr = attr
+
+
+class AttrValueError(AttrSetError, TypeError):
+    '''
+    The value or flags do not fit the attribute type
+    '''
+
+
+class AttrConnectError(CmdkError, RuntimeError):
+    '''
+    A connection Maya refused, mismatched types, a locked or unwritable destination
+    '''
+    def __init__(self, src: str, dst: str, message: str, action: str = 'connect'):
+        super().__init__('Cannot {} {} -> {}: {}'.format(action, src, dst, message))
+        self.src = src
+        self.dst = dst
+
+
+class AttrGroupError(CmdkError, RuntimeError):
+    '''
+    Every failure of a batch, reported together, errors holds the single errors
+    '''
+    def __init__(self, errors: list):
+        super().__init__('{} operations failed:\n{}'.format(len(errors), '\n'.join(str(error) for error in errors)))
+        self.errors = errors
@@ -0,0 +1,23 @@
+from cmdk.attr.kVector import KVector
+
+def vector(x=0, y=0, z=0):
+    return KVector(x, y, z)
+    
+def matrix(v1=KVector(1, 0, 0), v2=KVector(0, 1, 0), v3=KVector(0, 0, 1), off=KVector(0, 0, 0)):
+    from cmdk.attr.kMatrix import KMatrix
+    return KMatrix(v1, v2, v3, off)
+
+def vectorArray(values=(), copy: bool = True):
+    '''
+    (N, 3) vectors backed by numpy, values is an array-like of shape (N, 3) or a list of KVector
+    copy=False wraps an existing float64 array without copying it
+    '''
+    from cmdk.attr.kVectorArray import KVectorArray
+    return KVectorArray(values, copy)
+
+def matrixArray(values=(), copy: bool = True):
+    '''
+    (N, 4, 4) matrices backed by numpy, values is an array-like of shape (N, 4, 4) or (N, 16), or a list of KMatrix
+    '''
+    from cmdk.attr.kMatrixArray import KMatrixArray
+    return KMatrixArray(values, copy)